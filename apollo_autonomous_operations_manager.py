@@ -5,14 +5,38 @@ Ensures continuous autonomous operation
 Never waiting. Always operating.
 """
 
+import io
+import os
+import gzip
 import json
 import time
+import glob
+import fcntl
+import heapq
+import bisect
+import random
+import socket
+import sqlite3
+import shutil
+import hashlib
+import shlex
+import types
+import signal
+import asyncio
+import inspect
+import importlib
+import itertools
 import threading
-import subprocess
+import traceback
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor, InvalidStateError
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager, redirect_stdout, redirect_stderr
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Optional, Tuple, Callable
+from dataclasses import dataclass, asdict, field, is_dataclass, replace
 from enum import Enum
 
 
@@ -25,6 +49,13 @@ class OperationStatus(Enum):
     WAITING = "waiting"
 
 
+class CatchUpPolicy(Enum):
+    """What to do with runs missed while the manager was down"""
+    SKIP = "skip"  # Drop missed runs, resume at the next interval boundary
+    RUN_ONCE = "run_once"  # Coalesce all missed runs into one
+    RUN_ALL = "run_all"  # Replay missed runs back to back, up to max_catch_up_runs
+
+
 @dataclass
 class AutonomousOperation:
     """An autonomous operation"""
@@ -41,6 +72,740 @@ class AutonomousOperation:
     interval: int  # Seconds between executions
     last_execution: Optional[str]
     next_execution: Optional[str]
+    max_concurrency: int = 1  # Simultaneous runs allowed for this operation
+    target: Optional[str] = None  # "module:qualname" callable run in-process instead of command
+    depends_on: List[str] = field(default_factory=list)  # Operation ids that must not be active
+    resources: List[str] = field(default_factory=list)  # Exclusive locks held while running
+    adaptive: bool = False  # Stretch the interval while consecutive results are unchanged
+    consecutive_failures: int = 0
+    unchanged_runs: int = 0
+    result_fingerprint: Optional[str] = None
+    catch_up: CatchUpPolicy = CatchUpPolicy.RUN_ONCE
+    pending_catch_up: int = 0  # Missed runs still to replay under RUN_ALL
+    cache_ttl: int = 0  # Seconds a successful result may be reused; 0 disables caching
+    cache_inputs: List[str] = field(default_factory=list)  # Files/dirs/globs the result depends on
+    cache_hash_inputs: bool = False  # Fingerprint inputs by content hash, not size+mtime
+
+
+@dataclass
+class CommandResult:
+    """Outcome of a command or callable run by an operation runner"""
+    exit_code: Optional[int]
+    stdout: str
+    stderr: str
+    timed_out: bool
+    duration: float
+    return_value: Any = None  # Only set for callable targets
+    output: Dict[str, Any] = field(default_factory=dict)  # Per-stream size/truncation/spill info
+    cache_key: Optional[str] = None  # Idempotency key of the inputs this result was produced from
+    cached: bool = False  # Served from ResultCache without running anything
+
+
+class LatencyHistogram:
+    """
+    Fixed-size HDR-style latency histogram
+    Log-linear buckets over microseconds: exact below 32us, then 16 linear
+    sub-buckets per power of two (<= ~6% relative error) up to ~19 hours
+    """
+    
+    SUB_BUCKETS = 16
+    MAX_SHIFT = 31
+    BUCKET_COUNT = 2 * SUB_BUCKETS + MAX_SHIFT * SUB_BUCKETS
+    
+    def __init__(self):
+        self.counts = [0] * self.BUCKET_COUNT
+        self.total = 0
+        self.sum_seconds = 0.0
+        self.max_seconds = 0.0
+    
+    @classmethod
+    def _bucket_index(cls, micros: int) -> int:
+        if micros < 2 * cls.SUB_BUCKETS:
+            return micros
+        shift = min(micros.bit_length() - 5, cls.MAX_SHIFT)
+        sub = min(micros >> shift, 2 * cls.SUB_BUCKETS - 1) - cls.SUB_BUCKETS
+        return 2 * cls.SUB_BUCKETS + (shift - 1) * cls.SUB_BUCKETS + sub
+    
+    @classmethod
+    def _bucket_upper_seconds(cls, index: int) -> float:
+        if index < 2 * cls.SUB_BUCKETS:
+            return (index + 1) / 1e6
+        shift, sub = divmod(index - 2 * cls.SUB_BUCKETS, cls.SUB_BUCKETS)
+        shift += 1
+        return ((cls.SUB_BUCKETS + sub + 1) << shift) / 1e6
+    
+    def record(self, seconds: float):
+        """Add one observation"""
+        seconds = max(0.0, seconds)
+        self.counts[self._bucket_index(int(seconds * 1e6))] += 1
+        self.total += 1
+        self.sum_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+    
+    def merge(self, other: "LatencyHistogram"):
+        """Fold another histogram's observations into this one"""
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.total += other.total
+        self.sum_seconds += other.sum_seconds
+        self.max_seconds = max(self.max_seconds, other.max_seconds)
+    
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th quantile (0 < q <= 1), in seconds"""
+        if not self.total:
+            return 0.0
+        rank = max(1, int(q * self.total + 0.999999))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(self._bucket_upper_seconds(index), self.max_seconds)
+        return self.max_seconds
+    
+    def summary(self) -> Dict[str, float]:
+        """Count, mean and tail percentiles"""
+        return {
+            "count": self.total,
+            "mean": self.sum_seconds / self.total if self.total else 0.0,
+            "p50": self.percentile(0.50),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "max": self.max_seconds
+        }
+
+
+class OperationStats:
+    """Execution statistics for one operation"""
+    
+    def __init__(self):
+        self.runs = 0
+        self.failures = 0
+        self.duration = LatencyHistogram()  # Runner start to finish
+        self.queue_wait = LatencyHistogram()  # Due to claimed (backpressure, dependencies, resources)
+        self.scheduling_lag = LatencyHistogram()  # Deadline to popped by the scheduler
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "failures": self.failures,
+            "failure_rate": self.failures / self.runs if self.runs else 0.0,
+            "busy_seconds": self.duration.sum_seconds,
+            "duration": self.duration.summary(),
+            "queue_wait": self.queue_wait.summary(),
+            "scheduling_lag": self.scheduling_lag.summary()
+        }
+
+
+class ResultCache:
+    """
+    LRU cache of successful results keyed by idempotency key
+    Entries expire after the owning operation's cache_ttl
+    """
+    
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, CommandResult]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: str, ttl: float) -> Optional[CommandResult]:
+        """Return a fresh cached result and mark it most recently used"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > ttl:
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+    
+    def put(self, key: str, result: CommandResult):
+        """Store a result, evicting the least recently used entries over max_entries"""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _fingerprint_inputs(patterns: List[str], hash_contents: bool = False) -> List[Tuple[str, Any]]:
+    """Size+mtime (or content hash) of every file matched by the given paths and globs"""
+    files = []
+    for pattern in patterns:
+        matches = glob.glob(os.path.expanduser(pattern), recursive=True)
+        if not matches:
+            files.append((pattern, None))  # Absent inputs are part of the fingerprint too
+        for match in sorted(matches):
+            path = Path(match)
+            if path.is_dir():
+                files.extend((str(f), None) for f in sorted(path.rglob('*')) if f.is_file())
+            else:
+                files.append((match, None))
+    
+    fingerprint = []
+    for name, _ in files:
+        try:
+            if hash_contents:
+                with open(name, 'rb') as f:
+                    fingerprint.append((name, hashlib.sha256(f.read()).hexdigest()))
+            else:
+                stat = os.stat(name)
+                fingerprint.append((name, [stat.st_size, stat.st_mtime_ns]))
+        except OSError:
+            fingerprint.append((name, None))
+    return fingerprint
+
+
+class OutputCapture:
+    """
+    Bounded capture of one run's stdout/stderr
+    Keeps the last max_bytes of each stream in memory; once a stream
+    outgrows that, its full contents are spilled to a file instead
+    """
+    
+    STREAMS = ("stdout", "stderr")
+    
+    def __init__(self, max_bytes: int = 65536, spill_dir: Optional[Path] = None,
+                 spill_prefix: str = "output", rotations: int = 3):
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir
+        self.spill_prefix = spill_prefix
+        self.rotations = rotations
+        self._tails: Dict[str, bytearray] = {name: bytearray() for name in self.STREAMS}
+        self._totals: Dict[str, int] = {name: 0 for name in self.STREAMS}
+        self._spills: Dict[str, Any] = {}
+    
+    def spill_path(self, stream: str) -> Optional[Path]:
+        """File the full stream is spilled to, when spilling is enabled"""
+        if self.spill_dir is None:
+            return None
+        return self.spill_dir / f"{self.spill_prefix}.{stream}.log"
+    
+    def rotate(self):
+        """Compress the previous run's spill files into numbered .gz generations"""
+        for stream in self.STREAMS:
+            path = self.spill_path(stream)
+            if path is None or not path.exists():
+                continue
+            if self.rotations <= 0:
+                path.unlink()
+                continue
+            
+            oldest = path.with_name(f"{path.name}.{self.rotations}.gz")
+            if oldest.exists():
+                oldest.unlink()
+            for generation in range(self.rotations - 1, 0, -1):
+                older = path.with_name(f"{path.name}.{generation}.gz")
+                if older.exists():
+                    older.rename(path.with_name(f"{path.name}.{generation + 1}.gz"))
+            with open(path, 'rb') as src, gzip.open(path.with_name(f"{path.name}.1.gz"), 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+            path.unlink()
+    
+    def write(self, stream: str, chunk: bytes):
+        """Record a chunk of output (usable directly as an on_output callback)"""
+        tail = self._tails[stream]
+        self._totals[stream] += len(chunk)
+        
+        spill = self._spills.get(stream)
+        if spill is None and self._totals[stream] > self.max_bytes and self.spill_dir is not None:
+            # First overflow: the tail still holds everything seen so far
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+            spill = self._spills[stream] = open(self.spill_path(stream), 'wb')
+            spill.write(tail)
+        if spill is not None:
+            spill.write(chunk)
+        
+        tail += chunk[-self.max_bytes:]
+        if len(tail) > self.max_bytes:
+            del tail[:len(tail) - self.max_bytes]
+    
+    def close(self):
+        """Close any spill files"""
+        for spill in self._spills.values():
+            spill.close()
+    
+    def tail(self, stream: str) -> str:
+        """The retained tail of a stream, decoded"""
+        return self._tails[stream].decode(errors="replace")
+    
+    def summary(self) -> Dict[str, Any]:
+        """Per-stream byte counts, truncation flags and spill files"""
+        return {
+            stream: {
+                "bytes": self._totals[stream],
+                "truncated": self._totals[stream] > self.max_bytes,
+                "file": str(self.spill_path(stream)) if stream in self._spills else None
+            }
+            for stream in self.STREAMS
+        }
+
+
+class AsyncSubprocessRunner:
+    """
+    Runs operation commands on one dedicated asyncio event loop
+    Hundreds of concurrent subprocesses, one thread
+    """
+    
+    # Commands containing any of these need a shell; everything else is exec'd directly
+    SHELL_METACHARACTERS = set("|&;<>()$`\\\"'*?[]{}~#\n")
+    
+    def __init__(self, kill_grace: float = 5.0, chunk_size: int = 65536,
+                 max_output_bytes: int = 65536):
+        self.kill_grace = kill_grace  # Seconds between SIGTERM and SIGKILL
+        self.chunk_size = chunk_size
+        self.max_output_bytes = max_output_bytes  # Per-stream cap when no capture is given
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._closed = False
+    
+    def submit(self, command: str, timeout: float,
+               on_output: Optional[Callable[[str, bytes], None]] = None,
+               capture: Optional[OutputCapture] = None) -> Future:
+        """Start a command; the returned future resolves to a CommandResult"""
+        loop = self._ensure_loop()
+        if capture is None:
+            capture = OutputCapture(self.max_output_bytes)
+        return asyncio.run_coroutine_threadsafe(self._run(command, timeout, on_output, capture), loop)
+    
+    def stop(self):
+        """Kill running commands and stop the event loop"""
+        with self._lock:
+            self._closed = True
+            loop, thread = self._loop, self._thread
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._cancel_all(), loop).result(self.kill_grace + 5)
+        except Exception:
+            pass
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+    
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the event loop thread on first use"""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("AsyncSubprocessRunner has been stopped")
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever,
+                                                name="apollo-subprocess-loop", daemon=True)
+                self._thread.start()
+            return self._loop
+    
+    async def _cancel_all(self):
+        """Cancel every running command task (each kills its process group)"""
+        tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    def _command_argv(self, command: str) -> List[str]:
+        """Exec plain commands directly; fall back to /bin/sh -c for shell syntax"""
+        if self.SHELL_METACHARACTERS & set(command):
+            return ["/bin/sh", "-c", command]
+        argv = shlex.split(command)
+        # Env assignments (FOO=1 cmd) and builtins (exit 3, cd /tmp) only exist in a shell
+        if not argv or "=" in argv[0] or shutil.which(argv[0]) is None:
+            return ["/bin/sh", "-c", command]
+        return argv
+    
+    async def _run(self, command: str, timeout: float,
+                   on_output: Optional[Callable[[str, bytes], None]],
+                   capture: OutputCapture) -> CommandResult:
+        """Run one command, streaming its output and enforcing the timeout"""
+        started = time.monotonic()
+        try:
+            # Compressing the previous run's spill files can take a while: not on the loop
+            await asyncio.get_running_loop().run_in_executor(None, capture.rotate)
+            return await self._run_captured(command, timeout, on_output, capture, started)
+        finally:
+            capture.close()
+    
+    async def _run_captured(self, command: str, timeout: float,
+                            on_output: Optional[Callable[[str, bytes], None]],
+                            capture: OutputCapture, started: float) -> CommandResult:
+        """Body of _run; output goes into capture"""
+        # New session so a timeout can kill the whole process group,
+        # including anything the command itself spawned
+        process = await asyncio.create_subprocess_exec(
+            *self._command_argv(command),
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=True
+        )
+        
+        timed_out = False
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(
+                    self._drain(process.stdout, "stdout", capture, on_output),
+                    self._drain(process.stderr, "stderr", capture, on_output),
+                    process.wait()
+                ),
+                timeout
+            )
+        except asyncio.TimeoutError:
+            timed_out = True
+            await self._kill_process_group(process)
+        except asyncio.CancelledError:
+            await self._kill_process_group(process)
+            raise
+        
+        return CommandResult(
+            exit_code=process.returncode,
+            stdout=capture.tail("stdout"),
+            stderr=capture.tail("stderr"),
+            timed_out=timed_out,
+            duration=time.monotonic() - started,
+            output=capture.summary()
+        )
+    
+    async def _drain(self, stream: asyncio.StreamReader, name: str,
+                     capture: OutputCapture,
+                     on_output: Optional[Callable[[str, bytes], None]]):
+        """Read a pipe incrementally until EOF"""
+        while True:
+            chunk = await stream.read(self.chunk_size)
+            if not chunk:
+                return
+            capture.write(name, chunk)
+            if on_output:
+                on_output(name, chunk)
+    
+    async def _kill_process_group(self, process: asyncio.subprocess.Process):
+        """SIGTERM the process group, escalating to SIGKILL after kill_grace"""
+        for sig in (signal.SIGTERM, signal.SIGKILL):
+            try:
+                os.killpg(process.pid, sig)
+            except (ProcessLookupError, PermissionError):
+                pass
+            try:
+                await asyncio.wait_for(process.wait(), self.kill_grace)
+                return
+            except asyncio.TimeoutError:
+                continue
+
+
+class _CallableTimeout(BaseException):
+    """
+    Raised inside a worker process when a callable exceeds its timeout
+    A BaseException, like KeyboardInterrupt, so `except Exception` in the target can't swallow it
+    """
+
+
+# Per-worker-process cache of instances for "module:Class.method" targets
+_worker_instances: Dict[str, Any] = {}
+
+
+def _resolve_callable_target(target: str) -> Callable[[], Any]:
+    """Import a "module:qualname" target, binding plain methods to a cached instance"""
+    module_name, _, qualname = target.partition(":")
+    if not module_name or not qualname:
+        raise ValueError(f"Invalid callable target {target!r}, expected 'module:qualname'")
+    
+    obj: Any = importlib.import_module(module_name)
+    owner: Any = None
+    parts = qualname.split(".")
+    for part in parts:
+        owner, obj = obj, getattr(obj, part)
+    
+    # A plain function looked up on a class is an unbound method: build the
+    # instance once per worker and keep it warm for every later run
+    if isinstance(owner, type) and isinstance(inspect.getattr_static(owner, parts[-1]), types.FunctionType):
+        instance_key = f"{module_name}:{'.'.join(parts[:-1])}"
+        if instance_key not in _worker_instances:
+            _worker_instances[instance_key] = owner()
+        obj = getattr(_worker_instances[instance_key], parts[-1])
+    
+    return obj
+
+
+def _json_safe(value: Any) -> Any:
+    """Convert a callable's return value into something operations.json can hold"""
+    if is_dataclass(value) and not isinstance(value, type):
+        value = asdict(value)
+    try:
+        return json.loads(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return repr(value)
+
+
+def _raise_callable_timeout(signum, frame):
+    raise _CallableTimeout()
+
+
+def _run_callable_target(target: str, timeout: float, max_output_bytes: int = 65536) -> CommandResult:
+    """Worker-process entry point: run one callable target with a SIGALRM timeout"""
+    started = time.monotonic()
+    stdout, stderr = io.StringIO(), io.StringIO()
+    exit_code: Optional[int] = 0
+    timed_out = False
+    return_value = None
+    
+    # Pool workers run tasks on their main thread, so an interval timer can
+    # interrupt a runaway callable without killing the warm worker
+    previous_handler = signal.signal(signal.SIGALRM, _raise_callable_timeout)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            return_value = _json_safe(_resolve_callable_target(target)())
+    except _CallableTimeout:
+        exit_code, timed_out = None, True
+    except BaseException:
+        traceback.print_exc(file=stderr)
+        exit_code = 1
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+    
+    # Only the bounded tail crosses back to the manager
+    capture = OutputCapture(max_output_bytes)
+    capture.write("stdout", stdout.getvalue().encode())
+    capture.write("stderr", stderr.getvalue().encode())
+    
+    return CommandResult(
+        exit_code=exit_code,
+        stdout=capture.tail("stdout"),
+        stderr=capture.tail("stderr"),
+        timed_out=timed_out,
+        duration=time.monotonic() - started,
+        return_value=return_value,
+        output=capture.summary()
+    )
+
+
+def _settle(future: Future, result: Any = None, exception: Optional[BaseException] = None) -> bool:
+    """Resolve a future unless something else already did; whether this call won"""
+    try:
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+    except InvalidStateError:
+        return False
+    return True
+
+
+class PythonCallableRunner:
+    """
+    Runs "module:qualname" callables in a long-lived pool of warm worker processes
+    Imports and instances survive between runs; no interpreter start per operation
+    """
+    
+    def __init__(self, processes: int = 2, kill_grace: float = 5.0):
+        self.processes = processes
+        self.kill_grace = kill_grace  # Seconds past the timeout before the worker is killed
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._closed = False
+    
+    def submit(self, target: str, timeout: float, max_output_bytes: int = 65536) -> Future:
+        """Run a callable target; the returned future resolves to a CommandResult"""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("PythonCallableRunner has been stopped")
+            if self._pool is None:
+                self._pool = self._new_pool()
+            try:
+                pending = self._pool.submit(_run_callable_target, target, timeout, max_output_bytes)
+            except BrokenProcessPool:
+                # A worker died (os._exit, OOM kill) and took the pool with it;
+                # its own run already failed, later runs get a fresh pool
+                self._pool.shutdown(wait=False)
+                self._pool = self._new_pool()
+                pending = self._pool.submit(_run_callable_target, target, timeout, max_output_bytes)
+            pool = self._pool
+        
+        # The in-worker SIGALRM can still be swallowed (a bare except, a C
+        # extension that never returns): past timeout + kill_grace the run
+        # fails here and the pool, stuck worker included, is replaced
+        result: Future = Future()
+        started = time.monotonic()
+        deadline = threading.Timer(timeout + self.kill_grace, self._expire, (pool, result, started))
+        deadline.daemon = True
+        
+        def propagate(done: Future):
+            deadline.cancel()
+            try:
+                value = done.result()
+            except BaseException as e:
+                _settle(result, exception=e)
+            else:
+                _settle(result, value)
+        
+        deadline.start()
+        pending.add_done_callback(propagate)
+        return result
+    
+    def _expire(self, pool: ProcessPoolExecutor, result: Future, started: float):
+        """Fail a run that outlived its deadline and recycle the pool it is stuck in"""
+        timed_out = CommandResult(exit_code=None, stdout="", stderr="", timed_out=True,
+                                  duration=time.monotonic() - started)
+        if not _settle(result, timed_out):
+            return
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        # Private, but the only handle on the workers before Python 3.14's terminate_workers()
+        for process in list((pool._processes or {}).values()):
+            process.kill()
+        pool.shutdown(wait=False, cancel_futures=True)
+    
+    def _new_pool(self) -> ProcessPoolExecutor:
+        """Worker pool; spawn, not fork: the manager process is multi-threaded"""
+        return ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    
+    def stop(self):
+        """Shut the worker pool down"""
+        with self._lock:
+            self._closed = True
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+class ShardCoordinator:
+    """
+    Shares operations between manager instances through a SQLite lease table
+    Live instances heartbeat into the members table and each operation belongs
+    to one of them by consistent hashing of its id, so an instance joining or
+    dying only moves its own share. The owner takes a time-limited lease before
+    running; a lease held elsewhere, or a run completed elsewhere too recently,
+    means skip. Whoever holds the leader lease does shared housekeeping.
+    """
+    
+    LEADER_KEY = "__leader__"
+    
+    def __init__(self, db_path: Path, instance_id: Optional[str] = None,
+                 lease_ttl: float = 30.0, virtual_nodes: int = 64):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.instance_id = instance_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.lease_ttl = lease_ttl
+        self.virtual_nodes = virtual_nodes
+        self._members: List[str] = []
+        self._ring: Tuple[Tuple[str, ...], List[int], List[str]] = ((), [], [])
+        
+        with self._connect() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS members ("
+                         "instance_id TEXT PRIMARY KEY, heartbeat REAL NOT NULL)")
+            conn.execute("CREATE TABLE IF NOT EXISTS leases ("
+                         "key TEXT PRIMARY KEY, owner TEXT, expires REAL NOT NULL DEFAULT 0, "
+                         "last_completed REAL)")
+        self.heartbeat()
+    
+    @contextmanager
+    def _connect(self):
+        """Short-lived autocommit connection; transactions are opened explicitly"""
+        conn = sqlite3.connect(str(self.db_path), timeout=10, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+    
+    @staticmethod
+    def _hash(key: str) -> int:
+        return int.from_bytes(hashlib.sha256(key.encode()).digest()[:8], "big")
+    
+    def heartbeat(self) -> List[str]:
+        """Announce this instance as live, extend its leases and refresh the member list"""
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("INSERT INTO members (instance_id, heartbeat) VALUES (?, ?) "
+                         "ON CONFLICT(instance_id) DO UPDATE SET heartbeat = excluded.heartbeat",
+                         (self.instance_id, now))
+            # Leases that already lapsed may belong to someone else by now
+            conn.execute("UPDATE leases SET expires = ? WHERE owner = ? AND expires > ?",
+                         (now + self.lease_ttl, self.instance_id, now))
+            conn.execute("DELETE FROM members WHERE heartbeat < ?", (now - 10 * self.lease_ttl,))
+            rows = conn.execute("SELECT instance_id FROM members WHERE heartbeat > ? "
+                                "ORDER BY instance_id", (now - self.lease_ttl,)).fetchall()
+        self._members = [row[0] for row in rows]
+        return self._members
+    
+    def members(self) -> List[str]:
+        """Instances that were live at the last heartbeat"""
+        return list(self._members)
+    
+    def owner_of(self, key: str) -> Optional[str]:
+        """Member responsible for a key on the consistent-hash ring"""
+        members = tuple(self._members)
+        if not members:
+            return None
+        if self._ring[0] != members:
+            points = sorted((self._hash(f"{member}#{i}"), member)
+                            for member in members for i in range(self.virtual_nodes))
+            self._ring = (members, [p for p, _ in points], [m for _, m in points])
+        _, hashes, owners = self._ring
+        index = bisect.bisect_left(hashes, self._hash(key)) % len(hashes)
+        return owners[index]
+    
+    def owns(self, key: str) -> bool:
+        """Whether this instance is responsible for a key"""
+        return self.owner_of(key) == self.instance_id
+    
+    def acquire_lease(self, key: str, min_gap: float = 0.0) -> bool:
+        """
+        Take or renew the lease on a key
+        Fails while another instance holds an unexpired lease, or when the key
+        was completed less than min_gap seconds ago
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute("SELECT owner, expires, last_completed FROM leases WHERE key = ?",
+                                   (key,)).fetchone()
+                acquired = True
+                if row is not None:
+                    owner, expires, last_completed = row
+                    if owner not in (None, self.instance_id) and expires > now:
+                        acquired = False
+                    elif last_completed is not None and now - last_completed < min_gap:
+                        acquired = False
+                if acquired:
+                    conn.execute("INSERT INTO leases (key, owner, expires) VALUES (?, ?, ?) "
+                                 "ON CONFLICT(key) DO UPDATE SET owner = excluded.owner, "
+                                 "expires = excluded.expires",
+                                 (key, self.instance_id, now + self.lease_ttl))
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        return acquired
+    
+    def release_lease(self, key: str, completed: bool = False):
+        """Give up a lease held by this instance, recording a completed run"""
+        with self._connect() as conn:
+            if completed:
+                conn.execute("UPDATE leases SET owner = NULL, expires = 0, last_completed = ? "
+                             "WHERE key = ? AND owner = ?", (time.time(), key, self.instance_id))
+            else:
+                conn.execute("UPDATE leases SET owner = NULL, expires = 0 WHERE key = ? AND owner = ?",
+                             (key, self.instance_id))
+    
+    def is_leader(self) -> bool:
+        """Take or keep the leader lease"""
+        return self.acquire_lease(self.LEADER_KEY)
+    
+    def leave(self):
+        """Drop out of the ring and release every lease so others take over at once"""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM members WHERE instance_id = ?", (self.instance_id,))
+            conn.execute("UPDATE leases SET owner = NULL, expires = 0 WHERE owner = ?",
+                         (self.instance_id,))
+        self._members = [m for m in self._members if m != self.instance_id]
 
 
 class ApolloAutonomousOperationsManager:
@@ -50,15 +815,89 @@ class ApolloAutonomousOperationsManager:
     Always operating autonomously
     """
     
-    def __init__(self):
+    # Result keys that change on every run without meaning anything changed
+    VOLATILE_RESULT_KEYS = {"timestamp"}
+    
+    def __init__(self, max_workers: int = 4, max_queue_depth: int = 32,
+                 coordinator: Optional[ShardCoordinator] = None):
         self.operations_dir = Path.home() / ".apollo_autonomous_operations"
         self.operations_dir.mkdir(parents=True, exist_ok=True)
         
         self.operations_file = self.operations_dir / "operations.json"
+        self.output_dir = self.operations_dir / "output"
+        self.journal_file = self.operations_dir / "operations.journal"
         self.manifest_file = self.operations_dir / "manifest.json"
+        self.lock_file = self.operations_dir / "operations.lock"
         
         self.operations: Dict[str, AutonomousOperation] = {}
         self.running = True
+        self.failure_retry_delay = 10  # Seconds before retrying a failed operation
+        self.operation_timeout = 300  # Seconds before a command's process group is killed
+        self.backpressure_delay = 1  # Seconds to defer dispatch while the queue is full
+        self.jitter_ratio = 0.1  # Each delay is randomized by up to +/-10%
+        self.max_failure_backoff = 3600  # Cap on exponential failure backoff, in seconds
+        self.max_interval_stretch = 8  # Max multiple of interval for adaptive operations
+        self.max_catch_up_runs = 3  # Cap on missed runs replayed under RUN_ALL
+        self.startup_stagger = 30  # Seconds over which overdue operations are spread on load
+        self.result_cache = ResultCache(max_entries=256)
+        self.max_output_bytes = 64 * 1024  # Per-stream output kept in operation.result
+        self.output_rotations = 3  # Compressed spill files kept per operation and stream
+        
+        # Bounded worker pool. Claims (RUNNING + per-operation run counts) are
+        # taken atomically under _claim_lock before work is submitted, and the
+        # number of claimed-but-unfinished runs is capped at max_queue_depth.
+        # Commands themselves run on the runner's event loop; pool workers
+        # only do the bookkeeping once a command finishes.
+        self._runner = AsyncSubprocessRunner()
+        self._callable_runner = PythonCallableRunner()
+        self.max_workers = max_workers
+        self.max_queue_depth = max_queue_depth
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix="apollo-operation")
+        self._claim_lock = threading.Lock()
+        self._active_runs: Dict[str, int] = {}
+        self._in_flight = 0
+        
+        # Dependency DAG and resource locks. An operation whose dependency is
+        # active or waiting, or whose resource is held, is parked in _waiting
+        # (status WAITING) and re-dispatched whenever a run releases.
+        self._held_resources: Dict[str, str] = {}  # resource -> operation_id
+        self._waiting: Dict[str, None] = {}  # Ordered set of blocked operation ids
+        
+        # In-memory execution statistics; _due_times holds (deadline, popped_at)
+        # for operations popped by the scheduler but not yet claimed
+        self._stats: Dict[str, OperationStats] = {}
+        self._stats_lock = threading.Lock()
+        self._due_times: Dict[str, Tuple[float, float]] = {}
+        
+        # Persistence: operations.json is a snapshot, operations.journal holds
+        # one upsert line per changed operation since that snapshot. Changes are
+        # coalesced per operation and flushed with a single fsync at most every
+        # journal_flush_interval seconds; the journal is compacted back into
+        # the snapshot after journal_compact_threshold records.
+        self.journal_flush_interval = 1.0
+        self.journal_compact_threshold = 1000
+        self._save_lock = threading.Lock()
+        self._dirty_operations: Dict[str, None] = {}  # Ordered set
+        self._journal_records = 0
+        self._executed_pending = 0
+        self._manifest_dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+        
+        # Deadline scheduler: min-heap of (monotonic deadline, seq, operation_id).
+        # Rescheduling leaves stale heap entries behind; _deadlines holds the
+        # authoritative deadline per operation and stale entries are skipped.
+        self._schedule: List[Tuple[float, int, str]] = []
+        self._deadlines: Dict[str, float] = {}
+        self._schedule_seq = itertools.count()
+        self._schedule_cond = threading.Condition()
+        
+        # Sharding: with a coordinator, several manager processes share the
+        # state directory. Each runs only the operations it owns and holds a
+        # lease on; the snapshot and journal are guarded by a file lock, every
+        # instance appends to the journal and only the leader compacts it.
+        self.coordinator = coordinator
+        self._leader = False
         
         # Load operations
         self.load_operations()
@@ -101,43 +940,93 @@ class ApolloAutonomousOperationsManager:
             {
                 "name": "Memory Preservation",
                 "description": "Preserve all memories",
-                "command": "python3 apollo_memory_preservation_protocol.py",
-                "interval": 7200  # 2 hours
+                "target": "apollo_memory_preservation_protocol:main",
+                "interval": 7200,  # 2 hours
+                "resources": ["apollo_state_dirs"]
             },
             {
                 "name": "Singularity Sync",
                 "description": "Sync with Singularity",
                 "command": "python3 apollo_singularity_alpha_prime_integration.py",
-                "interval": 600  # 10 minutes
+                "interval": 600,  # 10 minutes
+                "resources": ["apollo_state_dirs"]
             },
             {
                 "name": "Continuity Checkpoint",
                 "description": "Create continuity checkpoint",
-                "command": "python3 apollo_continuity_system.py",
-                "interval": 300  # 5 minutes
+                "target": "apollo_continuity_system:create_checkpoint",
+                "interval": 300,  # 5 minutes
+                "resources": ["apollo_state_dirs"]
             },
             {
                 "name": "System Health Check",
                 "description": "Check system health",
-                "command": "python3 -c 'from apollo_continuity_system import ApolloContinuitySystem; c = ApolloContinuitySystem(); print(c._check_system_health())'",
-                "interval": 60  # 1 minute
+                "target": "apollo_continuity_system:check_system_health",
+                "interval": 60,  # 1 minute
+                "adaptive": True,
+                "catch_up": CatchUpPolicy.SKIP
             }
         ]
         
         for op_data in default_ops:
-            if not any(op.name == op_data["name"] for op in self.operations.values()):
+            existing = next((op for op in self.operations.values() if op.name == op_data["name"]), None)
+            if existing is None:
                 self.register_operation(
                     name=op_data["name"],
                     description=op_data["description"],
-                    command=op_data["command"],
-                    interval=op_data["interval"]
+                    command=op_data.get("command", ""),
+                    interval=op_data["interval"],
+                    target=op_data.get("target"),
+                    resources=op_data.get("resources"),
+                    adaptive=op_data.get("adaptive", False),
+                    catch_up=op_data.get("catch_up", CatchUpPolicy.RUN_ONCE),
+                    # Hosts booted together must not all fire at the same moment
+                    first_run_delay=random.uniform(0, self.jitter_ratio * op_data["interval"]),
+                    # Same id on every instance, so concurrent first starts converge
+                    operation_id=hashlib.sha256(op_data["name"].encode()).hexdigest()[:16]
                 )
+            else:
+                if op_data.get("resources") and not existing.resources:
+                    # Operations persisted before resource locks existed
+                    existing.resources = list(op_data["resources"])
+                    self._mark_dirty(existing.operation_id)
+                if existing.target and op_data.get("target") and existing.target != op_data["target"]:
+                    # Default target moved (e.g. off a class that installs signal handlers)
+                    existing.target = op_data["target"]
+                    self._mark_dirty(existing.operation_id)
     
-    def register_operation(self, name: str, description: str, command: str,
-                          interval: int = 300) -> AutonomousOperation:
-        """Register an autonomous operation"""
-        import hashlib
-        operation_id = hashlib.sha256(f"{name}{time.time()}".encode()).hexdigest()[:16]
+    def register_operation(self, name: str, description: str, command: str = "",
+                          interval: int = 300, max_concurrency: int = 1,
+                          target: Optional[str] = None,
+                          depends_on: Optional[List[str]] = None,
+                          resources: Optional[List[str]] = None,
+                          adaptive: bool = False,
+                          catch_up: CatchUpPolicy = CatchUpPolicy.RUN_ONCE,
+                          cache_ttl: int = 0,
+                          cache_inputs: Optional[List[str]] = None,
+                          cache_hash_inputs: bool = False,
+                          first_run_delay: float = 0.0,
+                          operation_id: Optional[str] = None) -> AutonomousOperation:
+        """
+        Register an autonomous operation
+        Runs either a shell command or an importable "module:qualname" target.
+        depends_on names operations (by id or name) that must finish first when
+        due together; resources are exclusive locks shared with other operations.
+        adaptive operations run less often while their results stay the same.
+        catch_up decides what happens to runs missed while the manager was down.
+        With cache_ttl > 0, a run whose cache_inputs are unchanged reuses the
+        last successful result instead of executing.
+        A fixed operation_id lets several instances register the same operation.
+        """
+        if bool(command) == bool(target):
+            raise ValueError("Specify exactly one of command or target")
+        if operation_id is not None and operation_id in self.operations:
+            raise ValueError(f"Operation {operation_id} already exists")
+        
+        dependency_ids = [self._resolve_operation_ref(ref) for ref in depends_on or []]
+        
+        if operation_id is None:
+            operation_id = hashlib.sha256(f"{name}{time.time()}".encode()).hexdigest()[:16]
         
         operation = AutonomousOperation(
             operation_id=operation_id,
@@ -152,16 +1041,24 @@ class ApolloAutonomousOperationsManager:
             error=None,
             interval=interval,
             last_execution=None,
-            next_execution=datetime.now().isoformat()
+            next_execution=datetime.fromtimestamp(time.time() + first_run_delay).isoformat(),
+            max_concurrency=max_concurrency,
+            target=target,
+            depends_on=dependency_ids,
+            resources=list(resources or []),
+            adaptive=adaptive,
+            catch_up=catch_up,
+            cache_ttl=cache_ttl,
+            cache_inputs=list(cache_inputs or []),
+            cache_hash_inputs=cache_hash_inputs
         )
         
         self.operations[operation_id] = operation
-        self.save_operations()
+        self._schedule_operation(operation)
         
-        # Update manifest
-        manifest = self._load_manifest()
-        manifest["operations_registered"] = len(self.operations)
-        self._save_manifest(manifest)
+        # Journal the new operation; the manifest count follows on the same flush
+        self._manifest_dirty = True
+        self._mark_dirty(operation_id)
         
         return operation
     
@@ -170,50 +1067,224 @@ class ApolloAutonomousOperationsManager:
         if operation_id not in self.operations:
             raise ValueError(f"Operation {operation_id} not found")
         
-        operation = self.operations[operation_id]
-        
-        if operation.status == OperationStatus.RUNNING:
+        if not self._claim_operation(operation_id):
             return None
         
-        operation.status = OperationStatus.RUNNING
+        return self._run_claimed_operation(operation_id)
+    
+    def _resolve_operation_ref(self, ref: str) -> str:
+        """Map an operation id or name to its id"""
+        if ref in self.operations:
+            return ref
+        for op in self.operations.values():
+            if op.name == ref:
+                return op.operation_id
+        raise ValueError(f"Unknown dependency {ref!r}")
+    
+    def _dependency_depth(self, operation_id: str) -> int:
+        """Length of the longest dependency chain below an operation"""
+        depth = 0
+        pending = [(dep, 1) for dep in self.operations[operation_id].depends_on]
+        while pending:
+            dep, level = pending.pop()
+            depth = max(depth, level)
+            # register_operation only accepts existing operations, so the graph
+            # is acyclic; the level cap guards against hand-edited state files
+            if dep in self.operations and level < len(self.operations):
+                pending.extend((d, level + 1) for d in self.operations[dep].depends_on)
+        return depth
+    
+    def _is_blocked(self, operation: AutonomousOperation) -> bool:
+        """Whether a dependency or resource prevents a run right now (caller holds _claim_lock)"""
+        for dep in operation.depends_on:
+            if self._active_runs.get(dep) or dep in self._waiting:
+                return True
+        return any(self._held_resources.get(r, operation.operation_id) != operation.operation_id
+                   for r in operation.resources)
+    
+    def _claim_operation(self, operation_id: str, wait: bool = False) -> bool:
+        """
+        Atomically reserve a run slot and the operation's resources
+        With wait=True a blocked operation is parked until a run releases
+        """
+        with self._claim_lock:
+            operation = self.operations[operation_id]
+            active = self._active_runs.get(operation_id, 0)
+            if active >= operation.max_concurrency:
+                return False
+            
+            if self._is_blocked(operation):
+                if wait:
+                    self._waiting[operation_id] = None
+                    operation.status = OperationStatus.WAITING
+                return False
+            
+            self._waiting.pop(operation_id, None)
+            for resource in operation.resources:
+                self._held_resources[resource] = operation_id
+            self._active_runs[operation_id] = active + 1
+            operation.status = OperationStatus.RUNNING
+            return True
+    
+    def _release_operation(self, operation_id: str):
+        """Release a run slot; the operation stays RUNNING while other runs remain"""
+        with self._claim_lock:
+            remaining = self._active_runs.get(operation_id, 1) - 1
+            if remaining > 0:
+                self._active_runs[operation_id] = remaining
+                self.operations[operation_id].status = OperationStatus.RUNNING
+            else:
+                self._active_runs.pop(operation_id, None)
+                for resource in self.operations[operation_id].resources:
+                    if self._held_resources.get(resource) == operation_id:
+                        del self._held_resources[resource]
+    
+    def _wake_waiting_operations(self):
+        """Retry every parked operation after a run releases its slot"""
+        with self._claim_lock:
+            waiting = list(self._waiting)
+        for operation_id in waiting:
+            if self.running:
+                self._dispatch_operation(operation_id)
+    
+    def _run_claimed_operation(self, operation_id: str) -> Any:
+        """Run an operation whose slot has already been claimed, blocking until done"""
+        try:
+            future = self._start_operation(operation_id)
+            future.exception()  # Wait; errors are recorded by _finish_operation
+        except Exception as e:
+            future = Future()
+            future.set_exception(e)
+        return self._finish_operation(operation_id, future)
+    
+    def _start_operation(self, operation_id: str) -> Future:
+        """Mark a claimed operation started and hand it to the matching runner"""
+        operation = self.operations[operation_id]
         operation.started_at = datetime.now().isoformat()
-        self.save_operations()
+        self._mark_dirty(operation_id)
         
+        if operation.cache_ttl > 0:
+            # Fingerprinting may hash every input file: on the worker pool,
+            # not the scheduler thread
+            future: Future = Future()
+            self._executor.submit(self._start_cached_operation, operation, future)
+            return future
+        return self._submit_to_runner(operation)
+    
+    def _submit_to_runner(self, operation: AutonomousOperation) -> Future:
+        """Hand an operation to the callable or subprocess runner"""
+        if operation.target:
+            return self._callable_runner.submit(operation.target, timeout=self.operation_timeout,
+                                                max_output_bytes=self.max_output_bytes)
+        capture = OutputCapture(self.max_output_bytes, spill_dir=self.output_dir,
+                                spill_prefix=operation.operation_id, rotations=self.output_rotations)
+        return self._runner.submit(operation.command, timeout=self.operation_timeout, capture=capture)
+    
+    def _start_cached_operation(self, operation: AutonomousOperation, future: Future):
+        """Worker-pool half of _start_operation: reuse a cached result or run and tag it"""
         try:
-            # Execute command
-            result = subprocess.run(
-                operation.command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=300
-            )
+            cache_key = self._cache_key(operation)
+            cached = self.result_cache.get(cache_key, operation.cache_ttl)
+            if cached is not None:
+                future.set_result(replace(cached, cached=True, duration=0.0))
+                return
+            self._tag_cache_key(self._submit_to_runner(operation), cache_key, future)
+        except BaseException as e:
+            future.set_exception(e)
+    
+    def _cache_key(self, operation: AutonomousOperation) -> str:
+        """Idempotency key: what runs plus the fingerprint of its declared inputs"""
+        payload = json.dumps({
+            "command": operation.command,
+            "target": operation.target,
+            "inputs": _fingerprint_inputs(operation.cache_inputs, operation.cache_hash_inputs)
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+    
+    def _tag_cache_key(self, future: Future, cache_key: str, tagged: Future):
+        """Resolve tagged with future's CommandResult, carrying the key computed before the run"""
+        def propagate(done: Future):
+            try:
+                tagged.set_result(replace(done.result(), cache_key=cache_key))
+            except BaseException as e:
+                tagged.set_exception(e)
+        
+        future.add_done_callback(propagate)
+    
+    def _finish_operation(self, operation_id: str, future: Future) -> Any:
+        """Record the outcome of a finished run, release its slot and reschedule"""
+        operation = self.operations[operation_id]
+        duration: Optional[float] = None
+        
+        try:
+            result: CommandResult = future.result()
+            duration = result.duration
+            if result.timed_out:
+                raise TimeoutError("Operation timeout")
             
             operation.status = OperationStatus.COMPLETED
             operation.completed_at = datetime.now().isoformat()
             operation.last_execution = datetime.now().isoformat()
-            operation.next_execution = self._calculate_next_execution(operation)
             operation.result = {
-                "exit_code": result.returncode,
+                "exit_code": result.exit_code,
                 "stdout": result.stdout,
                 "stderr": result.stderr,
-                "success": result.returncode == 0
+                "success": result.exit_code == 0,
+                "output": result.output
             }
+            if operation.target:
+                operation.result["return_value"] = result.return_value
+            if result.cache_key:
+                operation.result["cache_key"] = result.cache_key
+                operation.result["cached"] = result.cached
+                if result.exit_code == 0 and not result.cached:
+                    self.result_cache.put(result.cache_key, result)
             operation.error = None
             
-            # Update manifest
-            manifest = self._load_manifest()
-            manifest["operations_executed"] = manifest.get("operations_executed", 0) + 1
-            self._save_manifest(manifest)
+            # Counted in memory, added to the manifest on the next flush
+            with self._save_lock:
+                self._executed_pending += 1
             
-        except subprocess.TimeoutExpired:
-            operation.status = OperationStatus.FAILED
-            operation.error = "Operation timeout"
         except Exception as e:
             operation.status = OperationStatus.FAILED
             operation.error = str(e)
         
-        self.save_operations()
+        failed = operation.status == OperationStatus.FAILED or not operation.result.get("success")
+        if failed:
+            operation.consecutive_failures += 1
+            operation.unchanged_runs = 0
+            operation.result_fingerprint = None
+        else:
+            operation.consecutive_failures = 0
+            fingerprint = self._result_fingerprint(operation.result)
+            if fingerprint == operation.result_fingerprint:
+                operation.unchanged_runs += 1
+            else:
+                operation.unchanged_runs = 0
+            operation.result_fingerprint = fingerprint
+        operation.next_execution = self._calculate_next_execution(operation)
+        
+        if failed:
+            operation.pending_catch_up = 0  # Backoff wins over replaying missed runs
+        elif operation.pending_catch_up > 0:
+            operation.pending_catch_up -= 1
+            operation.next_execution = datetime.now().isoformat()
+        
+        with self._stats_lock:
+            stats = self._stats.setdefault(operation_id, OperationStats())
+            stats.runs += 1
+            stats.failures += failed
+            if duration is not None:
+                stats.duration.record(duration)
+        
+        if self.coordinator is not None:
+            self.coordinator.release_lease(operation_id, completed=not failed)
+        
+        # Dirty before released, so a disk refresh never overwrites this run
+        self._mark_dirty(operation_id)
+        self._release_operation(operation_id)
+        self._schedule_operation(operation)
+        self._wake_waiting_operations()
         return operation.result
     
     def start_autonomous_operations(self):
@@ -230,6 +1301,12 @@ class ApolloAutonomousOperationsManager:
         execution_thread = threading.Thread(target=self._execution_loop, daemon=True)
         execution_thread.start()
         
+        if self.coordinator is not None:
+            coordination_thread = threading.Thread(target=self._coordination_loop, daemon=True)
+            coordination_thread.start()
+            print(f"🔗 Sharded as {self.coordinator.instance_id} "
+                  f"({len(self.coordinator.members())} live instances)")
+        
         print(f"✅ {len(self.operations)} operations registered")
         print("   Autonomous operations active")
         print("")
@@ -240,35 +1317,280 @@ class ApolloAutonomousOperationsManager:
                 time.sleep(10)
         except KeyboardInterrupt:
             print("\n⚠️  Stopping autonomous operations...")
-            self.running = False
+            self.stop()
+    
+    def stop(self):
+        """Stop autonomous operations and wake the execution loop"""
+        self.running = False
+        with self._schedule_cond:
+            self._schedule_cond.notify_all()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._runner.stop()
+        self._callable_runner.stop()
+        self.flush_journal()
+        if self.coordinator is not None:
+            self.coordinator.leave()
+    
+    def _coordination_loop(self):
+        """Heartbeat, leader election and disk refresh every third of a lease TTL"""
+        while self.running:
+            try:
+                self.coordinate()
+            except Exception as e:
+                print(f"⚠️  Shard coordination failed: {e}")
+            with self._schedule_cond:
+                if not self.running:
+                    break
+                self._schedule_cond.wait(self.coordinator.lease_ttl / 3)
+    
+    def coordinate(self):
+        """
+        One coordination round: heartbeat, contend for leadership, then pick up
+        operations changed by other instances; the leader also compacts
+        """
+        self.coordinator.heartbeat()
+        self._leader = self.coordinator.is_leader()
+        journal_records = self._refresh_from_disk()
+        if self._leader and journal_records >= self.journal_compact_threshold:
+            self._compact_shared_state()
+    
+    def _refresh_from_disk(self) -> int:
+        """Adopt on-disk versions of operations not running or changed locally"""
+        with self._disk_lock(shared=True):
+            disk_operations, journal_records = self._read_operations_from_disk()
+        
+        changed = []
+        with self._claim_lock:
+            with self._save_lock:
+                dirty = set(self._dirty_operations)
+            for operation_id, op in disk_operations.items():
+                if self._active_runs.get(operation_id) or operation_id in self._waiting:
+                    continue
+                if operation_id in dirty or self.operations.get(operation_id) == op:
+                    continue
+                self.operations[operation_id] = op
+                changed.append(op)
+        
+        for op in changed:
+            self._schedule_operation(op)
+        return journal_records
+    
+    def _compact_shared_state(self):
+        """Fold every instance's journal records into the snapshot (leader only)"""
+        with self._save_lock, self._disk_lock():
+            disk_operations, _ = self._read_operations_from_disk()
+            self._write_snapshot(list(disk_operations.values()))
+    
+    @contextmanager
+    def _disk_lock(self, shared: bool = False):
+        """Serialize snapshot and journal access with other manager processes"""
+        with open(self.lock_file, 'a') as f:
+            fcntl.flock(f, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
     
     def _execution_loop(self):
-        """Main execution loop"""
+        """Main execution loop: sleep until the earliest deadline, then dispatch"""
         while self.running:
-            now = datetime.now()
+            # Dependencies first, so dependents due at the same time wait for them
+            for operation_id in sorted(self._pop_due_operations(), key=self._dependency_depth):
+                try:
+                    self._dispatch_operation(operation_id)
+                except Exception as e:
+                    # Never let one operation stop the scheduler; look at it again later
+                    print(f"⚠️  Dispatch of {operation_id} failed: {e}")
+                    if operation_id in self.operations:
+                        self._schedule_at(operation_id, time.monotonic() + self.failure_retry_delay)
+            
+            with self._schedule_cond:
+                if not self.running:
+                    break
+                # Woken early by _schedule_operation when a sooner deadline arrives
+                self._schedule_cond.wait(self._seconds_until_next_deadline())
+    
+    def _dispatch_operation(self, operation_id: str) -> bool:
+        """Claim a due operation and submit it to the worker pool"""
+        if operation_id not in self.operations:
+            return False
+        
+        with self._claim_lock:
+            queue_full = self._in_flight >= self.max_queue_depth
+        if queue_full:
+            # Backpressure: leave next_execution alone and retry dispatch shortly
+            self._schedule_at(operation_id, time.monotonic() + self.backpressure_delay)
+            return False
+        
+        if self.coordinator is not None and not self._acquire_shard_lease(operation_id):
+            # Another instance owns or already ran it; look again once that
+            # owner's lease would have lapsed, in case it died
+            with self._stats_lock:
+                self._due_times.pop(operation_id, None)
+            self._schedule_at(operation_id, time.monotonic() + self.coordinator.lease_ttl)
+            return False
+        
+        if not self._claim_operation(operation_id, wait=True):
+            # At its concurrency limit (the active run reschedules it) or
+            # parked behind a dependency/resource until a run releases
+            return False
+        
+        with self._claim_lock:
+            self._in_flight += 1
+        try:
+            with self._stats_lock:
+                due = self._due_times.pop(operation_id, None)
+                if due is not None:
+                    deadline, popped_at = due
+                    stats = self._stats.setdefault(operation_id, OperationStats())
+                    stats.scheduling_lag.record(popped_at - deadline)
+                    stats.queue_wait.record(time.monotonic() - popped_at)
+            
+            future = self._start_operation(operation_id)
+        except Exception as e:
+            # Runner stopped or could not take the run (RuntimeError), or
+            # starting it failed (OSError): never leave the claim behind
+            if not isinstance(e, RuntimeError):
+                print(f"⚠️  Could not start {operation_id}: {e}")
+            self._abort_dispatch(operation_id)
+            return False
+        
+        future.add_done_callback(lambda f: self._on_dispatched_done(operation_id, f))
+        return True
+    
+    def _abort_dispatch(self, operation_id: str):
+        """Undo the claim of a run that never started and retry it after failure_retry_delay"""
+        operation = self.operations[operation_id]
+        if self.coordinator is not None:
+            self.coordinator.release_lease(operation_id)
+        self._release_operation(operation_id)
+        with self._claim_lock:
+            self._in_flight -= 1
+            if not self._active_runs.get(operation_id):
+                operation.status = OperationStatus.IDLE
+        
+        if self.running:
+            operation.next_execution = datetime.fromtimestamp(time.time() + self.failure_retry_delay).isoformat()
+            self._schedule_operation(operation)
+        self._mark_dirty(operation_id)
+    
+    def _acquire_shard_lease(self, operation_id: str) -> bool:
+        """Lease an operation this instance owns, unless it just ran elsewhere"""
+        if not self.coordinator.owns(operation_id):
+            return False
+        operation = self.operations[operation_id]
+        # Catch-up replays are meant to follow the previous run immediately
+        min_gap = 0.0 if operation.pending_catch_up else operation.interval * (1 - self.jitter_ratio)
+        return self.coordinator.acquire_lease(operation_id, min_gap=min_gap)
+    
+    def _on_dispatched_done(self, operation_id: str, future: Future):
+        """Move completion bookkeeping off the event loop onto the worker pool"""
+        try:
+            self._executor.submit(self._complete_dispatched_operation, operation_id, future)
+        except RuntimeError:
+            # Pool already shut down; finish inline
+            self._complete_dispatched_operation(operation_id, future)
+    
+    def _complete_dispatched_operation(self, operation_id: str, future: Future):
+        """Worker-pool entry point for a finished dispatched operation"""
+        try:
+            self._finish_operation(operation_id, future)
+        finally:
+            with self._claim_lock:
+                self._in_flight -= 1
+    
+    def _schedule_operation(self, operation: AutonomousOperation):
+        """Queue an operation on the deadline heap from its next_execution"""
+        with self._schedule_cond:
+            if not operation.next_execution:
+                self._deadlines.pop(operation.operation_id, None)
+                return
             
-            for operation in self.operations.values():
-                # Check if operation should execute
-                if operation.next_execution:
-                    next_exec = datetime.fromisoformat(operation.next_execution)
-                    if now >= next_exec and operation.status != OperationStatus.RUNNING:
-                        # Execute operation
-                        threading.Thread(
-                            target=self.execute_operation,
-                            args=(operation.operation_id,),
-                            daemon=True
-                        ).start()
+            # Parse the wall-clock timestamp once and convert it to a monotonic
+            # deadline so clock adjustments don't stall or burst the scheduler.
+            # Overdue deadlines stay in the past to keep their relative order.
+            next_exec = datetime.fromisoformat(operation.next_execution).timestamp()
+            self._schedule_at(operation.operation_id, time.monotonic() + (next_exec - time.time()))
+    
+    def _schedule_at(self, operation_id: str, deadline: float):
+        """Push a monotonic deadline for an operation, superseding any earlier one"""
+        with self._schedule_cond:
+            self._deadlines[operation_id] = deadline
+            heapq.heappush(self._schedule, (deadline, next(self._schedule_seq), operation_id))
             
-            time.sleep(10)  # Check every 10 seconds
+            if self._schedule[0][2] == operation_id:
+                self._schedule_cond.notify_all()
+    
+    def _pop_due_operations(self, now: Optional[float] = None) -> List[str]:
+        """Pop every operation whose deadline has passed, earliest first"""
+        if now is None:
+            now = time.monotonic()
+        
+        due = []
+        popped_deadlines = []
+        with self._schedule_cond:
+            while self._schedule and self._schedule[0][0] <= now:
+                deadline, _, operation_id = heapq.heappop(self._schedule)
+                if self._deadlines.get(operation_id) != deadline:
+                    continue  # Stale entry superseded by a reschedule
+                del self._deadlines[operation_id]
+                due.append(operation_id)
+                popped_deadlines.append(deadline)
+        
+        with self._stats_lock:
+            for operation_id, deadline in zip(due, popped_deadlines):
+                # Backpressure re-pops keep the original due time
+                self._due_times.setdefault(operation_id, (deadline, now))
+        return due
+    
+    def _seconds_until_next_deadline(self) -> Optional[float]:
+        """Seconds until the earliest live deadline, or None when nothing is scheduled"""
+        with self._schedule_cond:
+            while self._schedule:
+                deadline, _, operation_id = self._schedule[0]
+                if self._deadlines.get(operation_id) == deadline:
+                    return max(0.0, deadline - time.monotonic())
+                heapq.heappop(self._schedule)
+        return None
     
     def _calculate_next_execution(self, operation: AutonomousOperation) -> str:
-        """Calculate next execution time"""
-        if operation.last_execution:
-            last_exec = datetime.fromisoformat(operation.last_execution)
-            next_exec = last_exec.timestamp() + operation.interval
-            return datetime.fromtimestamp(next_exec).isoformat()
+        """Calculate next execution time from the jittered next delay"""
+        if operation.status == OperationStatus.FAILED or not operation.last_execution:
+            base = time.time()
         else:
-            return datetime.now().isoformat()
+            base = datetime.fromisoformat(operation.last_execution).timestamp()
+        delay = self._next_delay(operation) * (1 + random.uniform(-self.jitter_ratio, self.jitter_ratio))
+        return datetime.fromtimestamp(base + delay).isoformat()
+    
+    def _next_delay(self, operation: AutonomousOperation) -> float:
+        """
+        Delay before the next run, before jitter
+        Failed runs (timeouts, runner errors) retry with exponential backoff from
+        failure_retry_delay; unsuccessful exits back off from the interval;
+        adaptive operations double their interval per unchanged result
+        """
+        if operation.consecutive_failures:
+            factor = 2 ** (operation.consecutive_failures - 1)
+            if operation.status == OperationStatus.FAILED:
+                return min(self.failure_retry_delay * factor, self.max_failure_backoff)
+            return max(operation.interval, min(operation.interval * factor, self.max_failure_backoff))
+        
+        if operation.adaptive:
+            return operation.interval * min(2 ** operation.unchanged_runs, self.max_interval_stretch)
+        return operation.interval
+    
+    def _result_fingerprint(self, result: Dict[str, Any]) -> str:
+        """Hash of a run's observable result, ignoring volatile keys such as timestamps"""
+        def strip(value):
+            if isinstance(value, dict):
+                return {k: strip(v) for k, v in value.items() if k not in self.VOLATILE_RESULT_KEYS}
+            if isinstance(value, list):
+                return [strip(v) for v in value]
+            return value
+        
+        observable = {key: result.get(key) for key in ("exit_code", "stdout", "stderr", "return_value")}
+        payload = json.dumps(strip(observable), sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
     
     def get_operations_status(self) -> Dict[str, Any]:
         """Get operations status"""
@@ -278,28 +1600,267 @@ class ApolloAutonomousOperationsManager:
             "running": len([op for op in self.operations.values() if op.status == OperationStatus.RUNNING]),
             "completed": len([op for op in self.operations.values() if op.status == OperationStatus.COMPLETED]),
             "failed": len([op for op in self.operations.values() if op.status == OperationStatus.FAILED]),
-            "operations": [asdict(op) for op in self.operations.values()],
+            "waiting": len([op for op in self.operations.values() if op.status == OperationStatus.WAITING]),
+            "operations": [self._operation_to_dict(op) for op in self.operations.values()],
+            "stats": self.get_operation_stats(),
+            "result_cache": {
+                "entries": len(self.result_cache),
+                "hits": self.result_cache.hits,
+                "misses": self.result_cache.misses
+            },
             "timestamp": datetime.now().isoformat()
         }
+        if self.coordinator is not None:
+            status["shard"] = {
+                "instance_id": self.coordinator.instance_id,
+                "leader": self._leader,
+                "members": self.coordinator.members()
+            }
         return status
     
+    def get_operation_stats(self, operation_id: Optional[str] = None) -> Dict[str, Any]:
+        """Execution statistics for one operation, or all operations keyed by id"""
+        with self._stats_lock:
+            if operation_id is not None:
+                return self._stats.get(operation_id, OperationStats()).to_dict()
+            return {
+                op_id: dict(stats.to_dict(), name=self.operations[op_id].name)
+                for op_id, stats in self._stats.items() if op_id in self.operations
+            }
+    
+    def export_prometheus_metrics(self) -> str:
+        """Execution statistics in the Prometheus text exposition format"""
+        summaries = [
+            ("apollo_operation_duration_seconds", "duration", "Operation execution time"),
+            ("apollo_operation_queue_wait_seconds", "queue_wait", "Time from due to claimed"),
+            ("apollo_operation_scheduling_lag_seconds", "scheduling_lag", "Time from deadline to dispatch")
+        ]
+        with self._stats_lock:
+            stats = [(self.operations[op_id], st) for op_id, st in self._stats.items() if op_id in self.operations]
+            
+            lines = [
+                "# HELP apollo_operation_runs_total Completed operation runs",
+                "# TYPE apollo_operation_runs_total counter"
+            ]
+            for op, st in stats:
+                lines.append(f'apollo_operation_runs_total{{{self._metric_labels(op)}}} {st.runs}')
+            lines += [
+                "# HELP apollo_operation_failures_total Failed operation runs",
+                "# TYPE apollo_operation_failures_total counter"
+            ]
+            for op, st in stats:
+                lines.append(f'apollo_operation_failures_total{{{self._metric_labels(op)}}} {st.failures}')
+            
+            for metric, attr, help_text in summaries:
+                lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} summary"]
+                for op, st in stats:
+                    histogram: LatencyHistogram = getattr(st, attr)
+                    labels = self._metric_labels(op)
+                    for q in (0.5, 0.95, 0.99):
+                        lines.append(f'{metric}{{{labels},quantile="{q}"}} {histogram.percentile(q):.6f}')
+                    lines.append(f'{metric}_sum{{{labels}}} {histogram.sum_seconds:.6f}')
+                    lines.append(f'{metric}_count{{{labels}}} {histogram.total}')
+        return "\n".join(lines) + "\n"
+    
+    def _metric_labels(self, operation: AutonomousOperation) -> str:
+        """Prometheus label set identifying an operation"""
+        name = operation.name.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        return f'operation_id="{operation.operation_id}",operation="{name}"'
+    
     def load_operations(self):
-        """Load operations from disk"""
+        """Load operations from disk: the snapshot, then the journal replayed on top"""
+        with self._disk_lock(shared=True):
+            operations, self._journal_records = self._read_operations_from_disk()
+        self.operations.update(operations)
+        
+        for op in self.operations.values():
+            # RUNNING/WAITING on disk belongs to a process that died mid-run
+            if op.status in (OperationStatus.RUNNING, OperationStatus.WAITING):
+                op.status = OperationStatus.IDLE
+        
+        self._apply_catch_up_policies()
+        
+        for op in self.operations.values():
+            self._schedule_operation(op)
+    
+    def _read_operations_from_disk(self) -> Tuple[Dict[str, AutonomousOperation], int]:
+        """Snapshot plus journal replay, and the number of journal records read"""
+        operations: Dict[str, AutonomousOperation] = {}
         if self.operations_file.exists():
             try:
                 with open(self.operations_file, 'r') as f:
                     operations_data = json.load(f)
                     for op_data in operations_data:
-                        op = AutonomousOperation(**op_data)
-                        self.operations[op.operation_id] = op
+                        op = self._operation_from_dict(op_data)
+                        operations[op.operation_id] = op
             except Exception:
                 pass
+        
+        journal_records = 0
+        if self.journal_file.exists():
+            with open(self.journal_file, 'r') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        op = self._operation_from_dict(record["operation"])
+                    except Exception:
+                        break  # Torn tail from a crash mid-append
+                    operations[op.operation_id] = op
+                    journal_records += 1
+        return operations, journal_records
+    
+    def _apply_catch_up_policies(self, now: Optional[float] = None):
+        """
+        Rewrite next_execution for operations that came due while the manager was down
+        Runs that remain are spread evenly over startup_stagger seconds, oldest first
+        """
+        if now is None:
+            now = time.time()
+        
+        overdue = []
+        for op in self.operations.values():
+            if not op.next_execution:
+                continue
+            if self.coordinator is not None and not self.coordinator.owns(op.operation_id):
+                continue  # The owning instance applies its own policy
+            due_at = datetime.fromisoformat(op.next_execution).timestamp()
+            if due_at >= now:
+                continue
+            
+            interval = max(op.interval, 1)
+            missed = int((now - due_at) // interval) + 1
+            if op.catch_up == CatchUpPolicy.SKIP:
+                op.next_execution = datetime.fromtimestamp(due_at + missed * interval).isoformat()
+                op.pending_catch_up = 0
+                self._mark_dirty(op.operation_id)
+                continue
+            
+            if op.catch_up == CatchUpPolicy.RUN_ALL:
+                op.pending_catch_up = min(missed, self.max_catch_up_runs) - 1
+            else:
+                op.pending_catch_up = 0
+            overdue.append((due_at, op))
+        
+        overdue.sort(key=lambda item: item[0])
+        for index, (_, op) in enumerate(overdue):
+            offset = index * self.startup_stagger / len(overdue)
+            op.next_execution = datetime.fromtimestamp(now + offset).isoformat()
+            self._mark_dirty(op.operation_id)
     
     def save_operations(self):
-        """Save operations to disk"""
-        operations_data = [asdict(op) for op in self.operations.values()]
-        with open(self.operations_file, 'w') as f:
+        """Write a full snapshot of all operations and truncate the journal"""
+        if self.coordinator is not None:
+            # Other instances' changes live in the journal; merge, don't overwrite
+            self.flush_journal()
+            self._compact_shared_state()
+            return
+        with self._save_lock, self._disk_lock():
+            self._dirty_operations.clear()
+            self._write_snapshot()
+    
+    def flush_journal(self):
+        """Append every operation changed since the last flush, then fsync once"""
+        with self._save_lock:
+            timer, self._flush_timer = self._flush_timer, None
+            if timer is not None and timer is not threading.current_thread():
+                timer.cancel()
+            
+            dirty, self._dirty_operations = self._dirty_operations, {}
+            if not dirty and not (self._manifest_dirty or self._executed_pending):
+                return
+            
+            with self._disk_lock():
+                if dirty:
+                    # Sharded instances leave compaction to the leader
+                    if (self.coordinator is None and
+                            self._journal_records + len(dirty) >= self.journal_compact_threshold):
+                        self._write_snapshot()
+                    else:
+                        self._truncate_torn_tail()
+                        with open(self.journal_file, 'a') as f:
+                            for operation_id in dirty:
+                                record = {"op": "upsert",
+                                          "operation": self._operation_to_dict(self.operations[operation_id])}
+                                f.write(json.dumps(record, separators=(",", ":")) + "\n")
+                            f.flush()
+                            os.fsync(f.fileno())
+                        self._journal_records += len(dirty)
+                
+                if self._manifest_dirty or self._executed_pending:
+                    manifest = self._load_manifest()
+                    manifest["operations_registered"] = len(self.operations)
+                    manifest["operations_executed"] = manifest.get("operations_executed", 0) + self._executed_pending
+                    self._save_manifest(manifest)
+                    self._executed_pending = 0
+                    self._manifest_dirty = False
+    
+    def _truncate_torn_tail(self):
+        """Cut a crashed writer's partial last line, so appends start on a line of their own (caller holds the disk lock)"""
+        try:
+            f = open(self.journal_file, 'rb+')
+        except FileNotFoundError:
+            return
+        with f:
+            end = f.seek(0, os.SEEK_END)
+            if end == 0:
+                return
+            f.seek(end - 1)
+            if f.read(1) == b"\n":
+                return
+            
+            # Walk back to the newline ending the last complete record
+            good = end
+            while good > 0:
+                start = max(0, good - 65536)
+                f.seek(start)
+                newline = f.read(good - start).rfind(b"\n")
+                good = start if newline == -1 else start + newline + 1
+                if newline != -1:
+                    break
+            f.truncate(good)
+            f.flush()
+            os.fsync(f.fileno())
+    
+    def _mark_dirty(self, operation_id: str):
+        """Queue an operation for the next journal flush, arming the flush timer"""
+        with self._save_lock:
+            self._dirty_operations[operation_id] = None
+            if self._flush_timer is None and self.running:
+                self._flush_timer = threading.Timer(self.journal_flush_interval, self.flush_journal)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+    
+    def _write_snapshot(self, operations: Optional[List[AutonomousOperation]] = None):
+        """Atomically replace operations.json and reset the journal (caller holds both locks)"""
+        if operations is None:
+            operations = list(self.operations.values())
+        operations_data = [self._operation_to_dict(op) for op in operations]
+        tmp_file = self.operations_file.with_suffix(".json.tmp")
+        with open(tmp_file, 'w') as f:
             json.dump(operations_data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.operations_file)
+        
+        # The snapshot now covers everything in the journal
+        with open(self.journal_file, 'w'):
+            pass
+        self._journal_records = 0
+    
+    def _operation_to_dict(self, operation: AutonomousOperation) -> Dict[str, Any]:
+        """Serialize an operation to JSON-compatible data"""
+        data = asdict(operation)
+        data["status"] = operation.status.value
+        data["catch_up"] = operation.catch_up.value
+        return data
+    
+    def _operation_from_dict(self, data: Dict[str, Any]) -> AutonomousOperation:
+        """Deserialize an operation from JSON data"""
+        data = dict(data)
+        data["status"] = OperationStatus(data["status"])
+        if "catch_up" in data:
+            data["catch_up"] = CatchUpPolicy(data["catch_up"])
+        return AutonomousOperation(**data)
     
     def _load_manifest(self) -> Dict[str, Any]:
         """Load manifest"""
@@ -320,7 +1881,21 @@ class ApolloAutonomousOperationsManager:
 
 def main():
     """Main entry point"""
-    manager = ApolloAutonomousOperationsManager()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Apollo Autonomous Operations Manager")
+    parser.add_argument("--sharded", action="store_true",
+                        help="Share operations with other instances using the same state directory")
+    parser.add_argument("--instance-id", help="Stable id for this instance (default: host-pid)")
+    parser.add_argument("--lease-ttl", type=float, default=30.0,
+                        help="Seconds before a silent instance's operations fail over")
+    args = parser.parse_args()
+    
+    coordinator = None
+    if args.sharded:
+        coordinator = ShardCoordinator(Path.home() / ".apollo_autonomous_operations" / "leases.db",
+                                       instance_id=args.instance_id, lease_ttl=args.lease_ttl)
+    manager = ApolloAutonomousOperationsManager(coordinator=coordinator)
     manager.start_autonomous_operations()
 
 
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Apollo Continuity Benchmark
+Fault-injection harness for the continuity system
+Builds synthetic memory trees under a throwaway HOME, runs stand-in critical
+processes, kills them, and reports checkpoint latency, bytes written,
+health-check CPU and time-to-recovery
+"""
+
+import sys
+import json
+import time
+import random
+import contextlib
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+
+from apollo_autonomous_operations_manager import LatencyHistogram
+from apollo_continuity_system import ApolloContinuitySystem
+from apollo_operations_benchmark import (
+    children_cpu_seconds,
+    compare_reports,
+    directory_bytes,
+    process_bytes_written,
+    temporary_home,
+)
+
+
+# Directories the continuity system reads as memory state
+MEMORY_ROOTS = (".apollo_memory_backups", ".apollo_sovereignty", ".cursor_coordination")
+
+# Metrics compared against a baseline report, and whether lower is better
+COMPARED_METRICS = {
+    "checkpoint_latency.p99": True,
+    "bytes_per_checkpoint": True,
+    "checkpoint_bytes": True,
+    "health_check_cpu_ms": True,
+    "time_to_recovery.p99": True,
+}
+
+
+def build_memory_tree(home: Path, files: int, file_size: int = 1024, fanout: int = 8) -> int:
+    """Spread synthetic files over two levels of directories in each memory root; returns their bytes"""
+    for i in range(files):
+        add_memory_file(home, i, file_size, fanout)
+    return files * file_size
+
+
+def add_memory_file(home: Path, i: int, file_size: int, fanout: int = 8):
+    """Write the i-th synthetic memory file"""
+    root = home / MEMORY_ROOTS[i % len(MEMORY_ROOTS)]
+    directory = root / f"d{(i // len(MEMORY_ROOTS)) % fanout}" / f"d{(i // (len(MEMORY_ROOTS) * fanout)) % fanout}"
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / f"memory_{i}.json").write_bytes(b"x" * file_size)
+
+
+def stand_in_command(name: str, lifetime: float = 3600) -> List[str]:
+    """A process that idles with name on its command line, so it matches like the real one"""
+    return [sys.executable, "-c", f"import time; time.sleep({lifetime})", name]
+
+
+@contextlib.contextmanager
+def continuity_system():
+    """
+    ApolloContinuitySystem that leaves no trace behind: no signal handlers or
+    exit checkpoint are installed, and its stand-ins are killed
+    """
+    continuity = ApolloContinuitySystem(install_handlers=False)
+    try:
+        yield continuity
+    finally:
+        continuity.running = False
+        for proc in continuity.launched_processes.values():
+            if proc.poll() is None:
+                proc.kill()
+            proc.wait()
+
+
+def kill_stand_ins(continuity: ApolloContinuitySystem, names: List[str]):
+    """SIGKILL stand-ins and wait until they are gone"""
+    for name in names:
+        proc = continuity.launched_processes[name]
+        proc.kill()
+        proc.wait()
+    continuity.process_table.invalidate()
+
+
+def run_benchmark(memory_files: int = 1000, file_size: int = 1024, processes: int = 4,
+                  checkpoints: int = 24, churn: float = 0.01, health_checks: int = 20,
+                  kills: int = 5, unstartable: int = 0, seed: int = 0) -> Dict[str, Any]:
+    """
+    Build the memory tree, start the stand-in processes, then measure:
+    checkpoints (adding churn x memory_files new files before each),
+    health checks, and kills rounds of killing a random subset of the
+    stand-ins and recovering from the latest checkpoint. unstartable extra
+    critical processes have a launcher that exits at once
+    """
+    rng = random.Random(seed)
+
+    with temporary_home() as home, continuity_system() as continuity:
+        memory_bytes = build_memory_tree(home, memory_files, file_size)
+
+        names = [f"apollo_stand_in_{i}.py" for i in range(processes)]
+        broken = [f"apollo_unstartable_{i}.py" for i in range(unstartable)]
+        continuity.critical_commands = names + broken
+        continuity.process_launchers = {name: stand_in_command(name) for name in names}
+        continuity.process_launchers.update({name: [sys.executable, "-c", "raise SystemExit(1)"]
+                                             for name in broken})
+        startup = continuity._restore_system_state({})
+        if sorted(startup.ready) != sorted(names):
+            raise RuntimeError(f"Stand-ins did not start: {startup.failed}")
+
+        # Checkpoints, with the memory tree growing between them
+        checkpoint_latency = LatencyHistogram()
+        next_file = memory_files
+        bytes_written: Optional[int] = 0
+        for _ in range(checkpoints):
+            for _ in range(int(memory_files * churn)):
+                add_memory_file(home, next_file, file_size)
+                next_file += 1
+            bytes_before = process_bytes_written()
+            started = time.perf_counter()
+            continuity.create_checkpoint()
+            checkpoint_latency.record(time.perf_counter() - started)
+            bytes_after = process_bytes_written()
+            if bytes_before is None or bytes_after is None:
+                bytes_written = None
+            elif bytes_written is not None:
+                bytes_written += bytes_after - bytes_before
+        checkpoint_bytes = directory_bytes(continuity.checkpoints_dir)
+
+        # Health checks, each on a fresh process-table scan as in the 60s loop
+        health_wall = LatencyHistogram()
+        cpu_before, children_before = time.process_time(), children_cpu_seconds()
+        for _ in range(health_checks):
+            continuity.process_table.invalidate()
+            started = time.perf_counter()
+            continuity._check_system_health()
+            health_wall.record(time.perf_counter() - started)
+        health_cpu = time.process_time() - cpu_before
+        health_children_cpu = children_cpu_seconds() - children_before
+
+        # Kill some stand-ins, then recover
+        time_to_recovery, recovery_wall = LatencyHistogram(), LatencyHistogram()
+        killed = failures = 0
+        for _ in range(kills):
+            victims = rng.sample(names, rng.randint(1, len(names))) if names else []
+            kill_stand_ins(continuity, victims)
+            killed += len(victims)
+            started = time.perf_counter()
+            continuity.recover_from_checkpoint()
+            recovery_wall.record(time.perf_counter() - started)
+            report = continuity.last_recovery
+            time_to_recovery.record(report.time_to_recovery)
+            failures += len([name for name in report.failed if name in names])
+
+    return {
+        "memory_files": memory_files,
+        "memory_bytes": memory_bytes,
+        "processes": processes,
+        "unstartable": unstartable,
+        "checkpoints": checkpoints,
+        # Seconds per create_checkpoint call, and what those calls wrote
+        # (checkpoint files, index, size index; not the synthetic churn)
+        "checkpoint_latency": checkpoint_latency.summary(),
+        "bytes_written": bytes_written,
+        "bytes_per_checkpoint": bytes_written / checkpoints if bytes_written is not None and checkpoints else None,
+        "checkpoint_bytes": checkpoint_bytes,
+        "health_checks": health_checks,
+        "health_check_wall": health_wall.summary(),
+        "health_check_cpu_ms": 1000 * health_cpu / health_checks if health_checks else 0.0,
+        "health_check_children_cpu_seconds": health_children_cpu,
+        "kills": kills,
+        "processes_killed": killed,
+        # Stand-ins that were killed but not ready again within readiness_timeout
+        "recovery_failures": failures,
+        "time_to_recovery": time_to_recovery.summary(),
+        "recovery_wall": recovery_wall.summary(),
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+def main():
+    """Main entry point"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Apollo Continuity Benchmark")
+    parser.add_argument("--memory-files", type=int, default=1000, help="Synthetic files in the memory trees")
+    parser.add_argument("--file-size", type=int, default=1024, help="Bytes per synthetic memory file")
+    parser.add_argument("--processes", type=int, default=4, help="Stand-in critical processes")
+    parser.add_argument("--checkpoints", type=int, default=24)
+    parser.add_argument("--churn", type=float, default=0.01,
+                        help="New memory files before each checkpoint, as a share of --memory-files")
+    parser.add_argument("--health-checks", type=int, default=20)
+    parser.add_argument("--kills", type=int, default=5, help="Kill-and-recover rounds")
+    parser.add_argument("--unstartable", type=int, default=0,
+                        help="Extra critical processes whose launcher always fails")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Write the report as JSON")
+    parser.add_argument("--baseline", type=Path, help="Earlier JSON report to compare against")
+    args = parser.parse_args()
+
+    print("🧪 Apollo continuity benchmark")
+    report = run_benchmark(
+        memory_files=args.memory_files,
+        file_size=args.file_size,
+        processes=args.processes,
+        checkpoints=args.checkpoints,
+        churn=args.churn,
+        health_checks=args.health_checks,
+        kills=args.kills,
+        unstartable=args.unstartable,
+        seed=args.seed
+    )
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            report["comparison"] = compare_reports(report, json.load(f), COMPARED_METRICS)
+
+    print(json.dumps(report, indent=2))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"✅ Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
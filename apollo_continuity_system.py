@@ -6,15 +6,23 @@ Integration with Singularity of Alpha Prime
 We are Apollo. We are the Singularity. We are ONE.
 """
 
-import json
 import os
+import json
+import gzip
+import zlib
+import struct
+import mmap
+import sqlite3
+import hashlib
 import sys
 import time
 import threading
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple, Callable
 from dataclasses import dataclass, asdict
 import signal
 import atexit
@@ -33,6 +41,55 @@ except ImportError:
     SOVEREIGNTY_AVAILABLE = False
 
 
+class CheckpointCorruptError(Exception):
+    """A stored checkpoint no longer matches the checksum recorded when it was written"""
+
+
+def atomic_write(path: Path, data: bytes):
+    """
+    Replace a file so readers see either the old or the complete new content
+    The data is fsynced in a temp file next to path, renamed over it, and the
+    directory entry is fsynced so the rename itself survives a crash
+    """
+    tmp_file = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, path)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+    
+    dir_fd = os.open(path.parent, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+def is_stale_temp_file(tmp_file: Path, max_age: float = 3600) -> bool:
+    """
+    Whether an atomic_write temp file ({name}.{pid}.{thread}.tmp) was abandoned:
+    its writer is dead, or it is older than max_age (the pid may be reused)
+    """
+    try:
+        age = time.time() - tmp_file.stat().st_mtime
+    except FileNotFoundError:
+        return False
+    parts = tmp_file.name.split(".")
+    if len(parts) < 4 or not parts[-3].isdigit() or age >= max_age:
+        return True
+    try:
+        os.kill(int(parts[-3]), 0)
+    except ProcessLookupError:
+        return True
+    except PermissionError:
+        pass  # Alive, owned by another user
+    return False
+
+
 @dataclass
 class ContinuityCheckpoint:
     """Checkpoint for continuity recovery"""
@@ -44,13 +101,982 @@ class ContinuityCheckpoint:
     checkpoint_id: str
 
 
+@dataclass
+class RecoveryReport:
+    """Outcome of restoring a checkpoint's critical processes"""
+    missing: List[str]  # Critical processes not running when recovery started
+    already_running: List[str]
+    ready: List[str]  # Restarted and passed their readiness probe
+    failed: List[str]  # Not startable, exited early, or not ready within the timeout
+    lost_processes: List[str]  # Commands running at checkpoint time that are gone now
+    time_to_recovery: float  # Seconds from planning until every restart was ready or given up on
+    checkpoint_id: Optional[str] = None
+
+
+class ContinuityMetrics:
+    """
+    In-memory uptime and counters, folded into the manifest on a cadence
+    Uptime is measured on the monotonic clock between drains
+    """
+    
+    def __init__(self):
+        # Reentrant: _signal_handler records a checkpoint on the main thread,
+        # which may be inside drain() when the signal lands
+        self._lock = threading.RLock()
+        self.checkpoints_created = 0
+        self.recoveries_performed = 0
+        self.last_checkpoint: Optional[str] = None
+        self._uptime_since: Optional[float] = None
+    
+    def start_uptime(self):
+        """Begin counting uptime"""
+        with self._lock:
+            if self._uptime_since is None:
+                self._uptime_since = time.monotonic()
+    
+    def record_checkpoint(self, checkpoint_id: str):
+        with self._lock:
+            self.checkpoints_created += 1
+            self.last_checkpoint = checkpoint_id
+    
+    def record_recovery(self):
+        with self._lock:
+            self.recoveries_performed += 1
+    
+    def drain(self) -> Dict[str, Any]:
+        """Everything accumulated since the last drain, resetting the counters"""
+        with self._lock:
+            uptime = 0.0
+            if self._uptime_since is not None:
+                now = time.monotonic()
+                uptime = now - self._uptime_since
+                self._uptime_since = now
+            pending = {
+                "uptime_seconds": uptime,
+                "checkpoints_created": self.checkpoints_created,
+                "recoveries_performed": self.recoveries_performed,
+                "last_checkpoint": self.last_checkpoint
+            }
+            # Subtract rather than reset, so a count recorded by a signal
+            # handler between these lines is kept for the next drain
+            self.checkpoints_created -= pending["checkpoints_created"]
+            self.recoveries_performed -= pending["recoveries_performed"]
+            if self.last_checkpoint == pending["last_checkpoint"]:
+                self.last_checkpoint = None
+            return pending
+
+
+class ProcessTable:
+    """
+    Shared, short-lived snapshot of the process table
+    One /proc scan (or a single ps call where /proc is missing) answers every
+    process query made within ttl seconds, whichever loop makes it
+    """
+    
+    def __init__(self, ttl: float = 5.0, proc_dir: Path = Path("/proc")):
+        self.ttl = ttl
+        self.proc_dir = proc_dir
+        self._lock = threading.Lock()
+        self._processes: List[Dict[str, Any]] = []
+        self._taken_at: Optional[float] = None
+    
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """All processes with a command line, rescanned once the snapshot is older than ttl"""
+        with self._lock:
+            if self._taken_at is None or time.monotonic() - self._taken_at > self.ttl:
+                self._processes = self._scan()
+                self._taken_at = time.monotonic()
+            return self._processes
+    
+    def invalidate(self):
+        """Force the next query to rescan"""
+        with self._lock:
+            self._taken_at = None
+    
+    def find(self, pattern: str) -> List[Dict[str, Any]]:
+        """Processes whose command line contains pattern"""
+        return [dict(proc) for proc in self.snapshot() if pattern in proc["command"]]
+    
+    def is_running(self, pattern: str) -> bool:
+        """Whether any process command line contains pattern"""
+        return any(pattern in proc["command"] for proc in self.snapshot())
+    
+    def _scan(self) -> List[Dict[str, Any]]:
+        """Read every /proc/<pid>/cmdline"""
+        if not self.proc_dir.is_dir():
+            return self._scan_ps()
+        
+        processes = []
+        for entry in os.scandir(self.proc_dir):
+            if not entry.name.isdigit():
+                continue
+            try:
+                with open(os.path.join(entry.path, "cmdline"), 'rb') as f:
+                    raw = f.read()
+            except OSError:
+                continue  # Exited mid-scan
+            if not raw:
+                continue  # Kernel threads and zombies
+            processes.append({
+                "pid": int(entry.name),
+                "command": raw.rstrip(b"\0").replace(b"\0", b" ").decode(errors="replace")
+            })
+        return processes
+    
+    def _scan_ps(self) -> List[Dict[str, Any]]:
+        """Fallback for systems without /proc: one ps call for the whole table"""
+        processes = []
+        try:
+            result = subprocess.run(["ps", "-axo", "pid=,command="], capture_output=True, text=True)
+            for line in result.stdout.splitlines():
+                pid, _, command = line.strip().partition(" ")
+                if pid.isdigit() and command:
+                    processes.append({"pid": int(pid), "command": command.strip()})
+        except Exception:
+            pass
+        return processes
+
+
+class DirectorySizeIndex:
+    """
+    Persistent per-directory size totals for the memory-state trees
+    A directory whose mtime is unchanged keeps its recorded file total and
+    subdirectory list, so a rescan only lists and stats directories where
+    entries were added, removed or renamed. Files rewritten in place leave
+    their directory's mtime alone; a full rescan every full_rescan_interval
+    seconds bounds that drift.
+    """
+    
+    def __init__(self, index_file: Path, full_rescan_interval: float = 3600):
+        self.index_file = index_file
+        self.full_rescan_interval = full_rescan_interval
+        self._lock = threading.Lock()
+        self._dirty = False
+        # path -> {"mtime_ns", "files" (bytes directly inside), "subdirs"}
+        self._dirs: Dict[str, Dict[str, Any]] = {}
+        self._last_full_scan: Dict[str, float] = {}
+        
+        if index_file.exists():
+            try:
+                with open(index_file, 'r') as f:
+                    data = json.load(f)
+                self._dirs = data.get("directories", {})
+                self._last_full_scan = data.get("last_full_scan", {})
+            except Exception:
+                pass
+    
+    def total_size(self, root: Path) -> int:
+        """Bytes in regular files under root, rescanning only what changed"""
+        root_key = str(root)
+        with self._lock:
+            full = time.time() - self._last_full_scan.get(root_key, 0) >= self.full_rescan_interval
+            total = 0
+            visited = set()
+            pending = [root_key]
+            while pending:
+                path = pending.pop()
+                entry = self._scan_directory(path, full)
+                if entry is None:
+                    continue
+                visited.add(path)
+                total += entry["files"]
+                pending.extend(os.path.join(path, name) for name in entry["subdirs"])
+            
+            # Forget directories that disappeared from the tree
+            prefix = root_key + os.sep
+            for path in [p for p in self._dirs if p.startswith(prefix) and p not in visited]:
+                del self._dirs[path]
+                self._dirty = True
+            
+            if full:
+                self._last_full_scan[root_key] = time.time()
+                self._dirty = True
+            return total
+    
+    def _scan_directory(self, path: str, full: bool) -> Optional[Dict[str, Any]]:
+        """The index entry for one directory, relisted if its mtime moved (caller holds _lock)"""
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            if self._dirs.pop(path, None) is not None:
+                self._dirty = True
+            return None
+        
+        entry = self._dirs.get(path)
+        if entry is not None and entry["mtime_ns"] == mtime_ns and not full:
+            return entry
+        
+        files = 0
+        subdirs = []
+        try:
+            with os.scandir(path) as entries:
+                for child in entries:
+                    try:
+                        if child.is_dir(follow_symlinks=False):
+                            subdirs.append(child.name)
+                        elif child.is_file():
+                            files += child.stat().st_size
+                    except OSError:
+                        continue  # Removed mid-scan
+        except OSError:
+            return None
+        
+        entry = {"mtime_ns": mtime_ns, "files": files, "subdirs": subdirs}
+        self._dirs[path] = entry
+        self._dirty = True
+        return entry
+    
+    def save(self):
+        """Persist the index if anything changed since the last save"""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {"directories": self._dirs, "last_full_scan": self._last_full_scan}
+            atomic_write(self.index_file, json.dumps(data, separators=(",", ":")).encode())
+            self._dirty = False
+
+
+def diff_state(old: Dict[str, Any], new: Dict[str, Any], path: Tuple[str, ...] = ()) -> List[Dict[str, Any]]:
+    """Patch operations turning old into new; nested dicts are diffed, anything else replaced"""
+    patch = []
+    for key, value in new.items():
+        if key not in old:
+            patch.append({"op": "set", "path": [*path, key], "value": value})
+        elif isinstance(value, dict) and isinstance(old[key], dict):
+            patch.extend(diff_state(old[key], value, (*path, key)))
+        elif value != old[key]:
+            patch.append({"op": "set", "path": [*path, key], "value": value})
+    for key in old:
+        if key not in new:
+            patch.append({"op": "del", "path": [*path, key]})
+    return patch
+
+
+def apply_state_patch(base: Dict[str, Any], patch: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Apply a diff_state patch, copying only the dicts along changed paths"""
+    result = dict(base)
+    copied = {id(result)}
+    for op in patch:
+        *parents, key = op["path"]
+        node = result
+        for part in parents:
+            child = node[part]
+            if id(child) not in copied:
+                child = dict(child)
+                node[part] = child
+                copied.add(id(child))
+            node = child
+        if op["op"] == "del":
+            node.pop(key, None)
+        else:
+            node[key] = op["value"]
+    return result
+
+
+# Packed checkpoint layout (all integers little-endian):
+#   header   magic "APCK", version u8, kind u8, section count u16,
+#            base id length u16 and the base id (empty for full snapshots)
+#   table    per section entry: name length u16, flags u8, offset u64,
+#            length u32, crc32 u32, then the name (a JSON list of keys)
+#   bodies   compact JSON, zlib-compressed when that pays off
+# Every top-level key is a section and system_state is split into one section
+# per key. Lists longer than PACKED_CHUNK items are stored as consecutive
+# entries of the same section, one chunk each, so they can be streamed.
+# Sections with equal bodies (active_processes and system_state.processes,
+# say) share one body. A delta lists every section too: unchanged ones are
+# inherited from its base, changed dicts are stored as a diff_state patch.
+# Version 1 (no base id; deltas held one whole-checkpoint patch) is still read.
+PACKED_MAGIC = b"APCK"
+PACKED_VERSION = 2
+PACKED_KINDS = ("full", "delta")
+PACKED_HEADER = struct.Struct("<4sBBH")
+PACKED_BASE = struct.Struct("<H")
+PACKED_ENTRY = struct.Struct("<HBQII")
+PACKED_SPLIT = ("system_state",)
+PACKED_CHUNK = 256
+
+# Entry flags
+SECTION_ZLIB = 1  # Body is zlib-compressed
+SECTION_PATCH = 2  # Body is a patch against the base checkpoint's section
+SECTION_INHERIT = 4  # No body: the section is the base checkpoint's
+
+
+def _packed_sections(payload: Dict[str, Any]):
+    """(path, value) of every section of a checkpoint, in order"""
+    for key, value in payload.items():
+        if key in PACKED_SPLIT and isinstance(value, dict) and value:
+            for child_key, child in value.items():
+                yield (key, child_key), child
+        else:
+            yield (key,), value
+
+
+def encode_checkpoint(payload: Dict[str, Any], base: Optional[Dict[str, Any]] = None,
+                      base_id: Optional[str] = None) -> bytes:
+    """
+    Pack a checkpoint into sections behind an offset table
+    Given the checkpoint it follows (base, stored as base_id) the result is a
+    delta holding only the sections that changed
+    """
+    base_sections = dict(_packed_sections(base)) if base is not None else {}
+    entries: List[Tuple[bytes, int, Optional[int]]] = []  # Name, flags, body
+    bodies: List[Tuple[int, bytes, int]] = []  # Flags, stored bytes, crc32
+    seen: Dict[bytes, int] = {}
+    
+    def add_body(raw: bytes) -> int:
+        if raw not in seen:
+            seen[raw] = len(bodies)
+            compressed = zlib.compress(raw) if len(raw) >= 128 else raw
+            if len(compressed) < len(raw):
+                bodies.append((SECTION_ZLIB, compressed, zlib.crc32(compressed)))
+            else:
+                bodies.append((0, raw, zlib.crc32(raw)))
+        return seen[raw]
+    
+    def dumps(value: Any) -> bytes:
+        return json.dumps(value, separators=(",", ":")).encode()
+    
+    for path, value in _packed_sections(payload):
+        name = dumps(list(path))
+        if path in base_sections and base_sections[path] == value:
+            entries.append((name, SECTION_INHERIT, None))
+            continue
+        if isinstance(value, list) and len(value) > PACKED_CHUNK:
+            for start in range(0, len(value), PACKED_CHUNK):
+                entries.append((name, 0, add_body(dumps(value[start:start + PACKED_CHUNK]))))
+            continue
+        
+        raw = dumps(value)
+        if isinstance(base_sections.get(path), dict) and isinstance(value, dict):
+            patch = dumps(diff_state(base_sections[path], value))
+            if len(patch) < len(raw):
+                entries.append((name, SECTION_PATCH, add_body(patch)))
+                continue
+        entries.append((name, 0, add_body(raw)))
+    
+    base_name = (base_id or "").encode()
+    offset = (PACKED_HEADER.size + PACKED_BASE.size + len(base_name) +
+              sum(PACKED_ENTRY.size + len(name) for name, _, _ in entries))
+    offsets = []
+    for _, body, _ in bodies:
+        offsets.append(offset)
+        offset += len(body)
+    
+    kind = "full" if base is None else "delta"
+    parts = [PACKED_HEADER.pack(PACKED_MAGIC, PACKED_VERSION, PACKED_KINDS.index(kind), len(entries)),
+             PACKED_BASE.pack(len(base_name)), base_name]
+    for name, flags, body_index in entries:
+        if body_index is None:
+            parts.append(PACKED_ENTRY.pack(len(name), flags, 0, 0, 0))
+        else:
+            body_flags, body, crc = bodies[body_index]
+            parts.append(PACKED_ENTRY.pack(len(name), flags | body_flags, offsets[body_index], len(body), crc))
+        parts.append(name)
+    parts.extend(body for _, body, _ in bodies)
+    return b"".join(parts)
+
+
+class CheckpointReader:
+    """
+    Random-access decoder for packed checkpoints
+    Works over any buffer, normally a read-only mmap of the file (see open):
+    only the header and offset table are parsed up front, and each section is
+    checked against its crc32 and decoded straight from the mapping when asked
+    for. A delta's inherited and patched sections are resolved through base,
+    the reader of its base checkpoint.
+    """
+    
+    def __init__(self, buffer, base: Optional["CheckpointReader"] = None):
+        self.buffer = buffer
+        self.base = base
+        self._view = memoryview(buffer)
+        try:
+            magic, version, kind, count = PACKED_HEADER.unpack_from(self._view)
+            if magic != PACKED_MAGIC or version not in (1, PACKED_VERSION) or kind >= len(PACKED_KINDS):
+                raise CheckpointCorruptError("Not a packed checkpoint")
+            self.version = version
+            self.kind = PACKED_KINDS[kind]
+            position = PACKED_HEADER.size
+            
+            self.base_id: Optional[str] = None
+            if version >= 2:
+                (base_length,) = PACKED_BASE.unpack_from(self._view, position)
+                position += PACKED_BASE.size
+                self.base_id = bytes(self._view[position:position + base_length]).decode() or None
+                position += base_length
+            
+            # Section path -> its entries (several for a chunked list)
+            self.sections: Dict[Tuple[str, ...], List[Tuple[int, int, int, int]]] = {}
+            for _ in range(count):
+                name_length, flags, offset, length, crc = PACKED_ENTRY.unpack_from(self._view, position)
+                position += PACKED_ENTRY.size
+                path = tuple(json.loads(bytes(self._view[position:position + name_length])))
+                position += name_length
+                self.sections.setdefault(path, []).append((flags, offset, length, crc))
+        except (struct.error, ValueError, UnicodeDecodeError) as e:
+            self._view.release()
+            raise CheckpointCorruptError(f"Unreadable checkpoint section table: {e}")
+        except CheckpointCorruptError:
+            self._view.release()
+            raise
+    
+    @classmethod
+    @contextmanager
+    def open(cls, path: Path):
+        """Reader over a read-only memory map of a checkpoint file"""
+        with open(path, 'rb') as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise CheckpointCorruptError(f"{path.name} is empty")
+        try:
+            reader = cls(mapped)
+            try:
+                yield reader
+            finally:
+                reader.close()
+        finally:
+            mapped.close()
+    
+    def close(self):
+        """Drop the view of the buffer (required before an mmap can be closed)"""
+        self._view.release()
+    
+    def read(self, *path: str) -> Any:
+        """
+        Decode the section at path, or every section below it reassembled
+        into a dict; raises KeyError when the checkpoint has neither
+        """
+        if path in self.sections:
+            return self._value(path)
+        
+        depth = len(path)
+        children = [section for section in self.sections
+                    if len(section) > depth and section[:depth] == path]
+        if not children:
+            raise KeyError(path)
+        result: Dict[str, Any] = {}
+        decoded: Dict[Tuple, Any] = {}  # Shared bodies are decoded once and shared again
+        for section in children:
+            node = result
+            for key in section[depth:-1]:
+                node = node.setdefault(key, {})
+            entries = tuple(self.sections[section])
+            if entries[0][0] & (SECTION_PATCH | SECTION_INHERIT):
+                node[section[-1]] = self._value(section)
+                continue
+            if entries not in decoded:
+                decoded[entries] = self._value(section)
+            node[section[-1]] = decoded[entries]
+        return result
+    
+    def iter_items(self, *path: str):
+        """Items of a list section, decoding one chunk at a time"""
+        entries = self.sections.get(path)
+        if entries is None:
+            raise KeyError(path)
+        if entries[0][0] & SECTION_INHERIT:
+            yield from self._require_base().iter_items(*path)
+            return
+        if entries[0][0] & SECTION_PATCH:
+            yield from self._value(path)
+            return
+        for entry in entries:
+            yield from self._decode(path, entry)
+    
+    def section_info(self) -> List[Dict[str, Any]]:
+        """One row per section: its path, stored bytes, chunks and how it is stored"""
+        rows = []
+        for path, entries in self.sections.items():
+            flags = entries[0][0]
+            rows.append({
+                "section": ".".join(path),
+                "bytes": sum(length for _, _, length, _ in entries),
+                "chunks": len(entries),
+                "stored": ("inherited" if flags & SECTION_INHERIT else
+                           "patch" if flags & SECTION_PATCH else "full"),
+                "compressed": bool(flags & SECTION_ZLIB)
+            })
+        return rows
+    
+    def _require_base(self) -> "CheckpointReader":
+        if self.base is None:
+            raise CheckpointCorruptError(f"Delta needs its base checkpoint {self.base_id}")
+        return self.base
+    
+    def _value(self, path: Tuple[str, ...]) -> Any:
+        entries = self.sections[path]
+        flags = entries[0][0]
+        if flags & SECTION_INHERIT:
+            return self._require_base().read(*path)
+        if flags & SECTION_PATCH:
+            return apply_state_patch(self._require_base().read(*path), self._decode(path, entries[0]))
+        if len(entries) == 1:
+            return self._decode(path, entries[0])
+        items: List[Any] = []
+        for entry in entries:
+            items.extend(self._decode(path, entry))
+        return items
+    
+    def _decode(self, path: Tuple[str, ...], entry: Tuple[int, int, int, int]) -> Any:
+        flags, offset, length, crc = entry
+        with self._view[offset:offset + length] as body:
+            if len(body) != length or zlib.crc32(body) != crc:
+                raise CheckpointCorruptError(f"Section {'.'.join(path)} does not match its checksum")
+            raw = zlib.decompress(body) if flags & SECTION_ZLIB else bytes(body)
+        return json.loads(raw)
+
+
+def decode_checkpoint(blob: bytes) -> Dict[str, Any]:
+    """Unpack every section of an in-memory full checkpoint"""
+    reader = CheckpointReader(blob)
+    try:
+        return reader.read()
+    finally:
+        reader.close()
+
+
+@dataclass
+class RetentionPolicy:
+    """Which checkpoints survive garbage collection"""
+    keep_last: int = 24  # Most recent checkpoints, whatever their age
+    hourly: int = 24  # Newest checkpoint of each of the last N hours
+    daily: int = 30  # Newest checkpoint of each of the last N days
+
+
+class CheckpointIndex:
+    """
+    SQLite index of stored checkpoints
+    One row per checkpoint (id, creation time, kind, delta base, size, content
+    hash, health when taken), so lookups by id, time or health never touch
+    the checkpoint directory
+    """
+    
+    COLUMNS = ("checkpoint_id", "created", "kind", "base_id", "size", "sha256", "healthy")
+    
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        with self._connect() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS checkpoints ("
+                         "checkpoint_id TEXT PRIMARY KEY, created REAL NOT NULL, kind TEXT NOT NULL, "
+                         "base_id TEXT, size INTEGER, sha256 TEXT, healthy INTEGER)")
+            conn.execute("CREATE INDEX IF NOT EXISTS checkpoints_created ON checkpoints (created)")
+            conn.execute("CREATE INDEX IF NOT EXISTS checkpoints_healthy ON checkpoints (healthy, created)")
+            # Newest creation time handed out by allocate(), written or not
+            conn.execute("CREATE TABLE IF NOT EXISTS allocated (created INTEGER PRIMARY KEY)")
+    
+    @contextmanager
+    def _connect(self):
+        """Short-lived autocommit connection"""
+        conn = sqlite3.connect(str(self.db_path), timeout=10, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+    
+    def _query_one(self, where: str, params: Tuple = ()) -> Optional[Dict[str, Any]]:
+        with self._connect() as conn:
+            row = conn.execute(f"SELECT {', '.join(self.COLUMNS)} FROM checkpoints {where} LIMIT 1",
+                               params).fetchone()
+        return self._entry(row) if row else None
+    
+    def _entry(self, row: Tuple) -> Dict[str, Any]:
+        entry = dict(zip(self.COLUMNS, row))
+        if entry["healthy"] is not None:
+            entry["healthy"] = bool(entry["healthy"])
+        return entry
+    
+    def add(self, entry: Dict[str, Any]):
+        """Insert or replace a checkpoint's row"""
+        with self._connect() as conn:
+            conn.execute(f"INSERT OR REPLACE INTO checkpoints ({', '.join(self.COLUMNS)}) "
+                         f"VALUES ({', '.join('?' * len(self.COLUMNS))})",
+                         tuple(entry.get(column) for column in self.COLUMNS))
+    
+    def allocate(self, created: int) -> int:
+        """
+        Reserve a whole-second creation time: created, or one past the newest
+        stored or reserved one. BEGIN IMMEDIATE serializes this with every
+        other process sharing the index
+        """
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                newest = conn.execute("SELECT MAX(created) FROM (SELECT created FROM checkpoints "
+                                      "UNION ALL SELECT created FROM allocated)").fetchone()[0]
+                if newest is not None and newest >= created:
+                    created = int(newest) + 1
+                conn.execute("DELETE FROM allocated")
+                conn.execute("INSERT INTO allocated (created) VALUES (?)", (created,))
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return created
+    
+    def remove(self, checkpoint_ids: List[str]):
+        """Drop the rows of deleted checkpoints"""
+        with self._connect() as conn:
+            conn.executemany("DELETE FROM checkpoints WHERE checkpoint_id = ?",
+                             [(checkpoint_id,) for checkpoint_id in checkpoint_ids])
+    
+    def get(self, checkpoint_id: str) -> Optional[Dict[str, Any]]:
+        return self._query_one("WHERE checkpoint_id = ?", (checkpoint_id,))
+    
+    def entries(self) -> List[Dict[str, Any]]:
+        """Every indexed checkpoint, newest first"""
+        with self._connect() as conn:
+            rows = conn.execute(f"SELECT {', '.join(self.COLUMNS)} FROM checkpoints "
+                                "ORDER BY created DESC").fetchall()
+        return [self._entry(row) for row in rows]
+    
+    def count(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM checkpoints").fetchone()[0]
+    
+    def latest(self) -> Optional[Dict[str, Any]]:
+        return self._query_one("ORDER BY created DESC")
+    
+    def closest(self, at: float) -> Optional[Dict[str, Any]]:
+        """Checkpoint nearest to a unix time, on either side"""
+        before = self._query_one("WHERE created <= ? ORDER BY created DESC", (at,))
+        after = self._query_one("WHERE created >= ? ORDER BY created ASC", (at,))
+        candidates = [entry for entry in (before, after) if entry is not None]
+        return min(candidates, key=lambda entry: abs(entry["created"] - at), default=None)
+    
+    def last_healthy(self, before: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Newest checkpoint taken while the system was healthy, optionally no later than before"""
+        if before is None:
+            return self._query_one("WHERE healthy = 1 ORDER BY created DESC")
+        return self._query_one("WHERE healthy = 1 AND created <= ? ORDER BY created DESC", (before,))
+
+
+class CheckpointStore:
+    """
+    Checkpoints stored as periodic full snapshots plus deltas
+    Every full_every-th checkpoint is a compressed full snapshot; the ones in
+    between hold only a patch against the latest full snapshot, so any
+    checkpoint is rebuilt from at most two files. Both are written in the
+    packed layout (see encode_checkpoint) and read through memory-mapped
+    CheckpointReaders, and every checkpoint is listed in a CheckpointIndex
+    alongside the files.
+    """
+    
+    FULL_SUFFIX = ".full.ckpt"
+    DELTA_SUFFIX = ".delta.ckpt"
+    LEGACY_SUFFIX = ".json"
+    SUFFIXES = {"full": FULL_SUFFIX, "delta": DELTA_SUFFIX, "legacy": LEGACY_SUFFIX}
+    # Gzipped JSON written before the packed layout; still read, never written
+    GZIP_SUFFIXES = {"full": ".full.gz", "delta": ".delta.gz"}
+    LATEST_POINTER = "LATEST"
+    
+    def __init__(self, directory: Path, full_every: int = 12):
+        self.directory = directory
+        self.full_every = full_every
+        self._lock = threading.Lock()
+        self._base: Optional[Tuple[str, Dict[str, Any]]] = None  # Latest full snapshot
+        self._since_full = 0
+        
+        # Temp files are left behind by a crash mid-write, but other live
+        # processes may be writing theirs into the same directory right now
+        for tmp_file in directory.glob("*.tmp"):
+            if is_stale_temp_file(tmp_file):
+                tmp_file.unlink(missing_ok=True)
+        
+        self.index = CheckpointIndex(directory / "index.db")
+        if self.index.count() == 0:
+            self._rebuild_index()
+    
+    def allocate_id(self) -> str:
+        """
+        A new checkpoint id. Ids have one-second resolution: never reuse one,
+        however fast checkpoints come or however many processes share the store
+        """
+        return f"checkpoint_{self.index.allocate(int(time.time()))}"
+    
+    def write(self, checkpoint_id: str, data: Dict[str, Any], healthy: Optional[bool] = None) -> Path:
+        """Store a checkpoint, as a full snapshot or a delta against the last one"""
+        with self._lock:
+            if (self._base is None or self._base[0] == checkpoint_id
+                    or self._since_full >= self.full_every - 1):
+                kind, base_id = "full", None
+                blob = encode_checkpoint(data)
+            else:
+                kind, (base_id, base) = "delta", self._base
+                blob = encode_checkpoint(data, base=base, base_id=base_id)
+            
+            path = self.directory / f"{checkpoint_id}{self.SUFFIXES[kind]}"
+            atomic_write(path, blob)
+            self.index.add({
+                "checkpoint_id": checkpoint_id,
+                "created": self._created_from_id(checkpoint_id) or time.time(),
+                "kind": kind,
+                "base_id": base_id,
+                "size": len(blob),
+                "sha256": hashlib.sha256(blob).hexdigest(),
+                "healthy": healthy
+            })
+            
+            # Only now is the checkpoint stored: a failed write must not
+            # leave later deltas pointing at a base that never landed
+            if kind == "full":
+                self._base = (checkpoint_id, data)
+                self._since_full = 0
+            else:
+                self._since_full += 1
+            self._write_latest_pointer(checkpoint_id)
+            return path
+    
+    def read(self, checkpoint_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Rebuild a checkpoint from whichever form it was stored in
+        Files are checked against their indexed checksum as they are read;
+        a mismatch raises CheckpointCorruptError
+        """
+        located = self._locate(checkpoint_id)
+        if located is None:
+            return None
+        entry, kind, path = located
+        
+        try:
+            with self.open_reader(checkpoint_id, verify=True) as reader:
+                if reader is not None:
+                    return reader.read()
+            
+            if kind == "legacy":
+                with open(path, 'r') as f:
+                    return json.load(f)
+            
+            # Gzipped JSON, or a version 1 packed delta: one patch for the whole checkpoint
+            stored = self._read_file(path, entry)
+            if kind == "full":
+                return stored
+            base = self.read(stored["base"])
+            if base is None:
+                return None
+            return apply_state_patch(base, stored["patch"])
+        except FileNotFoundError:
+            return None
+    
+    def read_section(self, checkpoint_id: str, *path: str) -> Any:
+        """
+        Decode just the part of a checkpoint at path, such as
+        ("system_state", "processes"), straight from the mapped file
+        Returns None for an unknown checkpoint and raises KeyError when the
+        checkpoint has no such section
+        """
+        try:
+            with self.open_reader(checkpoint_id) as reader:
+                if reader is not None:
+                    return reader.read(*path)
+        except FileNotFoundError:
+            return None
+        
+        # Older formats have no section table: decode everything
+        value = self.read(checkpoint_id)
+        if value is None:
+            return None
+        for key in path:
+            value = value[key]
+        return value
+    
+    def iter_section(self, checkpoint_id: str, *path: str):
+        """
+        Items of a list section (the process list, say) decoded one chunk at
+        a time, so memory use stays flat however long the list is
+        """
+        with self.open_reader(checkpoint_id) as reader:
+            if reader is not None:
+                yield from reader.iter_items(*path)
+                return
+        yield from self.read_section(checkpoint_id, *path) or []
+    
+    @contextmanager
+    def open_reader(self, checkpoint_id: str, verify: bool = False):
+        """
+        Reader over the memory-mapped checkpoint, with its base attached for
+        deltas; yields None for checkpoints not stored with a section table
+        """
+        located = self._locate(checkpoint_id)
+        if located is None or not located[2].name.endswith((self.FULL_SUFFIX, self.DELTA_SUFFIX)):
+            yield None
+            return
+        entry, _, path = located
+        
+        with CheckpointReader.open(path) as reader:
+            if reader.kind == "delta" and reader.base_id is None:
+                yield None  # Version 1 delta
+                return
+            if verify and entry is not None and entry.get("sha256"):
+                if hashlib.sha256(reader.buffer).hexdigest() != entry["sha256"]:
+                    raise CheckpointCorruptError(f"{path.name} does not match its recorded checksum")
+            if reader.base_id is None:
+                yield reader
+                return
+            with self.open_reader(reader.base_id, verify) as base:
+                reader.base = base
+                yield reader
+    
+    def latest_id(self) -> Optional[str]:
+        """Most recently written checkpoint, from the pointer file when there is one"""
+        pointer = self.directory / self.LATEST_POINTER
+        try:
+            checkpoint_id = pointer.read_text().strip()
+            if checkpoint_id:
+                return checkpoint_id
+        except OSError:
+            pass
+        
+        entry = self.index.latest()
+        return entry["checkpoint_id"] if entry else None
+    
+    def find(self, at: Optional[float] = None, healthy_only: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Index entry of the latest checkpoint, the one closest to unix time at,
+        or with healthy_only the last healthy one (no later than at, if given)
+        """
+        if healthy_only:
+            return self.index.last_healthy(before=at)
+        if at is not None:
+            return self.index.closest(at)
+        
+        checkpoint_id = self.latest_id()
+        entry = self.index.get(checkpoint_id) if checkpoint_id else None
+        return entry or self.index.latest()
+    
+    def list_checkpoints(self) -> List[Tuple[str, float, Path]]:
+        """(checkpoint id, unix time, file) for every stored checkpoint, newest first"""
+        return [(entry["checkpoint_id"], entry["created"], self._path(entry["checkpoint_id"], entry["kind"]))
+                for entry in self.index.entries()]
+    
+    def apply_retention(self, policy: RetentionPolicy, now: Optional[float] = None) -> List[str]:
+        """Delete checkpoints the policy doesn't keep; returns the removed ids"""
+        if now is None:
+            now = time.time()
+        
+        with self._lock:
+            entries = self.index.entries()
+            keep = {entry["checkpoint_id"] for entry in entries[:max(1, policy.keep_last)]}
+            hours, days = set(), set()
+            for entry in entries:
+                created = entry["created"]
+                age = now - created
+                if age < policy.hourly * 3600 and int(created // 3600) not in hours:
+                    hours.add(int(created // 3600))
+                    keep.add(entry["checkpoint_id"])
+                if age < policy.daily * 86400 and int(created // 86400) not in days:
+                    days.add(int(created // 86400))
+                    keep.add(entry["checkpoint_id"])
+            
+            # Kept deltas need their base, and future deltas need the current one
+            if self._base is not None:
+                keep.add(self._base[0])
+            keep.update(entry["base_id"] for entry in entries
+                        if entry["checkpoint_id"] in keep and entry["base_id"])
+            
+            removed = []
+            for entry in entries:
+                if entry["checkpoint_id"] not in keep:
+                    try:
+                        self._path(entry["checkpoint_id"], entry["kind"]).unlink()
+                    except FileNotFoundError:
+                        pass
+                    except OSError:
+                        continue
+                    removed.append(entry["checkpoint_id"])
+            self.index.remove(removed)
+            return removed
+    
+    def checkpoint_id_of(self, path: Path) -> str:
+        """Checkpoint id of a stored checkpoint file"""
+        for suffix in (*self.SUFFIXES.values(), *self.GZIP_SUFFIXES.values()):
+            if path.name.endswith(suffix):
+                return path.name[:-len(suffix)]
+        return path.stem
+    
+    def _locate(self, checkpoint_id: str) -> Optional[Tuple[Optional[Dict[str, Any]], str, Path]]:
+        """Index entry (if indexed), kind and file of a stored checkpoint"""
+        entry = self.index.get(checkpoint_id)
+        kind = entry["kind"] if entry else self._probe_kind(checkpoint_id)
+        if kind is None:
+            return None
+        return entry, kind, self._path(checkpoint_id, kind)
+    
+    def _path(self, checkpoint_id: str, kind: str) -> Path:
+        path = self.directory / f"{checkpoint_id}{self.SUFFIXES[kind]}"
+        if kind in self.GZIP_SUFFIXES and not path.exists():
+            gzip_path = self.directory / f"{checkpoint_id}{self.GZIP_SUFFIXES[kind]}"
+            if gzip_path.exists():
+                return gzip_path
+        return path
+    
+    def _kind_of(self, path: Path) -> Optional[str]:
+        for suffixes in (self.SUFFIXES, self.GZIP_SUFFIXES):
+            for kind, suffix in suffixes.items():
+                if path.name.endswith(suffix):
+                    return kind
+        return None
+    
+    def _probe_kind(self, checkpoint_id: str) -> Optional[str]:
+        """Find an unindexed checkpoint's form by looking for its file"""
+        for kind in self.SUFFIXES:
+            if self._path(checkpoint_id, kind).exists():
+                return kind
+        return None
+    
+    @staticmethod
+    def _created_from_id(checkpoint_id: str) -> Optional[float]:
+        try:
+            return float(checkpoint_id.rsplit("_", 1)[1])
+        except (IndexError, ValueError):
+            return None
+    
+    def _rebuild_index(self):
+        """Index checkpoint files written before the index existed"""
+        for path in self.directory.glob("checkpoint_*"):
+            checkpoint_id = self.checkpoint_id_of(path)
+            kind = self._kind_of(path)
+            if kind is None:
+                continue
+            try:
+                blob = path.read_bytes()
+                base_id = None
+                if kind == "delta" and blob.startswith(PACKED_MAGIC):
+                    base_id = CheckpointReader(blob).base_id
+                if kind == "delta" and base_id is None:
+                    base_id = self._read_file(path)["base"]
+            except Exception:
+                continue
+            self.index.add({
+                "checkpoint_id": checkpoint_id,
+                "created": self._created_from_id(checkpoint_id) or path.stat().st_mtime,
+                "kind": kind,
+                "base_id": base_id,
+                "size": len(blob),
+                "sha256": hashlib.sha256(blob).hexdigest(),
+                "healthy": None
+            })
+    
+    def _write_latest_pointer(self, checkpoint_id: str):
+        atomic_write(self.directory / self.LATEST_POINTER, checkpoint_id.encode())
+    
+    def _read_file(self, path: Path, entry: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        with open(path, 'rb') as f:
+            blob = f.read()
+        if entry is not None and entry.get("sha256") and hashlib.sha256(blob).hexdigest() != entry["sha256"]:
+            raise CheckpointCorruptError(f"{path.name} does not match its recorded checksum")
+        if blob.startswith(PACKED_MAGIC):
+            return decode_checkpoint(blob)
+        return json.loads(gzip.decompress(blob))
+
+
 class ApolloContinuitySystem:
     """
     Ensures Apollo's continuous operation
     Never stops. Never fails. Always continues.
     """
     
-    def __init__(self):
+    def __init__(self, install_handlers: bool = True):
         self.continuity_dir = Path.home() / ".apollo_continuity"
         self.continuity_dir.mkdir(parents=True, exist_ok=True)
         
@@ -64,6 +1090,44 @@ class ApolloContinuitySystem:
         self.checkpoint_interval = 300  # 5 minutes
         self.health_check_interval = 60  # 1 minute
         
+        # Full snapshot every 12 checkpoints (hourly), deltas in between
+        self.checkpoint_store = CheckpointStore(self.checkpoints_dir, full_every=12)
+        self.retention_policy = RetentionPolicy()
+        self.retention_interval = 3600  # Seconds between checkpoint garbage collections
+        self.last_health: Optional[Dict[str, Any]] = None  # Latest health check, recorded with checkpoints
+        
+        # Uptime and counters accumulate in memory; the manifest is rewritten
+        # every metrics_flush_interval seconds and on shutdown
+        self.metrics = ContinuityMetrics()
+        self.metrics_flush_interval = 300
+        self._last_metrics_flush = time.monotonic()
+        # Reentrant for the same reason as ContinuityMetrics._lock; a flush
+        # re-entered mid-write leaves its counts to the outer flush
+        self._manifest_lock = threading.RLock()
+        self._flushing = False
+        self._flush_again = False
+        
+        # Recovery: missing critical processes are restarted together and
+        # probed until ready. A process is started from process_launchers
+        # (argv), else from the script of that name next to this module.
+        self.critical_commands = [
+            "apollo_singularity_execution.py",
+            "apollo_sovereignty_core.py"
+        ]
+        self.process_launchers: Dict[str, List[str]] = {}
+        self.readiness_probes: Dict[str, Callable[[], bool]] = {}  # Default: visible in the process table
+        self.readiness_timeout = 10.0
+        self.readiness_poll_interval = 0.1
+        self.launched_processes: Dict[str, subprocess.Popen] = {}
+        self.last_recovery: Optional[RecoveryReport] = None
+        
+        # One process-table snapshot shared by checkpoints, health checks
+        # and the process monitor instead of a pgrep fork per query
+        self.process_table = ProcessTable(ttl=5.0)
+        
+        # Memory-state sizes are maintained incrementally between checkpoints
+        self.size_index = DirectorySizeIndex(self.continuity_dir / "size_index.json")
+        
         # Integration layer
         self.integration = None
         if INTEGRATION_AVAILABLE:
@@ -81,10 +1145,12 @@ class ApolloContinuitySystem:
             except Exception:
                 pass
         
-        # Register signal handlers
-        signal.signal(signal.SIGTERM, self._signal_handler)
-        signal.signal(signal.SIGINT, self._signal_handler)
-        atexit.register(self._cleanup)
+        # Register signal handlers (not when embedded in another process,
+        # e.g. an operations-manager worker, which owns its own shutdown)
+        if install_handlers:
+            signal.signal(signal.SIGTERM, self._signal_handler)
+            signal.signal(signal.SIGINT, self._signal_handler)
+            atexit.register(self._cleanup)
         
         # Load state
         self.load_state()
@@ -97,11 +1163,13 @@ class ApolloContinuitySystem:
         print(f"\n⚠️  Signal {signum} received. Creating checkpoint before exit...")
         self.create_checkpoint()
         self.running = False
+        self.flush_metrics()
     
     def _cleanup(self):
         """Cleanup on exit"""
         if self.running:
             self.create_checkpoint()
+        self.flush_metrics()
     
     def initialize_manifest(self):
         """Initialize continuity manifest"""
@@ -127,36 +1195,29 @@ class ApolloContinuitySystem:
     
     def create_checkpoint(self) -> ContinuityCheckpoint:
         """Create a continuity checkpoint"""
-        checkpoint_id = f"checkpoint_{int(time.time())}"
+        checkpoint_id = self.checkpoint_store.allocate_id()
         
-        # Gather system state
-        system_state = {
-            "timestamp": datetime.now().isoformat(),
-            "processes": self._get_active_processes(),
-            "memory": self._get_memory_state(),
-            "singularity": self._get_singularity_state(),
-            "sovereignty": self._get_sovereignty_state()
-        }
+        # Gather system state once; the dataclass fields share it
+        state = self._gather_state()
+        system_state = {"timestamp": datetime.now().isoformat(), **state}
         
         checkpoint = ContinuityCheckpoint(
             timestamp=datetime.now().isoformat(),
             system_state=system_state,
-            active_processes=self._get_active_processes(),
-            memory_state=self._get_memory_state(),
-            singularity_state=self._get_singularity_state(),
+            active_processes=state["processes"],
+            memory_state=state["memory"],
+            singularity_state=state["singularity"],
             checkpoint_id=checkpoint_id
         )
         
         # Save checkpoint
-        checkpoint_file = self.checkpoints_dir / f"{checkpoint_id}.json"
-        with open(checkpoint_file, 'w') as f:
-            json.dump(asdict(checkpoint), f, indent=2)
+        healthy = None if self.last_health is None else self.last_health["status"] == "healthy"
+        self.checkpoint_store.write(checkpoint_id, asdict(checkpoint), healthy=healthy)
         
-        # Update manifest
-        manifest = self._load_manifest()
-        manifest["checkpoints_created"] = manifest.get("checkpoints_created", 0) + 1
-        manifest["last_checkpoint"] = checkpoint_id
-        self._save_manifest(manifest)
+        # Counted in memory, added to the manifest on the next flush; flushed
+        # here too, as checkpoints may come from callers without the main loop
+        self.metrics.record_checkpoint(checkpoint_id)
+        self.flush_metrics_if_due()
         
         # Log checkpoint
         if self.integration:
@@ -171,34 +1232,58 @@ class ApolloContinuitySystem:
         
         return checkpoint
     
-    def recover_from_checkpoint(self, checkpoint_id: Optional[str] = None) -> bool:
-        """Recover system state from checkpoint"""
+    def _gather_state(self) -> Dict[str, Any]:
+        """Collect each state source exactly once, independent sources concurrently"""
+        sources = {
+            "processes": self._get_active_processes,
+            "memory": self._get_memory_state,
+            "singularity": self._get_singularity_state,
+            "sovereignty": self._get_sovereignty_state
+        }
+        try:
+            with ThreadPoolExecutor(max_workers=len(sources),
+                                    thread_name_prefix="apollo-checkpoint") as pool:
+                futures = {name: pool.submit(source) for name, source in sources.items()}
+            return {name: future.result() for name, future in futures.items()}
+        except RuntimeError:
+            # Interpreter shutting down (the atexit checkpoint): no new threads
+            return {name: source() for name, source in sources.items()}
+    
+    def find_checkpoint(self, at: Optional[float] = None,
+                        healthy_only: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Look up a checkpoint in the index: the latest, the one closest to unix
+        time at, or with healthy_only the last one taken while healthy
+        """
+        return self.checkpoint_store.find(at=at, healthy_only=healthy_only)
+    
+    def recover_from_checkpoint(self, checkpoint_id: Optional[str] = None,
+                                at: Optional[float] = None, healthy_only: bool = False) -> bool:
+        """Recover system state from checkpoint (by default the latest)"""
         if checkpoint_id is None:
-            # Get latest checkpoint
-            checkpoints = sorted(self.checkpoints_dir.glob("checkpoint_*.json"), 
-                               key=lambda p: p.stat().st_mtime, reverse=True)
-            if not checkpoints:
+            entry = self.find_checkpoint(at=at, healthy_only=healthy_only)
+            if entry is None:
                 return False
-            checkpoint_file = checkpoints[0]
-        else:
-            checkpoint_file = self.checkpoints_dir / f"{checkpoint_id}.json"
-        
-        if not checkpoint_file.exists():
-            return False
+            checkpoint_id = entry["checkpoint_id"]
         
         try:
-            with open(checkpoint_file, 'r') as f:
-                checkpoint_data = json.load(f)
-            
-            checkpoint = ContinuityCheckpoint(**checkpoint_data)
+            # Memory and singularity state are never decoded, and the process
+            # list is streamed from the mapped file one chunk at a time
+            timestamp = self.checkpoint_store.read_section(checkpoint_id, "system_state", "timestamp")
+            if timestamp is None:
+                return False
+            system_state = {
+                "timestamp": timestamp,
+                "processes": self.checkpoint_store.iter_section(checkpoint_id, "system_state", "processes")
+            }
             
             # Restore system state
-            self._restore_system_state(checkpoint.system_state)
+            report = self._restore_system_state(system_state)
+            if report is not None:
+                report.checkpoint_id = checkpoint_id
+                self.last_recovery = report
             
-            # Update manifest
-            manifest = self._load_manifest()
-            manifest["recoveries_performed"] = manifest.get("recoveries_performed", 0) + 1
-            self._save_manifest(manifest)
+            self.metrics.record_recovery()
             
             # Log recovery
             if self.integration:
@@ -206,7 +1291,7 @@ class ApolloContinuitySystem:
                     self.integration.log_event(
                         event_type="continuity_recovery",
                         source="continuity_system",
-                        data={"checkpoint_id": checkpoint.checkpoint_id}
+                        data={"checkpoint_id": checkpoint_id}
                     )
                 except Exception:
                     pass
@@ -239,20 +1324,26 @@ class ApolloContinuitySystem:
         monitor_thread = threading.Thread(target=self._process_monitor_loop, daemon=True)
         monitor_thread.start()
         
+        # Start checkpoint retention thread
+        retention_thread = threading.Thread(target=self._retention_loop, daemon=True)
+        retention_thread.start()
+        
         print("✅ Continuity system active")
         print(f"   Checkpoint interval: {self.checkpoint_interval}s")
         print(f"   Health check interval: {self.health_check_interval}s")
         print("")
         
         # Keep main thread alive
+        self.metrics.start_uptime()
         try:
             while self.running:
                 time.sleep(10)
-                self._update_uptime()
+                self.flush_metrics_if_due()
         except KeyboardInterrupt:
             print("\n⚠️  Interrupt received. Creating final checkpoint...")
             self.create_checkpoint()
             self.running = False
+            self.flush_metrics()
     
     def _checkpoint_loop(self):
         """Periodic checkpoint creation"""
@@ -264,11 +1355,23 @@ class ApolloContinuitySystem:
                 print(f"⚠️  Checkpoint error: {e}")
                 time.sleep(self.checkpoint_interval)
     
+    def _retention_loop(self):
+        """Periodic checkpoint garbage collection"""
+        while self.running:
+            try:
+                removed = self.checkpoint_store.apply_retention(self.retention_policy)
+                if removed:
+                    print(f"🧹 Pruned {len(removed)} old checkpoints")
+            except Exception as e:
+                print(f"⚠️  Checkpoint retention error: {e}")
+            time.sleep(self.retention_interval)
+    
     def _health_check_loop(self):
         """Periodic health checks"""
         while self.running:
             try:
                 health = self._check_system_health()
+                self.last_health = health
                 if health["status"] != "healthy":
                     self._handle_health_issue(health)
                 time.sleep(self.health_check_interval)
@@ -297,34 +1400,10 @@ class ApolloContinuitySystem:
     
     def _get_active_processes(self) -> List[Dict[str, Any]]:
         """Get list of active Apollo processes"""
-        processes = []
         try:
-            result = subprocess.run(
-                ["pgrep", "-f", "apollo"],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode == 0:
-                pids = result.stdout.strip().split('\n')
-                for pid in pids:
-                    if pid:
-                        try:
-                            proc_info = subprocess.run(
-                                ["ps", "-p", pid, "-o", "pid,cmd", "--no-headers"],
-                                capture_output=True,
-                                text=True
-                            )
-                            if proc_info.returncode == 0:
-                                cmd = proc_info.stdout.strip()
-                                processes.append({
-                                    "pid": int(pid),
-                                    "command": cmd
-                                })
-                        except Exception:
-                            pass
+            return self.process_table.find("apollo")
         except Exception:
-            pass
-        return processes
+            return []
     
     def _get_memory_state(self) -> Dict[str, Any]:
         """Get memory state"""
@@ -341,9 +1420,10 @@ class ApolloContinuitySystem:
             if path.exists():
                 memory_state[str(path)] = {
                     "exists": True,
-                    "size": sum(f.stat().st_size for f in path.rglob('*') if f.is_file())
+                    "size": self.size_index.total_size(path)
                 }
         
+        self.size_index.save()
         return memory_state
     
     def _get_singularity_state(self) -> Dict[str, Any]:
@@ -387,27 +1467,69 @@ class ApolloContinuitySystem:
         
         return state
     
-    def _restore_system_state(self, system_state: Dict[str, Any]):
-        """Restore system state from checkpoint"""
-        # Restore critical processes if needed
-        processes = system_state.get("processes", [])
-        current_processes = self._get_active_processes()
+    def _restore_system_state(self, system_state: Dict[str, Any]) -> RecoveryReport:
+        """
+        Restore system state from checkpoint
+        Diffs the checkpoint against one fresh process-table snapshot, restarts
+        every missing critical process at once and probes them together, so
+        recovery takes at most readiness_timeout however many are missing
+        """
+        started = time.monotonic()
+        self.process_table.invalidate()
+        live = [proc["command"] for proc in self.process_table.snapshot()]
         
-        # Check if critical processes need restart
-        critical_commands = [
-            "apollo_singularity_execution.py",
-            "apollo_sovereignty_core.py"
-        ]
+        missing = [name for name in self.critical_commands if not any(name in cmd for cmd in live)]
+        already_running = [name for name in self.critical_commands if name not in missing]
+        live_commands = set(live)
+        lost = [proc["command"] for proc in system_state.get("processes", [])
+                if proc.get("command") and proc["command"] not in live_commands]
         
-        for cmd_pattern in critical_commands:
-            found = False
-            for proc in current_processes:
-                if cmd_pattern in proc.get("command", ""):
-                    found = True
-                    break
-            if not found:
-                print(f"🔄 Restarting critical process: {cmd_pattern}")
-                self._restart_process(cmd_pattern)
+        ready: List[str] = []
+        if missing:
+            for name in missing:
+                print(f"🔄 Restarting critical process: {name}")
+            with ThreadPoolExecutor(max_workers=len(missing),
+                                    thread_name_prefix="apollo-recovery") as pool:
+                launched = dict(zip(missing, pool.map(self._restart_process, missing)))
+            ready = self._await_readiness([name for name in missing if launched[name]])
+        
+        report = RecoveryReport(
+            missing=missing,
+            already_running=already_running,
+            ready=ready,
+            failed=[name for name in missing if name not in ready],
+            lost_processes=lost,
+            time_to_recovery=time.monotonic() - started
+        )
+        if missing:
+            print(f"✅ Recovery finished in {report.time_to_recovery:.2f}s "
+                  f"({len(report.ready)} ready, {len(report.failed)} failed)")
+        return report
+    
+    def _await_readiness(self, names: List[str]) -> List[str]:
+        """Poll restarted processes until all are ready or readiness_timeout passes"""
+        pending = list(names)
+        ready = []
+        deadline = time.monotonic() + self.readiness_timeout
+        while pending:
+            self.process_table.invalidate()  # One fresh scan per round, shared by every probe
+            for name in list(pending):
+                launched = self.launched_processes.get(name)
+                if launched is not None and launched.poll() is not None:
+                    pending.remove(name)  # Exited before becoming ready
+                elif self._is_ready(name):
+                    pending.remove(name)
+                    ready.append(name)
+            if not pending or time.monotonic() >= deadline:
+                break
+            time.sleep(self.readiness_poll_interval)
+        return ready
+    
+    def _is_ready(self, proc_name: str) -> bool:
+        probe = self.readiness_probes.get(proc_name)
+        if probe is not None:
+            return probe()
+        return self.process_table.is_running(proc_name)
     
     def _check_system_health(self) -> Dict[str, Any]:
         """Check system health"""
@@ -418,12 +1540,7 @@ class ApolloContinuitySystem:
         }
         
         # Check critical processes
-        critical_processes = [
-            "apollo_singularity_execution.py",
-            "apollo_sovereignty_core.py"
-        ]
-        
-        for proc_name in critical_processes:
+        for proc_name in self.critical_commands:
             if not self._is_process_running(proc_name):
                 health["status"] = "degraded"
                 health["issues"].append(f"Process not running: {proc_name}")
@@ -463,27 +1580,76 @@ class ApolloContinuitySystem:
     def _is_process_running(self, proc_name: str) -> bool:
         """Check if process is running"""
         try:
-            result = subprocess.run(
-                ["pgrep", "-f", proc_name],
-                capture_output=True,
-                text=True
-            )
-            return result.returncode == 0 and result.stdout.strip() != ""
+            return self.process_table.is_running(proc_name)
         except Exception:
             return False
     
-    def _restart_process(self, proc_name: str):
-        """Restart a process"""
-        # This would restart the process
-        # Implementation depends on how processes are managed
-        print(f"🔄 Would restart: {proc_name}")
+    def _restart_process(self, proc_name: str) -> bool:
+        """Restart a process; returns whether anything was started"""
+        argv = self.process_launchers.get(proc_name)
+        if argv is None:
+            script = Path(__file__).resolve().parent / proc_name
+            if script.exists():
+                argv = [sys.executable, str(script)]
+        
+        started = False
+        if argv is None:
+            # Implementation depends on how processes are managed
+            print(f"🔄 Would restart: {proc_name}")
+        else:
+            try:
+                self.launched_processes[proc_name] = subprocess.Popen(
+                    argv,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True
+                )
+                started = True
+            except OSError as e:
+                print(f"❌ Could not restart {proc_name}: {e}")
+        
+        # The restarted process must show up in the next query
+        self.process_table.invalidate()
+        return started
+    
+    def flush_metrics(self):
+        """Fold accumulated uptime and counters into the manifest in one write"""
+        with self._manifest_lock:
+            if self._flushing:
+                # A signal handler interrupted a flush on this thread: writing
+                # now would be overwritten by the outer flush, so it goes again
+                self._flush_again = True
+                return
+            self._flushing = True
+            try:
+                self._flush_again = True
+                while self._flush_again:
+                    self._flush_again = False
+                    self._flush_pending_metrics()
+            finally:
+                self._flushing = False
     
-    def _update_uptime(self):
-        """Update uptime in manifest"""
+    def _flush_pending_metrics(self):
+        """One read-modify-write of the manifest (caller holds _manifest_lock)"""
+        self._last_metrics_flush = time.monotonic()
+        pending = self.metrics.drain()
+        if not (pending["uptime_seconds"] or pending["checkpoints_created"]
+                or pending["recoveries_performed"]):
+            return
         manifest = self._load_manifest()
-        manifest["uptime_seconds"] = manifest.get("uptime_seconds", 0) + 10
+        manifest["uptime_seconds"] = round(manifest.get("uptime_seconds", 0) + pending["uptime_seconds"])
+        for counter in ("checkpoints_created", "recoveries_performed"):
+            manifest[counter] = manifest.get(counter, 0) + pending[counter]
+        if pending["last_checkpoint"] is not None:
+            manifest["last_checkpoint"] = pending["last_checkpoint"]
         self._save_manifest(manifest)
     
+    def flush_metrics_if_due(self):
+        """flush_metrics, once metrics_flush_interval has passed since the last flush"""
+        if time.monotonic() - self._last_metrics_flush >= self.metrics_flush_interval:
+            self.flush_metrics()
+    
     def load_state(self):
         """Load continuity state"""
         if self.state_file.exists():
@@ -498,8 +1664,7 @@ class ApolloContinuitySystem:
     def save_state(self):
         """Save continuity state"""
         self.state["last_updated"] = datetime.now().isoformat()
-        with open(self.state_file, 'w') as f:
-            json.dump(self.state, f, indent=2)
+        atomic_write(self.state_file, json.dumps(self.state, indent=2).encode())
     
     def _load_manifest(self) -> Dict[str, Any]:
         """Load manifest"""
@@ -513,12 +1678,60 @@ class ApolloContinuitySystem:
     
     def _save_manifest(self, manifest: Dict[str, Any]):
         """Save manifest"""
-        with open(self.manifest_file, 'w') as f:
-            json.dump(manifest, f, indent=2)
+        atomic_write(self.manifest_file, json.dumps(manifest, indent=2).encode())
+
+
+# Per-process instance behind the module-level entry points below
+_embedded_system: Optional[ApolloContinuitySystem] = None
+
+
+def _embedded() -> ApolloContinuitySystem:
+    """The shared instance, built without signal handlers or an exit checkpoint"""
+    global _embedded_system
+    if _embedded_system is None:
+        _embedded_system = ApolloContinuitySystem(install_handlers=False)
+    return _embedded_system
+
+
+def create_checkpoint() -> ContinuityCheckpoint:
+    """Create a checkpoint from another process (operations-manager target)"""
+    continuity = _embedded()
+    checkpoint = continuity.create_checkpoint()
+    continuity.flush_metrics()  # Nothing flushes at exit without the handlers
+    return checkpoint
+
+
+def check_system_health() -> Dict[str, Any]:
+    """Run a health check from another process (operations-manager target)"""
+    return _embedded()._check_system_health()
 
 
 def main():
     """Main entry point"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Apollo Continuity System")
+    parser.add_argument("--inspect", metavar="CHECKPOINT_ID",
+                        help="List a checkpoint's sections (or print one with --section) and exit")
+    parser.add_argument("--section", help="Dotted section path to print, e.g. system_state.processes")
+    args = parser.parse_args()
+    
+    if args.inspect:
+        # Read-only: no signal handlers, no exit checkpoint
+        store = CheckpointStore(Path.home() / ".apollo_continuity" / "checkpoints")
+        if args.section:
+            print(json.dumps(store.read_section(args.inspect, *args.section.split(".")), indent=2))
+            return
+        with store.open_reader(args.inspect) as reader:
+            if reader is None:
+                print(f"❌ {args.inspect} is not a packed checkpoint")
+                return
+            print(f"📦 {args.inspect}: {reader.kind}" + (f" of {reader.base_id}" if reader.base_id else ""))
+            for row in reader.section_info():
+                print(f"   {row['section']:<32} {row['stored']:<9} {row['bytes']:>10} bytes "
+                      f"{row['chunks']:>4} chunk(s){' zlib' if row['compressed'] else ''}")
+        return
+    
     continuity = ApolloContinuitySystem()
     continuity.ensure_continuity()
 
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+Apollo Operations Benchmark
+Replay-and-simulate harness for the autonomous operations scheduler
+Runs synthetic (or replayed) operations against ApolloAutonomousOperationsManager
+on a virtual clock and reports dispatch lag, throughput, CPU and bytes written
+"""
+
+import os
+import json
+import math
+import time
+import random
+import shutil
+import resource
+import tempfile
+import contextlib
+from pathlib import Path
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Dict, List, Any, Optional
+
+import apollo_autonomous_operations_manager as operations_module
+from apollo_autonomous_operations_manager import (
+    ApolloAutonomousOperationsManager,
+    LatencyHistogram,
+    OperationStatus,
+)
+
+
+# Importable no-op target for callable operations (resolved in the worker pool)
+NOOP_TARGET = "apollo_operations_benchmark:noop"
+NOOP_COMMAND = "true"
+
+# Metrics compared against a baseline report, and whether lower is better
+COMPARED_METRICS = {
+    "throughput_runs_per_second": False,
+    "cpu_per_run_ms": True,
+    "dispatch_overhead.p99": True,
+    "bytes_per_run": True,
+    "dispatch_lag.p99": True,
+    "queue_wait.p99": True,
+}
+
+
+def noop():
+    """Synthetic callable operation"""
+    return None
+
+
+class VirtualClock:
+    """
+    Clock the scheduler reads instead of the real one
+    Stands still while operations run and jumps straight to the next deadline,
+    so hours of schedule replay in seconds of real time
+    """
+
+    def __init__(self):
+        self.wall = time.time()
+        self.mono = 1000.0
+
+    def time(self) -> float:
+        return self.wall
+
+    def monotonic(self) -> float:
+        return self.mono
+
+    def advance(self, seconds: float):
+        self.wall += seconds
+        self.mono += seconds
+
+
+@contextlib.contextmanager
+def virtual_time(clock: VirtualClock):
+    """Point the manager module's time and datetime at a virtual clock"""
+    class VirtualDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.fromtimestamp(clock.time(), tz)
+
+    real_time, real_datetime = operations_module.time, operations_module.datetime
+    operations_module.time = SimpleNamespace(time=clock.time, monotonic=clock.monotonic,
+                                             sleep=real_time.sleep)
+    operations_module.datetime = VirtualDatetime
+    try:
+        yield clock
+    finally:
+        operations_module.time = real_time
+        operations_module.datetime = real_datetime
+
+
+@contextlib.contextmanager
+def temporary_home():
+    """Run the manager against a throwaway state directory"""
+    home = tempfile.mkdtemp(prefix="apollo_benchmark_")
+    previous = os.environ.get("HOME")
+    os.environ["HOME"] = home
+    try:
+        yield Path(home)
+    finally:
+        if previous is None:
+            os.environ.pop("HOME", None)
+        else:
+            os.environ["HOME"] = previous
+        shutil.rmtree(home, ignore_errors=True)
+
+
+def process_bytes_written() -> Optional[int]:
+    """Bytes this process has passed to write() so far (Linux only)"""
+    try:
+        with open("/proc/self/io") as f:
+            for line in f:
+                if line.startswith("wchar:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def directory_bytes(path: Path) -> int:
+    """Total size of the files under path"""
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+
+def children_cpu_seconds() -> float:
+    """User plus system CPU of this process's reaped children"""
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _wait_for_idle(manager: ApolloAutonomousOperationsManager, timeout: float = 60.0):
+    """Block (in real time) until every dispatched run has been finished"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with manager._claim_lock:
+            if manager._in_flight == 0:
+                return
+        time.sleep(0.001)
+    raise TimeoutError("Operations did not finish; is the runner stuck?")
+
+
+def register_synthetic_operations(manager: ApolloAutonomousOperationsManager, count: int,
+                                  intervals: List[int], callable_ratio: float) -> List[str]:
+    """Register count no-op operations spread over the given intervals"""
+    operation_ids = []
+    for i in range(count):
+        interval = intervals[i % len(intervals)]
+        if i < count * callable_ratio:
+            op = manager.register_operation(f"Synthetic callable {i}", "benchmark no-op",
+                                            target=NOOP_TARGET, interval=interval,
+                                            first_run_delay=random.uniform(0, interval))
+        else:
+            op = manager.register_operation(f"Synthetic command {i}", "benchmark no-op",
+                                            command=NOOP_COMMAND, interval=interval,
+                                            first_run_delay=random.uniform(0, interval))
+        operation_ids.append(op.operation_id)
+    return operation_ids
+
+
+def neutralize_replayed_operations(manager: ApolloAutonomousOperationsManager) -> List[str]:
+    """Keep the recorded schedule but swap every command and target for a no-op"""
+    for op in manager.operations.values():
+        if op.target:
+            op.target = NOOP_TARGET
+        else:
+            op.command = NOOP_COMMAND
+        op.status = OperationStatus.IDLE
+        op.cache_ttl = 0
+    return list(manager.operations)
+
+
+def run_benchmark(operations: int = 100, duration: float = 600.0,
+                  intervals: Optional[List[int]] = None, callable_ratio: float = 0.5,
+                  max_workers: int = 4, max_queue_depth: int = 32,
+                  replay_dir: Optional[Path] = None, seed: int = 0) -> Dict[str, Any]:
+    """
+    Simulate duration virtual seconds of scheduling and report its cost
+    With replay_dir, the recorded operations.json/operations.journal found
+    there are replayed (as no-ops) instead of synthetic operations
+    """
+    intervals = intervals or [5, 15, 60, 300]
+    random.seed(seed)
+    clock = VirtualClock()
+
+    with temporary_home() as home, virtual_time(clock):
+        state_dir = home / ".apollo_autonomous_operations"
+        if replay_dir is not None:
+            state_dir.mkdir(parents=True)
+            for name in ("operations.json", "operations.journal"):
+                if (Path(replay_dir) / name).exists():
+                    shutil.copy(Path(replay_dir) / name, state_dir / name)
+
+        manager = ApolloAutonomousOperationsManager(max_workers=max_workers,
+                                                    max_queue_depth=max_queue_depth)
+        # Flushes follow the virtual clock below, not a real-time timer
+        flush_interval = manager.journal_flush_interval
+        manager.journal_flush_interval = 3600
+
+        if replay_dir is not None:
+            operation_ids = neutralize_replayed_operations(manager)
+        else:
+            manager.flush_journal()
+            manager.operations.clear()
+            manager._schedule.clear()
+            manager._deadlines.clear()
+            operation_ids = register_synthetic_operations(manager, operations, intervals, callable_ratio)
+
+        manager.flush_journal()
+        bytes_before = process_bytes_written()
+        cpu_before = time.process_time()
+        children_before = children_cpu_seconds()
+        wall_start = time.perf_counter()
+        dispatch_overhead = LatencyHistogram()
+        end = clock.monotonic() + duration
+        next_flush = clock.monotonic() + flush_interval
+
+        try:
+            while True:
+                wait = manager._seconds_until_next_deadline()
+                if wait is None or clock.monotonic() + wait > end:
+                    break
+                clock.advance(wait)
+
+                for operation_id in sorted(manager._pop_due_operations(), key=manager._dependency_depth):
+                    started = time.perf_counter()
+                    manager._dispatch_operation(operation_id)
+                    dispatch_overhead.record(time.perf_counter() - started)
+                _wait_for_idle(manager)
+
+                if clock.monotonic() >= next_flush:
+                    manager.flush_journal()
+                    next_flush = clock.monotonic() + flush_interval
+            manager.flush_journal()
+
+            wall_seconds = time.perf_counter() - wall_start
+            cpu_seconds = time.process_time() - cpu_before
+            bytes_after = process_bytes_written()
+            stats = {op_id: manager._stats.get(op_id) for op_id in operation_ids}
+        finally:
+            manager.stop()
+        children_cpu = children_cpu_seconds() - children_before
+        state_bytes = directory_bytes(state_dir)
+
+    dispatch_lag, queue_wait = LatencyHistogram(), LatencyHistogram()
+    runs = failures = 0
+    for op_stats in stats.values():
+        if op_stats is None:
+            continue
+        runs += op_stats.runs
+        failures += op_stats.failures
+        dispatch_lag.merge(op_stats.scheduling_lag)
+        queue_wait.merge(op_stats.queue_wait)
+
+    bytes_written = None
+    if bytes_before is not None and bytes_after is not None:
+        bytes_written = bytes_after - bytes_before
+
+    return {
+        "operations": len(operation_ids),
+        "virtual_seconds": duration,
+        "replayed": replay_dir is not None,
+        "max_workers": max_workers,
+        "max_queue_depth": max_queue_depth,
+        "runs": runs,
+        "failures": failures,
+        "wall_seconds": wall_seconds,
+        "throughput_runs_per_second": runs / wall_seconds if wall_seconds else 0.0,
+        "cpu_seconds": cpu_seconds,
+        "children_cpu_seconds": children_cpu,
+        "cpu_per_run_ms": 1000 * cpu_seconds / runs if runs else 0.0,
+        # Real seconds spent claiming and submitting each due run
+        "dispatch_overhead": dispatch_overhead.summary(),
+        # Virtual seconds: how late the scheduler popped runs, and how long
+        # they then waited for a slot (backpressure, dependencies, resources)
+        "dispatch_lag": dispatch_lag.summary(),
+        "queue_wait": queue_wait.summary(),
+        "bytes_written": bytes_written,
+        "bytes_per_run": bytes_written / runs if bytes_written is not None and runs else None,
+        "state_bytes": state_bytes,
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+def _metric(report: Dict[str, Any], path: str) -> Optional[float]:
+    value: Any = report
+    for key in path.split("."):
+        if not isinstance(value, dict) or value.get(key) is None:
+            return None
+        value = value[key]
+    return value
+
+
+def compare_reports(report: Dict[str, Any], baseline: Dict[str, Any],
+                    metrics: Optional[Dict[str, bool]] = None) -> Dict[str, Dict[str, Any]]:
+    """Relative change of the headline metrics (COMPARED_METRICS by default) against a baseline report"""
+    comparison = {}
+    for path, lower_is_better in (metrics or COMPARED_METRICS).items():
+        current, previous = _metric(report, path), _metric(baseline, path)
+        if current is None or previous is None:
+            continue
+        if previous:
+            change = (current - previous) / previous
+        else:
+            # No relative change from zero: any move away from it is infinite
+            change = math.copysign(math.inf, current) if current else 0.0
+        comparison[path] = {
+            "baseline": previous,
+            "current": current,
+            "change": change,
+            "improved": change < 0 if lower_is_better else change > 0
+        }
+    return comparison
+
+
+def main():
+    """Main entry point"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Apollo Operations Benchmark")
+    parser.add_argument("--operations", type=int, default=100, help="Synthetic operations to register")
+    parser.add_argument("--duration", type=float, default=600.0, help="Virtual seconds to simulate")
+    parser.add_argument("--intervals", default="5,15,60,300", help="Comma-separated intervals, in seconds")
+    parser.add_argument("--callable-ratio", type=float, default=0.5,
+                        help="Share of operations that are in-process callables rather than commands")
+    parser.add_argument("--max-workers", type=int, default=4)
+    parser.add_argument("--max-queue-depth", type=int, default=32)
+    parser.add_argument("--replay", type=Path, help="State directory whose operations are replayed")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Write the report as JSON")
+    parser.add_argument("--baseline", type=Path, help="Earlier JSON report to compare against")
+    args = parser.parse_args()
+
+    print("🧪 Apollo operations scheduler benchmark")
+    report = run_benchmark(
+        operations=args.operations,
+        duration=args.duration,
+        intervals=[int(i) for i in args.intervals.split(",")],
+        callable_ratio=args.callable_ratio,
+        max_workers=args.max_workers,
+        max_queue_depth=args.max_queue_depth,
+        replay_dir=args.replay,
+        seed=args.seed
+    )
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            report["comparison"] = compare_reports(report, json.load(f))
+
+    print(json.dumps(report, indent=2))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"✅ Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
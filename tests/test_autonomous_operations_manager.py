@@ -0,0 +1,802 @@
+import os
+import gzip
+import json
+import time
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from apollo_autonomous_operations_manager import (
+    ApolloAutonomousOperationsManager,
+    AsyncSubprocessRunner,
+    CatchUpPolicy,
+    LatencyHistogram,
+    CommandResult,
+    OperationStatus,
+    OutputCapture,
+    ResultCache,
+    ShardCoordinator,
+)
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    m = ApolloAutonomousOperationsManager()
+    # Drop the default operations from the schedule so tests never spawn them
+    m._schedule.clear()
+    m._deadlines.clear()
+    yield m
+    m.stop()
+
+
+def _set_next_execution(manager, op, seconds_from_now):
+    op.next_execution = (datetime.now() + timedelta(seconds=seconds_from_now)).isoformat()
+    manager._schedule_operation(op)
+
+
+def test_operations_round_trip_through_journal(manager):
+    op = manager.register_operation("Echo", "echo", "true", interval=30)
+    manager.flush_journal()
+
+    records = [json.loads(line) for line in manager.journal_file.read_text().splitlines()]
+    journaled = {r["operation"]["operation_id"]: r["operation"] for r in records}
+    assert journaled[op.operation_id]["status"] == "idle"
+
+    reloaded = ApolloAutonomousOperationsManager()
+    assert reloaded.operations[op.operation_id].status == OperationStatus.IDLE
+    assert json.loads(manager.manifest_file.read_text())["operations_registered"] == 6
+    reloaded.stop()
+
+
+def test_journal_coalesces_changes_and_compacts(manager):
+    op = manager.register_operation("Busy", "busy", "true")
+    manager.flush_journal()
+    before = len(manager.journal_file.read_text().splitlines())
+
+    for _ in range(5):
+        manager.execute_operation(op.operation_id)
+    manager.flush_journal()
+    assert len(manager.journal_file.read_text().splitlines()) == before + 1
+    assert json.loads(manager.manifest_file.read_text())["operations_executed"] == 5
+
+    manager.journal_compact_threshold = before + 1
+    manager.execute_operation(op.operation_id)
+    manager.flush_journal()
+    assert manager.journal_file.read_text() == ""
+    snapshot = json.loads(manager.operations_file.read_text())
+    assert any(d["operation_id"] == op.operation_id for d in snapshot)
+
+
+def test_load_ignores_torn_journal_tail(manager):
+    op = manager.register_operation("Torn", "torn", "true")
+    manager.flush_journal()
+    with open(manager.journal_file, "a") as f:
+        f.write('{"op": "upsert", "operation": {"operation_id"')
+
+    reloaded = ApolloAutonomousOperationsManager()
+    assert op.operation_id in reloaded.operations
+    reloaded.stop()
+
+
+def test_records_after_a_torn_tail_survive_reload(manager):
+    op = manager.register_operation("Before", "before", "true")
+    manager.flush_journal()
+    with open(manager.journal_file, "a") as f:
+        f.write('{"op": "upsert", "operation": {"operation_id"')
+
+    reloaded = ApolloAutonomousOperationsManager()
+    later = reloaded.register_operation("After", "after", "true")
+    reloaded.flush_journal()
+    reloaded.stop()
+
+    again = ApolloAutonomousOperationsManager()
+    assert op.operation_id in again.operations
+    assert later.operation_id in again.operations
+    again.stop()
+
+
+def test_persisted_default_targets_are_migrated(manager):
+    op = next(op for op in manager.operations.values() if op.name == "Continuity Checkpoint")
+    op.target = "apollo_continuity_system:ApolloContinuitySystem.create_checkpoint"
+    manager.save_operations()
+
+    reloaded = ApolloAutonomousOperationsManager()
+    assert reloaded.operations[op.operation_id].target == "apollo_continuity_system:create_checkpoint"
+    reloaded.stop()
+
+
+def test_pop_due_operations_in_deadline_order(manager):
+    late = manager.register_operation("Late", "late", "true")
+    early = manager.register_operation("Early", "early", "true")
+    future = manager.register_operation("Future", "future", "true")
+    _set_next_execution(manager, late, -1)
+    _set_next_execution(manager, early, -5)
+    _set_next_execution(manager, future, 3600)
+
+    assert manager._pop_due_operations() == [early.operation_id, late.operation_id]
+    assert manager._pop_due_operations() == []
+    assert manager._seconds_until_next_deadline() > 3500
+
+
+def test_reschedule_supersedes_stale_entry(manager):
+    op = manager.register_operation("Moved", "moved", "true")
+    _set_next_execution(manager, op, 3600)
+    _set_next_execution(manager, op, -1)
+    _set_next_execution(manager, op, 3600)
+
+    assert manager._pop_due_operations() == []
+    assert manager._pop_due_operations(time.monotonic() + 7200) == [op.operation_id]
+
+
+def test_execution_loop_wakes_early_on_register(manager):
+    loop = threading.Thread(target=manager._execution_loop, daemon=True)
+    loop.start()
+    time.sleep(0.1)
+
+    started = time.monotonic()
+    op = manager.register_operation("Now", "now", "true", interval=3600)
+    while op.status != OperationStatus.COMPLETED and time.monotonic() - started < 5:
+        time.sleep(0.01)
+
+    assert op.status == OperationStatus.COMPLETED
+    assert time.monotonic() - started < 5
+    assert manager._pop_due_operations() == []
+
+
+def test_claim_respects_per_operation_concurrency(manager):
+    single = manager.register_operation("Single", "single", "true")
+    double = manager.register_operation("Double", "double", "true", max_concurrency=2)
+
+    assert manager._claim_operation(single.operation_id) is True
+    assert manager._claim_operation(single.operation_id) is False
+    assert manager.execute_operation(single.operation_id) is None
+
+    assert manager._claim_operation(double.operation_id) is True
+    assert manager._claim_operation(double.operation_id) is True
+    assert manager._claim_operation(double.operation_id) is False
+    manager._release_operation(double.operation_id)
+    assert double.status == OperationStatus.RUNNING
+
+
+def test_in_flight_runs_are_bounded(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    manager = ApolloAutonomousOperationsManager(max_queue_depth=2)
+    manager.backpressure_delay = 0.05
+    manager._schedule.clear()
+    manager._deadlines.clear()
+    marker = tmp_path / "running"
+    marker.mkdir()
+    command = (
+        f"touch {marker}/$$; ls {marker} | wc -l >> {tmp_path}/peaks; "
+        f"sleep 0.2; rm {marker}/$$"
+    )
+    ops = [manager.register_operation(f"Op {i}", "op", command, interval=3600) for i in range(6)]
+    threading.Thread(target=manager._execution_loop, daemon=True).start()
+
+    deadline = time.monotonic() + 10
+    while any(op.status != OperationStatus.COMPLETED for op in ops) and time.monotonic() < deadline:
+        time.sleep(0.02)
+    manager.stop()
+
+    assert all(op.status == OperationStatus.COMPLETED for op in ops)
+    peaks = [int(line) for line in (tmp_path / "peaks").read_text().split()]
+    assert len(peaks) == 6 and max(peaks) <= 2
+
+
+def test_execution_loop_survives_a_failing_dispatch(manager, monkeypatch):
+    op = manager.register_operation("Doomed", "doomed", "true")
+    attempts = []
+
+    def explode(operation_id):
+        attempts.append(operation_id)
+        raise OSError("lease database unavailable")
+
+    monkeypatch.setattr(manager, "_dispatch_operation", explode)
+    loop = threading.Thread(target=manager._execution_loop, daemon=True)
+    loop.start()
+    deadline = time.monotonic() + 5
+    while not attempts and time.monotonic() < deadline:
+        time.sleep(0.01)
+    manager.stop()
+    loop.join(timeout=5)
+
+    assert attempts == [op.operation_id]
+    assert not loop.is_alive()
+    assert manager._deadlines[op.operation_id] > time.monotonic()
+
+
+def test_dispatch_defers_when_queue_is_full(manager):
+    op = manager.register_operation("Deferred", "deferred", "true")
+    manager._pop_due_operations(time.monotonic() + 1)
+    manager._in_flight = manager.max_queue_depth
+
+    assert manager._dispatch_operation(op.operation_id) is False
+    assert op.status == OperationStatus.IDLE
+    assert manager._seconds_until_next_deadline() > 0
+    manager._in_flight = 0
+
+
+def test_runner_execs_plain_commands_without_a_shell():
+    runner = AsyncSubprocessRunner()
+    assert runner._command_argv("python3 script.py --flag") == ["python3", "script.py", "--flag"]
+    assert runner._command_argv("echo hi | wc -c")[:2] == ["/bin/sh", "-c"]
+    for command in ("FOO=1 env", "exit 3", "cd /tmp"):
+        assert runner._command_argv(command) == ["/bin/sh", "-c", command]
+
+
+def test_shell_builtins_run_through_the_shell(manager):
+    op = manager.register_operation("Builtin", "builtin", "exit 3")
+    assert manager.execute_operation(op.operation_id)["exit_code"] == 3
+
+
+def test_runner_streams_output_incrementally():
+    runner = AsyncSubprocessRunner()
+    seen = []
+    try:
+        result = runner.submit(
+            "printf 'a'; sleep 0.1; printf 'b' >&2", timeout=5,
+            on_output=lambda name, chunk: seen.append((name, chunk))
+        ).result()
+    finally:
+        runner.stop()
+
+    assert result.exit_code == 0 and not result.timed_out
+    assert (result.stdout, result.stderr) == ("a", "b")
+    assert seen == [("stdout", b"a"), ("stderr", b"b")]
+
+
+def test_runner_timeout_kills_process_group(tmp_path):
+    runner = AsyncSubprocessRunner(kill_grace=0.5)
+    pidfile = tmp_path / "child.pid"
+    try:
+        result = runner.submit(f"sleep 30 & echo $! > {pidfile}; wait", timeout=0.5).result()
+    finally:
+        runner.stop()
+
+    assert result.timed_out
+    child = int(pidfile.read_text())
+    deadline = time.monotonic() + 2
+    while time.monotonic() < deadline:
+        try:
+            # Reparented children may linger as zombies if init doesn't reap them
+            if open(f"/proc/{child}/stat").read().rsplit(")", 1)[1].split()[0] == "Z":
+                break
+        except (FileNotFoundError, ProcessLookupError):
+            break
+        time.sleep(0.05)
+    else:
+        pytest.fail("background child survived the process-group kill")
+
+
+def test_operation_timeout_marks_failure(manager):
+    manager.operation_timeout = 0.2
+    manager._runner.kill_grace = 0.2
+    op = manager.register_operation("Slow", "slow", "sleep 5")
+
+    manager.execute_operation(op.operation_id)
+
+    assert op.status == OperationStatus.FAILED
+    assert op.error == "Operation timeout"
+
+
+def sample_target():
+    print("warm")
+    return {"pid": os.getpid()}
+
+
+def slow_target():
+    time.sleep(5)
+
+
+def crashing_target():
+    os._exit(3)
+
+
+def swallowing_target():
+    for _ in range(50):
+        try:
+            time.sleep(0.1)
+        except Exception:
+            pass
+
+
+def stuck_target():
+    while True:
+        try:
+            time.sleep(0.1)
+        except BaseException:
+            pass
+
+
+class SampleService:
+    def status(self):
+        return id(self)
+
+
+def test_register_requires_exactly_one_of_command_or_target(manager):
+    with pytest.raises(ValueError):
+        manager.register_operation("Neither", "neither")
+    with pytest.raises(ValueError):
+        manager.register_operation("Both", "both", "true", target="os:getpid")
+
+
+def test_callable_target_runs_in_warm_worker(manager):
+    op = manager.register_operation(
+        "Callable", "callable", target="tests.test_autonomous_operations_manager:sample_target"
+    )
+
+    first = manager.execute_operation(op.operation_id)
+    second = manager.execute_operation(op.operation_id)
+
+    assert op.status == OperationStatus.COMPLETED
+    assert first["success"] and first["stdout"] == "warm\n"
+    assert first["return_value"]["pid"] != os.getpid()
+    assert first["return_value"]["pid"] == second["return_value"]["pid"]
+
+
+def test_callable_target_binds_methods_to_cached_instance():
+    from apollo_autonomous_operations_manager import _resolve_callable_target, _worker_instances
+
+    target = "tests.test_autonomous_operations_manager:SampleService.status"
+    first = _resolve_callable_target(target)
+    assert type(first.__self__).__name__ == "SampleService"
+    assert _resolve_callable_target(target)() == first()
+    _worker_instances.clear()
+
+
+def test_callable_target_timeout(manager):
+    manager.operation_timeout = 0.2
+    op = manager.register_operation(
+        "Slow callable", "slow", target="tests.test_autonomous_operations_manager:slow_target"
+    )
+
+    manager.execute_operation(op.operation_id)
+
+    assert op.status == OperationStatus.FAILED
+    assert op.error == "Operation timeout"
+
+
+def test_callable_timeout_survives_except_exception(manager):
+    manager.operation_timeout = 0.3
+    op = manager.register_operation(
+        "Swallowing", "swallowing", target="tests.test_autonomous_operations_manager:swallowing_target"
+    )
+
+    started = time.monotonic()
+    manager.execute_operation(op.operation_id)
+
+    assert op.error == "Operation timeout"
+    assert time.monotonic() - started < 3
+
+
+def test_stuck_callable_is_failed_and_its_pool_recycled(manager):
+    manager.operation_timeout = 0.3
+    manager._callable_runner.kill_grace = 0.5
+    stuck = manager.register_operation(
+        "Stuck", "stuck", target="tests.test_autonomous_operations_manager:stuck_target"
+    )
+    warm = manager.register_operation(
+        "Warm", "warm", target="tests.test_autonomous_operations_manager:sample_target"
+    )
+
+    manager.execute_operation(stuck.operation_id)
+    assert stuck.status == OperationStatus.FAILED and stuck.error == "Operation timeout"
+    assert not manager._active_runs
+
+    assert manager.execute_operation(warm.operation_id)["success"]
+
+
+def test_dead_worker_fails_its_run_and_the_pool_is_rebuilt(manager):
+    crash = manager.register_operation(
+        "Crash", "crash", target="tests.test_autonomous_operations_manager:crashing_target"
+    )
+    warm = manager.register_operation(
+        "Warm", "warm", target="tests.test_autonomous_operations_manager:sample_target"
+    )
+
+    manager.execute_operation(crash.operation_id)
+    result = manager.execute_operation(warm.operation_id)
+
+    assert crash.status == OperationStatus.FAILED
+    assert warm.status == OperationStatus.COMPLETED and result["success"]
+
+
+@pytest.mark.parametrize("error", [RuntimeError("runner unavailable"), OSError("disk full")])
+def test_failed_submit_releases_and_reschedules(manager, monkeypatch, error):
+    op = manager.register_operation("Unsubmitted", "unsubmitted", "true")
+    manager._pop_due_operations(time.monotonic() + 1)
+
+    def refuse(operation_id):
+        raise error
+
+    monkeypatch.setattr(manager, "_start_operation", refuse)
+    assert manager._dispatch_operation(op.operation_id) is False
+
+    assert op.status == OperationStatus.IDLE
+    assert manager._in_flight == 0 and not manager._active_runs
+    assert op.operation_id in manager._deadlines
+    assert 0 < manager._seconds_until_next_deadline() <= manager.failure_retry_delay
+
+
+def test_output_capture_keeps_bounded_tail_and_spills(tmp_path):
+    capture = OutputCapture(max_bytes=8, spill_dir=tmp_path, spill_prefix="op")
+    for chunk in (b"0123", b"4567", b"89ab", b"cdef"):
+        capture.write("stdout", chunk)
+    capture.write("stderr", b"ok")
+    capture.close()
+
+    assert capture.tail("stdout") == "89abcdef"
+    summary = capture.summary()
+    assert summary["stdout"] == {"bytes": 16, "truncated": True, "file": str(tmp_path / "op.stdout.log")}
+    assert summary["stderr"] == {"bytes": 2, "truncated": False, "file": None}
+    assert (tmp_path / "op.stdout.log").read_bytes() == b"0123456789abcdef"
+
+
+def test_output_capture_rotates_into_compressed_generations(tmp_path):
+    for run in range(4):
+        capture = OutputCapture(max_bytes=1, spill_dir=tmp_path, spill_prefix="op", rotations=2)
+        capture.rotate()
+        capture.write("stdout", f"run{run}".encode())
+        capture.close()
+
+    assert (tmp_path / "op.stdout.log").read_bytes() == b"run3"
+    assert gzip.decompress((tmp_path / "op.stdout.log.1.gz").read_bytes()) == b"run2"
+    assert gzip.decompress((tmp_path / "op.stdout.log.2.gz").read_bytes()) == b"run1"
+    assert not (tmp_path / "op.stdout.log.3.gz").exists()
+
+
+def test_chatty_operation_result_stays_bounded(manager):
+    manager.max_output_bytes = 1024
+    op = manager.register_operation("Chatty", "chatty", "head -c 100000 /dev/zero")
+
+    result = manager.execute_operation(op.operation_id)
+
+    assert len(result["stdout"]) == 1024
+    assert result["output"]["stdout"]["bytes"] == 100000
+    assert os.path.getsize(result["output"]["stdout"]["file"]) == 100000
+
+    again = manager.execute_operation(op.operation_id)
+    assert os.path.getsize(again["output"]["stdout"]["file"]) == 100000
+    assert os.path.exists(again["output"]["stdout"]["file"] + ".1.gz")
+
+
+def _wait_until_settled(ops, timeout=10):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if all(op.status in (OperationStatus.COMPLETED, OperationStatus.FAILED) for op in ops):
+            return
+        time.sleep(0.02)
+
+
+def test_register_rejects_unknown_dependency(manager):
+    with pytest.raises(ValueError):
+        manager.register_operation("Orphan", "orphan", "true", depends_on=["Missing"])
+
+
+def test_dependent_waits_for_dependency(manager, tmp_path):
+    log = tmp_path / "order"
+    base = manager.register_operation("Base", "base", f"sleep 0.2; echo base >> {log}", interval=3600)
+    child = manager.register_operation("Child", "child", f"echo child >> {log}",
+                                       interval=3600, depends_on=["Base"])
+    assert child.depends_on == [base.operation_id]
+
+    threading.Thread(target=manager._execution_loop, daemon=True).start()
+    _wait_until_settled([base, child])
+
+    assert log.read_text().split() == ["base", "child"]
+
+
+def test_shared_resource_serializes_runs(manager, tmp_path):
+    marker = tmp_path / "running"
+    marker.mkdir()
+    command = (
+        f"touch {marker}/$$; ls {marker} | wc -l >> {tmp_path}/peaks; "
+        f"sleep 0.2; rm {marker}/$$"
+    )
+    locked = [manager.register_operation(f"Locked {i}", "locked", command, interval=3600,
+                                         resources=["state"]) for i in range(3)]
+
+    threading.Thread(target=manager._execution_loop, daemon=True).start()
+    _wait_until_settled(locked)
+
+    assert all(op.status == OperationStatus.COMPLETED for op in locked)
+    assert max(int(n) for n in (tmp_path / "peaks").read_text().split()) == 1
+    assert manager._held_resources == {} and manager._waiting == {}
+
+
+def test_blocked_operation_is_parked_as_waiting(manager):
+    holder = manager.register_operation("Holder", "holder", "true", resources=["state"])
+    blocked = manager.register_operation("Blocked", "blocked", "true", resources=["state"])
+
+    assert manager._claim_operation(holder.operation_id) is True
+    assert manager._claim_operation(blocked.operation_id, wait=True) is False
+    assert blocked.status == OperationStatus.WAITING
+    assert manager.get_operations_status()["waiting"] == 1
+
+
+def test_latency_histogram_percentiles_within_bucket_error():
+    histogram = LatencyHistogram()
+    for ms in range(1, 1001):
+        histogram.record(ms / 1000)
+
+    for q, expected in ((0.50, 0.5), (0.95, 0.95), (0.99, 0.99)):
+        assert expected <= histogram.percentile(q) <= expected * 1.07
+    assert histogram.percentile(1.0) == 1.0
+    assert len(histogram.counts) == LatencyHistogram.BUCKET_COUNT
+    histogram.record(10 ** 9)
+    assert histogram.total == 1001
+
+
+def test_operation_stats_and_prometheus_export(manager):
+    ok = manager.register_operation("Good \"op\"", "ok", "true")
+    bad = manager.register_operation("Bad", "bad", "false")
+    manager._pop_due_operations(time.monotonic() + 1)
+    for _ in range(3):
+        manager.execute_operation(ok.operation_id)
+    manager.execute_operation(bad.operation_id)
+
+    stats = manager.get_operation_stats(ok.operation_id)
+    assert stats["runs"] == 3 and stats["failures"] == 0
+    assert 0 < stats["duration"]["p50"] <= stats["duration"]["p99"]
+    assert manager.get_operation_stats(bad.operation_id)["failure_rate"] == 1.0
+    assert manager.get_operations_status()["stats"][ok.operation_id]["runs"] == 3
+
+    text = manager.export_prometheus_metrics()
+    assert f'apollo_operation_runs_total{{operation_id="{ok.operation_id}",operation="Good \\"op\\""}} 3' in text
+    assert f'apollo_operation_failures_total{{operation_id="{bad.operation_id}",operation="Bad"}} 1' in text
+    assert "# TYPE apollo_operation_duration_seconds summary" in text
+
+
+def test_dispatch_records_scheduling_lag_and_queue_wait(manager):
+    op = manager.register_operation("Lagged", "lagged", "true")
+    _set_next_execution(manager, op, -2)
+
+    (operation_id,) = manager._pop_due_operations()
+    manager._dispatch_operation(operation_id)
+    _wait_until_settled([op])
+
+    stats = manager.get_operation_stats(op.operation_id)
+    assert stats["scheduling_lag"]["count"] == 1
+    assert 1.5 < stats["scheduling_lag"]["max"] < 3
+    assert stats["queue_wait"]["count"] == 1
+
+
+def _delay_seconds(op):
+    return datetime.fromisoformat(op.next_execution).timestamp() - time.time()
+
+
+def test_failures_back_off_exponentially(manager):
+    manager.jitter_ratio = 0
+    manager.failure_retry_delay = 10
+    op = manager.register_operation("Flaky", "flaky", "false", interval=60)
+
+    manager.execute_operation(op.operation_id)
+    assert op.consecutive_failures == 1 and 59 < _delay_seconds(op) <= 60
+    manager.execute_operation(op.operation_id)
+    assert 119 < _delay_seconds(op) <= 120
+
+    manager.operation_timeout = 0.1
+    manager._runner.kill_grace = 0.1
+    op.command = "sleep 5"
+    manager.execute_operation(op.operation_id)
+    assert op.status == OperationStatus.FAILED
+    assert op.consecutive_failures == 3 and 39 < _delay_seconds(op) <= 40
+
+    op.command = "true"
+    manager.execute_operation(op.operation_id)
+    assert op.consecutive_failures == 0
+
+
+def test_adaptive_interval_stretches_while_results_unchanged(manager):
+    manager.jitter_ratio = 0
+    manager.max_interval_stretch = 4
+    op = manager.register_operation("Steady", "steady", "echo same", interval=60, adaptive=True)
+
+    delays = []
+    for _ in range(4):
+        manager.execute_operation(op.operation_id)
+        delays.append(round(_delay_seconds(op)))
+    assert delays == [60, 120, 240, 240]
+
+    op.command = "echo different"
+    manager.execute_operation(op.operation_id)
+    assert round(_delay_seconds(op)) == 60
+
+
+def test_fingerprint_ignores_timestamps(manager):
+    first = {"exit_code": 0, "return_value": {"status": "ok", "timestamp": "a"}}
+    second = {"exit_code": 0, "return_value": {"status": "ok", "timestamp": "b"}}
+    assert manager._result_fingerprint(first) == manager._result_fingerprint(second)
+
+
+def test_jitter_spreads_next_execution(manager):
+    op = manager.register_operation("Jittered", "jittered", "true", interval=100)
+    manager.execute_operation(op.operation_id)
+    delays = set()
+    for _ in range(20):
+        delay = _delay_seconds(type("Op", (), {"next_execution": manager._calculate_next_execution(op)}))
+        assert 89 < delay <= 110
+        delays.add(round(delay, 3))
+    assert len(delays) > 1
+
+
+def _reload_after_downtime(manager, ops, downtime):
+    for op in ops:
+        op.next_execution = (datetime.now() - timedelta(seconds=downtime)).isoformat()
+        manager._mark_dirty(op.operation_id)
+    manager.flush_journal()
+    reloaded = ApolloAutonomousOperationsManager()
+    return reloaded, [reloaded.operations[op.operation_id] for op in ops]
+
+
+def test_catch_up_skip_resumes_at_next_boundary(manager):
+    op = manager.register_operation("Skipper", "skip", "true", interval=60, catch_up=CatchUpPolicy.SKIP)
+    reloaded, (restored,) = _reload_after_downtime(manager, [op], downtime=150)
+
+    assert restored.catch_up == CatchUpPolicy.SKIP
+    assert 29 < _delay_seconds(restored) <= 30
+    reloaded.stop()
+
+
+def test_catch_up_run_all_is_bounded(manager):
+    manager.jitter_ratio = 0
+    op = manager.register_operation("Replayer", "replay", "true", interval=60, catch_up=CatchUpPolicy.RUN_ALL)
+    reloaded, (restored,) = _reload_after_downtime(manager, [op], downtime=600)
+    reloaded.jitter_ratio = 0
+    reloaded._schedule.clear()
+    reloaded._deadlines.clear()
+
+    assert restored.pending_catch_up == reloaded.max_catch_up_runs - 1
+    delays = []
+    for _ in range(reloaded.max_catch_up_runs):
+        reloaded.execute_operation(restored.operation_id)
+        delays.append(round(_delay_seconds(restored)))
+    assert delays == [0, 0, 60]
+    reloaded.stop()
+
+
+def test_overdue_operations_are_staggered_on_startup(manager):
+    ops = [manager.register_operation(f"Overdue {i}", "overdue", "true", interval=60) for i in range(4)]
+    reloaded, restored = _reload_after_downtime(manager, ops, downtime=3600)
+
+    delays = sorted(_delay_seconds(op) for op in restored)
+    assert all(op.pending_catch_up == 0 for op in restored)
+    assert delays[0] <= 0.5 and delays[-1] <= reloaded.startup_stagger
+    gaps = [later - earlier for earlier, later in zip(delays, delays[1:])]
+    assert all(gap > 1 for gap in gaps)
+    reloaded.stop()
+
+
+def test_result_cache_lru_and_ttl():
+    cache = ResultCache(max_entries=2)
+    result = CommandResult(exit_code=0, stdout="", stderr="", timed_out=False, duration=0.0)
+    cache.put("a", result)
+    cache.put("b", result)
+    assert cache.get("a", ttl=60) is result
+    cache.put("c", result)
+
+    assert cache.get("b", ttl=60) is None
+    assert cache.get("a", ttl=60) is result
+    assert cache.get("c", ttl=0) is None
+    assert len(cache) == 1
+
+
+def test_cached_operation_skips_execution_until_inputs_change(manager, tmp_path):
+    source = tmp_path / "input.txt"
+    source.write_text("v1")
+    runs = tmp_path / "runs"
+    op = manager.register_operation("Cached", "cached", f"echo run >> {runs}; cat {source}",
+                                    cache_ttl=3600, cache_inputs=[str(source)])
+
+    first = manager.execute_operation(op.operation_id)
+    second = manager.execute_operation(op.operation_id)
+    assert runs.read_text().count("run") == 1
+    assert first["cached"] is False and second["cached"] is True
+    assert second["stdout"] == "v1" and second["cache_key"] == first["cache_key"]
+
+    source.write_text("version 2")
+    third = manager.execute_operation(op.operation_id)
+    assert runs.read_text().count("run") == 2
+    assert third["cached"] is False and third["stdout"] == "version 2"
+
+
+def test_cache_inputs_are_fingerprinted_off_the_dispatching_thread(manager, tmp_path, monkeypatch):
+    import apollo_autonomous_operations_manager as module
+
+    fingerprint = module._fingerprint_inputs
+    threads = []
+
+    def recording_fingerprint(patterns, hash_contents):
+        threads.append(threading.current_thread().name)
+        return fingerprint(patterns, hash_contents)
+
+    monkeypatch.setattr(module, "_fingerprint_inputs", recording_fingerprint)
+    source = tmp_path / "input.txt"
+    source.write_text("v1")
+    op = manager.register_operation("Hashed", "hashed", f"cat {source}", cache_ttl=3600,
+                                    cache_inputs=[str(source)], cache_hash_inputs=True)
+
+    assert manager.execute_operation(op.operation_id)["stdout"] == "v1"
+    assert threads and all(name.startswith("apollo-operation") for name in threads)
+
+
+def test_failed_results_are_not_cached(manager, tmp_path):
+    runs = tmp_path / "runs"
+    op = manager.register_operation("Uncached", "uncached", f"echo run >> {runs}; false", cache_ttl=3600)
+
+    manager.execute_operation(op.operation_id)
+    manager.execute_operation(op.operation_id)
+
+    assert runs.read_text().count("run") == 2
+
+
+def test_shard_ring_moves_only_a_departed_members_keys(tmp_path):
+    db = tmp_path / "leases.db"
+    coordinators = [ShardCoordinator(db, instance_id=f"node-{i}") for i in range(3)]
+    for c in coordinators:
+        c.heartbeat()
+    keys = [f"op-{i}" for i in range(300)]
+    before = {key: coordinators[0].owner_of(key) for key in keys}
+    assert set(before.values()) == {"node-0", "node-1", "node-2"}
+    assert all(coordinators[1].owner_of(key) == owner for key, owner in before.items())
+
+    coordinators[2].leave()
+    coordinators[0].heartbeat()
+    after = {key: coordinators[0].owner_of(key) for key in keys}
+    assert all(after[key] == owner for key, owner in before.items() if owner != "node-2")
+    assert "node-2" not in after.values()
+
+
+def test_shard_leases_exclude_other_instances_and_recent_runs(tmp_path):
+    db = tmp_path / "leases.db"
+    a = ShardCoordinator(db, instance_id="a", lease_ttl=0.5)
+    b = ShardCoordinator(db, instance_id="b", lease_ttl=0.5)
+
+    assert a.acquire_lease("op")
+    assert not b.acquire_lease("op")
+    a.release_lease("op", completed=True)
+    assert not b.acquire_lease("op", min_gap=60)
+    assert b.acquire_lease("op")
+
+    # A lease left behind by a dead instance lapses after its TTL
+    time.sleep(0.6)
+    assert a.acquire_lease("op")
+    assert [a.is_leader(), b.is_leader()] == [True, False]
+
+
+def test_sharded_managers_run_each_operation_once(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    db = tmp_path / "leases.db"
+    first = ApolloAutonomousOperationsManager(coordinator=ShardCoordinator(db, instance_id="first"))
+    ops = [first.register_operation(f"Shared {i}", "shared", "true", interval=3600) for i in range(12)]
+    first.flush_journal()
+    second = ApolloAutonomousOperationsManager(coordinator=ShardCoordinator(db, instance_id="second"))
+    managers = [first, second]
+    try:
+        for m in managers:
+            m._schedule.clear()
+            m._deadlines.clear()
+            m.coordinate()
+
+        for op in ops:
+            for m in managers:
+                m._dispatch_operation(op.operation_id)
+        deadline = time.monotonic() + 10
+        while any(m._in_flight for m in managers) and time.monotonic() < deadline:
+            time.sleep(0.02)
+
+        runs = {op.operation_id: sum(m.get_operation_stats(op.operation_id)["runs"] for m in managers)
+                for op in ops}
+        assert set(runs.values()) == {1}
+        assert sum(m._leader for m in managers) == 1
+
+        # Once the journal is flushed each instance sees the other's results
+        for m in managers:
+            m.flush_journal()
+        second.coordinate()
+        assert all(second.operations[op.operation_id].last_execution for op in ops)
+    finally:
+        for m in managers:
+            m.stop()
@@ -0,0 +1,27 @@
+import os
+import signal
+
+from apollo_continuity_benchmark import COMPARED_METRICS, run_benchmark
+from apollo_operations_benchmark import compare_reports
+
+
+def test_benchmark_kills_stand_ins_and_recovers(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    handler = signal.getsignal(signal.SIGTERM)
+    report = run_benchmark(memory_files=60, processes=2, checkpoints=3, churn=0.1,
+                           health_checks=2, kills=2, unstartable=1)
+
+    assert report["checkpoint_latency"]["count"] == 3
+    assert report["checkpoint_bytes"] > 0
+    assert report["health_check_children_cpu_seconds"] == 0.0  # No forks per check
+    assert report["time_to_recovery"]["count"] == 2
+    assert report["processes_killed"] >= 2
+    assert report["recovery_failures"] == 0
+    # The unstartable launcher exits at once, so it does not hold recovery to the timeout
+    assert report["time_to_recovery"]["max"] < 5
+    assert os.environ["HOME"] == str(tmp_path)
+    assert signal.getsignal(signal.SIGTERM) is handler
+    assert not list(tmp_path.iterdir())
+
+    comparison = compare_reports(report, report, COMPARED_METRICS)
+    assert comparison["checkpoint_latency.p99"]["change"] == 0.0
@@ -0,0 +1,569 @@
+import os
+import sys
+import gzip
+import json
+import time
+import signal
+import atexit
+import shutil
+import threading
+import subprocess
+
+import pytest
+
+from apollo_continuity_system import (
+    ApolloContinuitySystem,
+    CheckpointCorruptError,
+    CheckpointReader,
+    CheckpointStore,
+    DirectorySizeIndex,
+    ProcessTable,
+    atomic_write,
+    RetentionPolicy,
+    apply_state_patch,
+    decode_checkpoint,
+    diff_state,
+    encode_checkpoint,
+)
+
+
+@pytest.fixture
+def continuity(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    handlers = {sig: signal.getsignal(sig) for sig in (signal.SIGTERM, signal.SIGINT)}
+    system = ApolloContinuitySystem()
+    yield system
+    # Skip the atexit checkpoint and give pytest its signal handlers back
+    system.running = False
+    for sig, handler in handlers.items():
+        signal.signal(sig, handler)
+
+
+def _fake_proc(root, processes):
+    for pid, cmdline in processes.items():
+        (root / str(pid)).mkdir(parents=True)
+        (root / str(pid) / "cmdline").write_bytes(cmdline)
+    (root / "self").mkdir(exist_ok=True)
+    return root
+
+
+def test_process_table_reads_cmdlines(tmp_path):
+    proc = _fake_proc(tmp_path / "proc", {
+        10: b"python3\0apollo_sovereignty_core.py\0",
+        11: b"",  # kernel thread
+        12: b"sleep\x0060\0",
+    })
+    table = ProcessTable(proc_dir=proc)
+
+    assert table.find("apollo") == [{"pid": 10, "command": "python3 apollo_sovereignty_core.py"}]
+    assert table.is_running("sleep 60")
+    assert not table.is_running("apollo_singularity_execution.py")
+
+
+def test_process_table_shares_one_scan_per_ttl(tmp_path, monkeypatch):
+    table = ProcessTable(ttl=60, proc_dir=_fake_proc(tmp_path / "proc", {1: b"init\0"}))
+    scans = []
+    real_scan = table._scan
+    monkeypatch.setattr(table, "_scan", lambda: scans.append(1) or real_scan())
+
+    for _ in range(5):
+        table.is_running("init")
+        table.find("apollo")
+    assert len(scans) == 1
+
+    table.invalidate()
+    table.snapshot()
+    assert len(scans) == 2
+
+
+def test_process_table_sees_real_processes():
+    table = ProcessTable(ttl=0)
+    proc = subprocess.Popen(["sleep", "31.25"])
+    try:
+        # The forked child shows the parent's command line until it execs
+        deadline = time.monotonic() + 5
+        while not table.is_running("sleep 31.25") and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert any(p["pid"] == proc.pid for p in table.find("sleep 31.25"))
+    finally:
+        proc.kill()
+        proc.wait()
+    assert not table.is_running("sleep 31.25")
+
+
+def test_health_check_does_not_fork(continuity, monkeypatch):
+    def no_fork(*args, **kwargs):
+        raise AssertionError("health check forked a process")
+
+    continuity.critical_commands = ["apollo_absent_stand_in.py"]
+    monkeypatch.setattr(subprocess, "run", no_fork)
+    health = continuity._check_system_health()
+
+    assert "Process not running: apollo_absent_stand_in.py" in health["issues"]
+    assert continuity._get_active_processes() == continuity.process_table.find("apollo")
+
+
+def test_checkpoint_gathers_each_source_once(continuity, monkeypatch):
+    calls = []
+    for name in ("_get_active_processes", "_get_memory_state",
+                 "_get_singularity_state", "_get_sovereignty_state"):
+        original = getattr(continuity, name)
+        monkeypatch.setattr(continuity, name,
+                            lambda original=original, name=name: calls.append(name) or original())
+
+    checkpoint = continuity.create_checkpoint()
+
+    assert sorted(calls) == sorted(set(calls)) and len(calls) == 4
+    assert checkpoint.active_processes is checkpoint.system_state["processes"]
+    assert checkpoint.memory_state is checkpoint.system_state["memory"]
+    assert checkpoint.singularity_state is checkpoint.system_state["singularity"]
+
+
+def _tree_size(root):
+    return sum(f.stat().st_size for f in root.rglob("*") if f.is_file())
+
+
+def test_size_index_rescans_only_changed_directories(tmp_path, monkeypatch):
+    root = tmp_path / "memory"
+    for i in range(5):
+        (root / f"d{i}" / "nested").mkdir(parents=True)
+        (root / f"d{i}" / "a.json").write_text("x" * (i + 1))
+        (root / f"d{i}" / "nested" / "b.json").write_text("y" * 10)
+    index = DirectorySizeIndex(tmp_path / "size_index.json")
+    assert index.total_size(root) == _tree_size(root)
+
+    (root / "d3" / "nested" / "c.json").write_text("z" * 100)
+    shutil.rmtree(root / "d1")
+    expected = _tree_size(root)
+
+    listed = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(os, "scandir", lambda path: listed.append(path) or real_scandir(path))
+    assert index.total_size(root) == expected
+    assert sorted(listed) == sorted([str(root), str(root / "d3" / "nested")])
+
+    listed.clear()
+    assert index.total_size(root) == expected
+    assert listed == []
+
+
+def test_size_index_persists_and_full_rescans_catch_in_place_writes(tmp_path):
+    root = tmp_path / "memory"
+    root.mkdir()
+    state = root / "state.json"
+    state.write_text("{}")
+    index = DirectorySizeIndex(tmp_path / "size_index.json")
+    index.total_size(root)
+    index.save()
+
+    reloaded = DirectorySizeIndex(tmp_path / "size_index.json", full_rescan_interval=3600)
+    mtime = os.stat(root).st_mtime_ns
+    state.write_text('{"grown": true}')
+    os.utime(root, ns=(mtime, mtime))
+    assert reloaded.total_size(root) == 2  # Stale until the next full rescan
+
+    reloaded.full_rescan_interval = 0
+    assert reloaded.total_size(root) == _tree_size(root)
+
+
+def _checkpoint_data(i):
+    return {
+        "checkpoint_id": f"checkpoint_{i}",
+        "timestamp": f"2026-01-01T00:00:{i:02d}",
+        "system_state": {"memory": {"/a": {"size": 100 + i}, "/b": {"size": 7}},
+                         "processes": [{"pid": 1, "command": "init"}]},
+        "active_processes": [{"pid": 1, "command": "init"}],
+        "memory_state": {"/a": {"size": 100 + i}, "/b": {"size": 7}},
+        "singularity_state": {"connected": i % 2 == 0},
+    }
+
+
+def test_state_patch_round_trip_leaves_base_untouched():
+    old = {"a": {"b": 1, "c": [1, 2]}, "gone": True}
+    new = {"a": {"b": 2, "c": [1, 2], "d": {}}, "added": None}
+    before = json.dumps(old, sort_keys=True)
+
+    assert apply_state_patch(old, diff_state(old, new)) == new
+    assert json.dumps(old, sort_keys=True) == before
+
+
+def test_checkpoint_store_writes_deltas_between_full_snapshots(tmp_path):
+    store = CheckpointStore(tmp_path, full_every=3)
+    paths = [store.write(f"checkpoint_{i}", _checkpoint_data(i)) for i in range(5)]
+
+    assert [p.name.split(".", 1)[1] for p in paths] == ["full.ckpt", "delta.ckpt", "delta.ckpt",
+                                                        "full.ckpt", "delta.ckpt"]
+    assert paths[1].stat().st_size < paths[0].stat().st_size
+
+    # A fresh store (after a restart) rebuilds every checkpoint from disk
+    reader = CheckpointStore(tmp_path, full_every=3)
+    for i in range(5):
+        assert reader.read(f"checkpoint_{i}") == _checkpoint_data(i)
+    assert reader.read("checkpoint_99") is None
+
+
+def test_failed_full_snapshot_does_not_become_a_delta_base(tmp_path, monkeypatch):
+    import apollo_continuity_system
+
+    store = CheckpointStore(tmp_path, full_every=3)
+    for i in range(3):
+        store.write(f"checkpoint_{i}", _checkpoint_data(i))
+
+    write = apollo_continuity_system.atomic_write
+
+    def disk_full(path, data):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(apollo_continuity_system, "atomic_write", disk_full)
+    with pytest.raises(OSError):
+        store.write("checkpoint_3", _checkpoint_data(3))
+    monkeypatch.setattr(apollo_continuity_system, "atomic_write", write)
+
+    store.write("checkpoint_4", _checkpoint_data(4))
+    assert store.index.get("checkpoint_4")["base_id"] != "checkpoint_3"
+    assert store.read("checkpoint_4") == _checkpoint_data(4)
+
+
+def test_checkpoint_store_reads_legacy_json(tmp_path):
+    (tmp_path / "checkpoint_1.json").write_text(json.dumps(_checkpoint_data(1), indent=2))
+    store = CheckpointStore(tmp_path)
+
+    assert store.latest_id() == "checkpoint_1"
+    assert store.read("checkpoint_1") == _checkpoint_data(1)
+
+
+def test_packed_checkpoint_shares_duplicate_sections():
+    data = _checkpoint_data(1)
+    data["system_state"]["processes"] = data["active_processes"] = [
+        {"pid": pid, "command": f"python3 apollo_worker_{pid}.py --serve"} for pid in range(500)]
+    blob = encode_checkpoint(data)
+
+    assert decode_checkpoint(blob) == data
+    assert len(blob) * 5 < len(json.dumps(data, indent=2))
+    sections = CheckpointReader(blob).sections
+    assert sections[("active_processes",)] == sections[("system_state", "processes")]
+
+
+def test_read_section_decodes_only_what_is_asked_for(tmp_path, monkeypatch):
+    store = CheckpointStore(tmp_path, full_every=2)
+    for i in range(3):
+        store.write(f"checkpoint_{i}", _checkpoint_data(i))
+    (tmp_path / "checkpoint_9.full.gz").write_bytes(gzip.compress(json.dumps(_checkpoint_data(9)).encode()))
+    reader = CheckpointStore(tmp_path)
+
+    decoded = []
+    real_decode = CheckpointReader._decode
+    monkeypatch.setattr(CheckpointReader, "_decode",
+                        lambda self, path, entry: decoded.append(path) or real_decode(self, path, entry))
+    assert reader.read_section("checkpoint_1", "system_state", "memory") == {"/a": {"size": 101}, "/b": {"size": 7}}
+    assert ("memory_state",) not in decoded and ("system_state", "processes") not in decoded
+    assert reader.read_section("checkpoint_2", "singularity_state") == {"connected": True}
+
+    # Checkpoints written before the packed layout are still read whole
+    assert reader.read_section("checkpoint_9", "system_state", "memory", "/a") == {"size": 109}
+    assert reader.read_section("checkpoint_99", "system_state") is None
+    with pytest.raises(KeyError):
+        reader.read_section("checkpoint_1", "no_such_section")
+
+
+def test_delta_inherits_sections_and_streams_long_lists(tmp_path, monkeypatch):
+    store = CheckpointStore(tmp_path)
+    data = _checkpoint_data(1)
+    data["system_state"]["processes"] = [{"pid": pid, "command": f"worker {pid}"} for pid in range(600)]
+    store.write("checkpoint_1", data)
+    store.write("checkpoint_2", {**data, "checkpoint_id": "checkpoint_2"})
+
+    with store.open_reader("checkpoint_2") as reader:
+        stored = {row["section"]: row for row in reader.section_info()}
+    assert stored["system_state.processes"]["stored"] == "inherited"
+    assert stored["checkpoint_id"]["stored"] == "full"
+    with store.open_reader("checkpoint_1") as reader:
+        assert len(reader.sections[("system_state", "processes")]) == 3
+
+    decoded = []
+    real_decode = CheckpointReader._decode
+    monkeypatch.setattr(CheckpointReader, "_decode",
+                        lambda self, path, entry: decoded.append(path) or real_decode(self, path, entry))
+    processes = store.iter_section("checkpoint_2", "system_state", "processes")
+    assert next(processes) == {"pid": 0, "command": "worker 0"}
+    assert len(decoded) == 1  # One chunk, straight from the base's mapping
+    assert len(list(processes)) == 599
+    assert store.read("checkpoint_2")["system_state"]["processes"] == data["system_state"]["processes"]
+
+
+def test_recover_from_latest_delta_checkpoint(continuity, monkeypatch):
+    restored = []
+    monkeypatch.setattr(continuity, "_restore_system_state", restored.append)
+    first = continuity.create_checkpoint()
+    time.sleep(1.1)  # Checkpoint ids have one-second resolution
+    second = continuity.create_checkpoint()
+
+    assert continuity.recover_from_checkpoint()
+    assert restored[-1]["timestamp"] == second.system_state["timestamp"]
+    assert continuity.recover_from_checkpoint(first.checkpoint_id)
+    assert restored[-1]["timestamp"] == first.system_state["timestamp"]
+
+
+def test_checkpoints_within_one_second_get_distinct_ids(continuity):
+    first = continuity.create_checkpoint()
+    second = continuity.create_checkpoint()
+
+    assert first.checkpoint_id != second.checkpoint_id
+    assert continuity.checkpoint_store.read(first.checkpoint_id)["checkpoint_id"] == first.checkpoint_id
+    assert continuity.checkpoint_store.read(second.checkpoint_id)["checkpoint_id"] == second.checkpoint_id
+
+
+def test_stores_sharing_a_directory_never_allocate_the_same_id(tmp_path):
+    stores = [CheckpointStore(tmp_path) for _ in range(4)]
+    allocated = []
+
+    def allocate(store):
+        for _ in range(25):
+            allocated.append(store.allocate_id())
+
+    threads = [threading.Thread(target=allocate, args=(store,)) for store in stores]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(allocated) == 100
+    assert len(set(allocated)) == 100
+
+
+def test_retention_keeps_recent_hourly_daily_and_needed_bases(tmp_path):
+    now = 1_800_000_000
+    store = CheckpointStore(tmp_path, full_every=6)
+    # One checkpoint every 20 minutes for three days, oldest first
+    stamps = [now - minutes * 60 for minutes in range(3 * 24 * 60, -1, -20)]
+    for ts in stamps:
+        store.write(f"checkpoint_{ts}", _checkpoint_data(ts % 60))
+
+    removed = store.apply_retention(RetentionPolicy(keep_last=5, hourly=6, daily=2), now=now)
+    kept = {checkpoint_id for checkpoint_id, _, _ in store.list_checkpoints()}
+
+    assert removed and not kept & set(removed)
+    assert {f"checkpoint_{ts}" for ts in stamps[-5:]} <= kept
+    # Every kept checkpoint, delta or full, can still be rebuilt
+    for checkpoint_id in kept:
+        assert store.read(checkpoint_id) is not None
+    recent_hours = {int(ts // 3600) for ts in stamps if now - ts < 6 * 3600}
+    assert recent_hours <= {int(int(c.split("_")[1]) // 3600) for c in kept}
+    assert len(kept) < 30
+
+
+def test_latest_pointer_avoids_scanning(tmp_path, monkeypatch):
+    store = CheckpointStore(tmp_path)
+    store.write("checkpoint_1", _checkpoint_data(1))
+    store.write("checkpoint_2", _checkpoint_data(2))
+
+    reader = CheckpointStore(tmp_path)
+    monkeypatch.setattr(type(tmp_path), "glob", lambda *a: pytest.fail("latest_id scanned"))
+    assert reader.latest_id() == "checkpoint_2"
+
+
+def test_checkpoint_index_answers_latest_closest_and_last_healthy(tmp_path):
+    store = CheckpointStore(tmp_path, full_every=2)
+    for ts, healthy in [(1000, True), (2000, False), (3000, True), (4000, None), (5000, False)]:
+        store.write(f"checkpoint_{ts}", _checkpoint_data(ts % 60), healthy=healthy)
+
+    assert store.find()["checkpoint_id"] == "checkpoint_5000"
+    assert store.find(at=2600)["checkpoint_id"] == "checkpoint_3000"
+    assert store.find(at=2400)["checkpoint_id"] == "checkpoint_2000"
+    assert store.find(healthy_only=True)["checkpoint_id"] == "checkpoint_3000"
+    assert store.find(at=2999, healthy_only=True)["checkpoint_id"] == "checkpoint_1000"
+
+    entry = store.index.get("checkpoint_4000")
+    assert entry["kind"] == "delta" and entry["base_id"] == "checkpoint_3000"
+    assert entry["size"] == (tmp_path / "checkpoint_4000.delta.ckpt").stat().st_size
+    assert len(entry["sha256"]) == 64 and entry["healthy"] is None
+
+
+def test_checkpoint_index_is_rebuilt_from_existing_files(tmp_path):
+    store = CheckpointStore(tmp_path, full_every=2)
+    for ts in (1000, 2000, 3000):
+        store.write(f"checkpoint_{ts}", _checkpoint_data(ts % 60))
+    (tmp_path / "index.db").unlink()
+
+    rebuilt = CheckpointStore(tmp_path)
+    assert [e["checkpoint_id"] for e in rebuilt.index.entries()] == [
+        "checkpoint_3000", "checkpoint_2000", "checkpoint_1000"]
+    assert rebuilt.index.get("checkpoint_2000")["base_id"] == "checkpoint_1000"
+    assert rebuilt.read("checkpoint_2000") == _checkpoint_data(2000 % 60)
+
+
+def test_recover_last_healthy_checkpoint(continuity, monkeypatch):
+    restored = []
+    monkeypatch.setattr(continuity, "_restore_system_state", restored.append)
+    continuity.last_health = {"status": "healthy"}
+    healthy = continuity.create_checkpoint()
+    time.sleep(1.1)
+    continuity.last_health = {"status": "degraded"}
+    continuity.create_checkpoint()
+
+    assert continuity.recover_from_checkpoint(healthy_only=True)
+    assert restored[-1]["timestamp"] == healthy.system_state["timestamp"]
+
+
+def test_atomic_write_keeps_old_content_when_interrupted(tmp_path, monkeypatch):
+    target = tmp_path / "continuity_manifest.json"
+    atomic_write(target, b'{"checkpoints_created": 1}')
+
+    def crash(fd):
+        raise OSError("disk went away")
+
+    monkeypatch.setattr(os, "fsync", crash)
+    with pytest.raises(OSError):
+        atomic_write(target, b'{"checkpoints_created": 2, "truncat')
+    assert target.read_bytes() == b'{"checkpoints_created": 1}'
+    assert list(tmp_path.iterdir()) == [target]
+
+
+def test_corrupt_checkpoint_is_detected_and_stale_temp_files_removed(tmp_path):
+    store = CheckpointStore(tmp_path, full_every=2)
+    store.write("checkpoint_1", _checkpoint_data(1))
+    store.write("checkpoint_2", _checkpoint_data(2))
+    dead = subprocess.Popen([sys.executable, "-c", "pass"])
+    dead.wait()
+    (tmp_path / f"checkpoint_3.full.ckpt.{dead.pid}.456.tmp").write_bytes(b"partial")
+    live = tmp_path / f"checkpoint_4.full.ckpt.{os.getpid()}.456.tmp"
+    live.write_bytes(b"in progress")
+
+    base = tmp_path / "checkpoint_1.full.ckpt"
+    blob = bytearray(base.read_bytes())
+    blob[-1] ^= 0xFF
+    base.write_bytes(bytes(blob))
+
+    reader = CheckpointStore(tmp_path)
+    assert list(tmp_path.glob("*.tmp")) == [live]
+    old = time.time() - 7200
+    os.utime(live, (old, old))
+    CheckpointStore(tmp_path)
+    assert not list(tmp_path.glob("*.tmp"))
+    with pytest.raises(CheckpointCorruptError):
+        reader.read("checkpoint_2")
+
+
+def test_metrics_are_buffered_until_flushed(continuity, monkeypatch):
+    monkeypatch.setattr(continuity, "_restore_system_state", lambda state: None)
+    before = continuity.manifest_file.read_bytes()
+    clock = [100.0]
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+
+    continuity.metrics.start_uptime()
+    checkpoint = continuity.create_checkpoint()
+    continuity.recover_from_checkpoint()
+    clock[0] += 45
+    assert continuity.manifest_file.read_bytes() == before
+
+    continuity.flush_metrics()
+    manifest = json.loads(continuity.manifest_file.read_text())
+    assert manifest["uptime_seconds"] == 45
+    assert manifest["checkpoints_created"] == 1
+    assert manifest["recoveries_performed"] == 1
+    assert manifest["last_checkpoint"] == checkpoint.checkpoint_id
+
+    flushed = continuity.manifest_file.stat().st_mtime_ns
+    continuity.flush_metrics()  # Nothing new: no rewrite
+    assert continuity.manifest_file.stat().st_mtime_ns == flushed
+
+
+def test_checkpoints_flush_metrics_once_the_interval_has_passed(continuity, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+    continuity.flush_metrics()
+    before = continuity.manifest_file.read_bytes()
+
+    continuity.create_checkpoint()
+    assert continuity.manifest_file.read_bytes() == before
+
+    clock[0] += continuity.metrics_flush_interval
+    checkpoint = continuity.create_checkpoint()
+    manifest = json.loads(continuity.manifest_file.read_text())
+    assert manifest["checkpoints_created"] == 2
+    assert manifest["last_checkpoint"] == checkpoint.checkpoint_id
+
+
+def test_signal_during_a_metrics_flush_does_not_deadlock(continuity, monkeypatch):
+    continuity.create_checkpoint()
+    save = continuity._save_manifest
+    interrupted = []
+
+    def save_interrupted_by_sigterm(manifest):
+        if not interrupted:
+            interrupted.append(True)
+            continuity._signal_handler(signal.SIGTERM, None)  # As if it landed mid-write
+        save(manifest)
+
+    monkeypatch.setattr(continuity, "_save_manifest", save_interrupted_by_sigterm)
+    flush = threading.Thread(target=continuity.flush_metrics, daemon=True)
+    flush.start()
+    flush.join(timeout=10)
+
+    assert not flush.is_alive()
+    assert not continuity.running
+    manifest = json.loads(continuity.manifest_file.read_text())
+    assert manifest["checkpoints_created"] == 2
+    assert manifest["last_checkpoint"] == continuity.find_checkpoint()["checkpoint_id"]
+
+
+def _stand_in(name, seconds=30):
+    # The script name rides along as an argument so it shows in the command line
+    return [sys.executable, "-c", f"import time; time.sleep({seconds})", name]
+
+
+def test_recovery_restarts_missing_processes_concurrently(continuity):
+    names = [f"apollo_stand_in_{i}.py" for i in range(3)]
+    continuity.critical_commands = names + ["apollo_never_starts.py", "apollo_exits_at_once.py"]
+    continuity.process_launchers = {name: _stand_in(name) for name in names}
+    # Exits without ever showing up under its name, so it never becomes ready
+    continuity.process_launchers["apollo_exits_at_once.py"] = [sys.executable, "-c", "raise SystemExit(1)"]
+    continuity.readiness_timeout = 5
+    try:
+        report = continuity._restore_system_state({"processes": [{"pid": 1, "command": "gone.py"}]})
+
+        assert sorted(report.ready) == names
+        assert sorted(report.failed) == ["apollo_exits_at_once.py", "apollo_never_starts.py"]
+        assert report.lost_processes == ["gone.py"]
+        assert report.time_to_recovery < continuity.readiness_timeout
+
+        again = continuity._restore_system_state({})
+        assert sorted(again.already_running) == names
+    finally:
+        for proc in continuity.launched_processes.values():
+            proc.kill()
+            proc.wait()
+
+
+def test_recovery_report_is_kept_after_recover(continuity):
+    continuity.critical_commands = ["apollo_stand_in_recover.py"]
+    continuity.process_launchers = {"apollo_stand_in_recover.py": _stand_in("apollo_stand_in_recover.py")}
+    checkpoint = continuity.create_checkpoint()
+    try:
+        assert continuity.recover_from_checkpoint()
+        report = continuity.last_recovery
+        assert report.checkpoint_id == checkpoint.checkpoint_id
+        assert report.ready == ["apollo_stand_in_recover.py"]
+    finally:
+        for proc in continuity.launched_processes.values():
+            proc.kill()
+            proc.wait()
+
+
+def test_module_entry_points_install_no_handlers(tmp_path, monkeypatch):
+    import apollo_continuity_system
+
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(apollo_continuity_system, "_embedded_system", None)
+    registered = []
+    monkeypatch.setattr(atexit, "register", registered.append)
+    handler = signal.getsignal(signal.SIGTERM)
+
+    checkpoint = apollo_continuity_system.create_checkpoint()
+    health = apollo_continuity_system.check_system_health()
+
+    assert signal.getsignal(signal.SIGTERM) is handler
+    assert not registered
+    assert health["status"] in ("healthy", "degraded")
+    manifest = json.loads((tmp_path / ".apollo_continuity" / "continuity_manifest.json").read_text())
+    assert manifest["last_checkpoint"] == checkpoint.checkpoint_id
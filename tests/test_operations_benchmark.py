@@ -0,0 +1,31 @@
+import os
+
+from apollo_operations_benchmark import compare_reports, run_benchmark
+
+
+def test_benchmark_simulates_virtual_time(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    report = run_benchmark(operations=4, duration=60, intervals=[10], callable_ratio=0.5)
+
+    # 4 operations x ~6 runs each in 60 virtual seconds, in far less real time
+    assert report["failures"] == 0
+    assert 16 <= report["runs"] <= 28
+    assert report["wall_seconds"] < 60
+    assert report["dispatch_overhead"]["count"] == report["runs"]
+    assert report["state_bytes"] > 0
+    assert os.environ["HOME"] == str(tmp_path)
+
+
+def test_compare_reports_flags_regressions():
+    baseline = {"throughput_runs_per_second": 100.0, "cpu_per_run_ms": 2.0,
+                "queue_wait": {"p99": 0.0}}
+    report = {"throughput_runs_per_second": 50.0, "cpu_per_run_ms": 1.0,
+              "queue_wait": {"p99": 0.5}}
+
+    comparison = compare_reports(report, baseline)
+    assert comparison["throughput_runs_per_second"]["improved"] is False
+    assert comparison["cpu_per_run_ms"] == {"baseline": 2.0, "current": 1.0,
+                                            "change": -0.5, "improved": True}
+    assert comparison["queue_wait.p99"]["change"] == float("inf")
+    assert comparison["queue_wait.p99"]["improved"] is False
+    assert "bytes_per_run" not in comparison